@@ -8,6 +8,8 @@ Two modes of interaction:
 2. `python -m blogger.playground --agent <name>` - Direct agent testing
 """
 
+import os
+
 from google.adk.apps import App
 from blogger.coordinator import coordinator, root_agent
 
@@ -17,4 +19,12 @@ app = App(
     root_agent=root_agent,
 )
 
+# Optional live model of posts/ for long-running `adk web` sessions
+# (set BLOGGER_WATCH_POSTS=1 in blogger/.env, see utils/watcher.py)
+if os.environ.get("BLOGGER_WATCH_POSTS", "").lower() in ("1", "true", "yes"):
+    from blogger.utils.tools import POSTS_DIR
+    from blogger.utils.watcher import start_posts_watcher
+
+    start_posts_watcher(POSTS_DIR)
+
 __all__ = ["app", "coordinator", "root_agent"]
@@ -7,15 +7,17 @@ contextual insights before the Architect begins outlining.
 
 from google.adk.agents.llm_agent import Agent
 
+from blogger.utils.async_tools import (
+    save_analysis_tool,
+    read_draft_tool,
+    read_analysis_tool,
+)
 from blogger.utils.tools import (
     detect_draft_complexity,
     extract_quotes_with_sources,
     extract_main_topics,
-    save_analysis_tool,
-    read_draft_tool,
-    read_analysis_tool,
     split_draft_into_chunks,
-    map_chunk_connections
+    map_chunk_connections,
 )
 from blogger.utils.utils import read_instructions
 
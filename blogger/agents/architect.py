@@ -9,13 +9,18 @@ from google.adk.agents.llm_agent import Agent
 
 from blogger.agents.scribr import create_scribr
 from blogger.agents.analyzer import create_analyzer
-from blogger.utils.tools import (
+from blogger.utils.async_tools import (
+    get_blog_context_tool,
     get_workflow_status_tool,
     infer_blog_id_tool,
     read_draft_tool,
     read_file_tool,
     save_step_tool,
     read_analysis_tool,
+    list_versions_tool,
+    read_version_tool,
+    fetch_webpage_tool,
+    fetch_webpages_tool,
 )
 from blogger.utils.utils import read_instructions
 
@@ -25,12 +30,17 @@ architect = Agent(
     description="The Architect - Expert Editor & Structural Thinker",
     instruction=read_instructions("architect.md"),
     tools=[
+        get_blog_context_tool,
         get_workflow_status_tool,
         infer_blog_id_tool,
         read_draft_tool,
         read_file_tool,
         save_step_tool,
         read_analysis_tool,
+        list_versions_tool,
+        read_version_tool,
+        fetch_webpage_tool,
+        fetch_webpages_tool,
     ],
     sub_agents=[create_scribr(), create_analyzer()],
 )
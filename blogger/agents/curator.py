@@ -7,15 +7,17 @@ Unlike the old system, the agent does the LLM reasoning while tools handle I/O a
 
 from google.adk.agents import Agent
 
-from blogger.utils.tools import (
+from blogger.utils.async_tools import (
+    get_blog_context_tool,
     get_workflow_status_tool,
     infer_blog_id_tool,
     read_draft_tool,
     read_file_tool,
     save_step_tool,
+    read_analysis_tool,
+    validate_candidates_tool,
     validate_content_split_tool,
     validate_organization_tool,
-    read_analysis_tool,
 )
 from blogger.utils.utils import read_instructions
 
@@ -26,6 +28,7 @@ curator = Agent(
     description="Filter and organize draft content to match outline structure",
     instruction=read_instructions("curator.md"),
     tools=[
+        get_blog_context_tool,
         get_workflow_status_tool,
         infer_blog_id_tool,
         read_draft_tool,
@@ -33,6 +36,7 @@ curator = Agent(
         save_step_tool,
         validate_content_split_tool,
         validate_organization_tool,
+        validate_candidates_tool,
         read_analysis_tool,
     ],
 )
@@ -6,12 +6,17 @@ Iteratively polishes blog sections with user feedback and style enforcement.
 
 from google.adk.agents.llm_agent import Agent
 from blogger.agents.scribr import create_scribr
-from blogger.utils.tools import (
+from blogger.utils.async_tools import (
+    get_blog_context_tool,
     read_section_tool,
     save_section_tool,
     finalize_post_tool,
     infer_blog_id_tool,
-    get_workflow_status_tool
+    get_workflow_status_tool,
+    list_versions_tool,
+    read_version_tool,
+    fetch_webpage_tool,
+    fetch_webpages_tool,
 )
 from blogger.utils.utils import read_instructions
 
@@ -22,11 +27,16 @@ writer = Agent(
     description="The Writer Agent - Polishes blog sections iteratively.",
     instruction=read_instructions("writer.md"),
     tools=[
+        get_blog_context_tool,
         read_section_tool,
         save_section_tool,
         finalize_post_tool,
         infer_blog_id_tool,
-        get_workflow_status_tool
+        get_workflow_status_tool,
+        list_versions_tool,
+        read_version_tool,
+        fetch_webpage_tool,
+        fetch_webpages_tool,
     ],
     sub_agents=[create_scribr()]  # Scribr as sub-agent for style review
 )
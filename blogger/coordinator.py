@@ -14,7 +14,8 @@ from blogger.agents.architect import architect
 from blogger.agents.curator import curator
 from blogger.agents.writer import writer
 from blogger.agents.analyzer import analyzer_agent
-from blogger.utils.tools import (
+from blogger.utils.async_tools import (
+    get_blog_context_tool,
     get_workflow_status_tool,
     infer_blog_id_tool,
     read_draft_tool,
@@ -36,6 +37,7 @@ Current date: {datetime.datetime.now().strftime("%Y-%m-%d")}
     sub_agents=[analyzer_agent, architect, curator, writer],
     tools=[
         FunctionTool(get_workflow_status_tool),
+        FunctionTool(get_blog_context_tool),
         FunctionTool(infer_blog_id_tool),
         FunctionTool(read_draft_tool),
         FunctionTool(read_file_tool),
@@ -0,0 +1,93 @@
+import asyncio
+import inspect
+import threading
+import time
+
+import pytest
+from google.adk.tools.function_tool import FunctionTool
+
+from blogger.utils import async_tools, tools
+from blogger.utils.async_tools import make_async
+
+ASYNC_TOOLS = [
+    name for name, value in vars(async_tools).items()
+    if name.endswith("_tool") and inspect.iscoroutinefunction(value)
+]
+
+
+def test_wrappers_mirror_sync_tools():
+    assert "fetch_webpage_tool" in ASYNC_TOOLS
+    for name in ASYNC_TOOLS:
+        wrapper = getattr(async_tools, name)
+        sync = getattr(tools, name)
+        assert wrapper.__name__ == sync.__name__
+        assert wrapper.__doc__ == sync.__doc__
+        assert inspect.signature(wrapper) == inspect.signature(sync)
+
+
+def test_agents_register_async_tools():
+    from blogger.agents.architect import architect
+    from blogger.agents.curator import curator
+    from blogger.agents.writer import writer
+
+    for agent in (architect, curator, writer):
+        blocking = [tool.__name__ for tool in agent.tools if not inspect.iscoroutinefunction(tool)]
+        assert blocking == [], agent.name
+
+
+def test_reference_agents_can_fetch_pages():
+    from blogger.agents.architect import architect
+    from blogger.agents.writer import writer
+
+    for agent in (architect, writer):
+        assert async_tools.fetch_webpage_tool in agent.tools, agent.name
+        assert async_tools.fetch_webpages_tool in agent.tools, agent.name
+
+
+def test_declarations_match_sync_tools():
+    for name in ["read_draft_tool", "get_workflow_status_tool", "save_section_tool"]:
+        async_decl = FunctionTool(getattr(async_tools, name))._get_declaration()
+        sync_decl = FunctionTool(getattr(tools, name))._get_declaration()
+        assert async_decl == sync_decl
+
+
+def test_tool_runs_in_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    (tmp_path / "test-blog").mkdir()
+    (tmp_path / "test-blog" / "draft.md").write_text("# Draft\n")
+
+    result = asyncio.run(async_tools.read_draft_tool("test-blog", limit=1))
+    assert result["content"] == "# Draft\n"
+
+
+def test_blocking_calls_do_not_stall_the_loop():
+    threads = set()
+
+    def slow_tool(seconds: float) -> dict:
+        threads.add(threading.current_thread().name)
+        time.sleep(seconds)
+        return {"status": "success"}
+
+    async_slow = make_async(slow_tool)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tick_task = asyncio.create_task(ticker())
+        start = time.monotonic()
+        results = await asyncio.gather(*(async_slow(0.2) for _ in range(4)))
+        elapsed = time.monotonic() - start
+        tick_task.cancel()
+        return results, elapsed, ticks
+
+    results, elapsed, ticks = asyncio.run(main())
+    assert all(r["status"] == "success" for r in results)
+    assert elapsed < 0.6  # Ran concurrently, not back to back (0.8s)
+    assert ticks >= 5  # The loop kept running meanwhile
+    assert all(name.startswith("blogger-tool") for name in threads)
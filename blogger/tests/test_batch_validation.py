@@ -0,0 +1,94 @@
+import pytest
+
+from blogger.utils import batch_validation
+from blogger.utils.batch_validation import validate_candidates
+from blogger.utils.text_utils import check_content_integrity
+from blogger.utils.tools import save_step_tool, validate_candidates_tool
+
+ORIGINAL = "Alpha\n\nBeta\n\nGamma\n\nDelta"
+SPLITS = [
+    {"split_part1": "Alpha\n\nBeta", "split_part2": "Gamma"},  # Lost Delta
+    {"split_part1": "Alpha\n\nBeta", "split_part2": "Gamma\n\nDelta"},  # Valid
+    {"split_part1": "Alpha\n\nInvented", "split_part2": "Beta"},  # Lost 2, added 1
+    {"split_part1": "Alpha\n\nBeta\n\nDelta", "split_part2": "Gamma\n\nDelta"},  # Duplicate
+]
+
+
+@pytest.fixture(params=["inline", "pool"])
+def mode(request, monkeypatch):
+    if request.param == "pool":
+        monkeypatch.setattr(batch_validation, "BATCH_WORKERS", 2)
+        monkeypatch.setattr(batch_validation, "PROCESS_MIN_CHARS", 0)
+    return request.param
+
+
+def test_splits_are_ranked(mode):
+    candidates = [(c["split_part1"], c["split_part2"]) for c in SPLITS]
+
+    ranking = validate_candidates("split", [ORIGINAL], candidates)
+
+    assert [r["candidate"] for r in ranking] == [1, 0, 3, 2]
+    assert ranking[0]["valid"] is True and ranking[0]["message"] == ""
+    # Same verdicts as the single check
+    for result in ranking:
+        expected = check_content_integrity(ORIGINAL, *candidates[result["candidate"]])
+        assert (result["valid"], result["message"]) == expected
+    assert ranking[3]["lost"] == 2 and ranking[3]["added"] == 1
+    assert ranking[2]["duplicated"] == 1
+
+
+def test_organizations_are_ranked(mode):
+    outline = "# T\n\n## One\n\n## Two"
+    draft = "First\n\nSecond"
+    candidates = [
+        "# T\n\n## Two\n\nSecond\n\n## One\n\nFirst",  # Wrong heading order
+        "# T\n\n## One\n\nFirst\n\n## Two\n\nSecond",  # Valid
+        "# T\n\n## One\n\nFirst\n\n## Two",  # Lost a line
+    ]
+
+    ranking = validate_candidates("organization", [draft, outline], candidates)
+
+    assert [r["candidate"] for r in ranking] == [1, 0, 2]
+    assert ranking[1]["heading_order"] is False and "mismatch" in ranking[1]["message"]
+    assert ranking[2]["lost"] == 1
+
+
+def test_worker_path_avoids_the_caches(monkeypatch):
+    # Forked workers may inherit a cache lock held by another thread
+    def no_cache(*args, **kwargs):
+        raise AssertionError("worker code touched a shared cache")
+
+    references = ["First\n\nSecond", "# T\n\n## One\n\n## Two"]
+    split_reference = batch_validation._prepare("split", [ORIGINAL])
+    organization_reference = batch_validation._prepare("organization", references)
+    for module in ("markdown_model", "text_utils"):
+        monkeypatch.setattr(f"blogger.utils.{module}.cached_by_content", no_cache)
+    monkeypatch.setattr("blogger.utils.text_utils.normalized_lines", no_cache)
+
+    assert batch_validation._check(split_reference, ("Alpha\n\nBeta", "Gamma\n\nDelta"))["valid"]
+    result = batch_validation._check(organization_reference, "# T\n\n## Two\n\nSecond\n\n## One\n\nFirst")
+    assert result["heading_order"] is False
+
+
+def test_tool_returns_best_candidate_refs(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    (tmp_path / "my-post").mkdir()
+    (tmp_path / "my-post" / "draft.md").write_text(ORIGINAL)
+
+    result = validate_candidates_tool(SPLITS, blog_id="my-post")
+
+    assert result["status"] == "success"
+    assert result["best"] == 1 and result["valid_count"] == 1
+    saved = save_step_tool("my-post", "draft_ok", content_ref=result["content_refs"]["split_part1"])
+    assert saved["status"] == "success"
+    assert (tmp_path / "my-post" / "draft_ok.md").read_text() == SPLITS[1]["split_part1"]
+
+
+def test_tool_rejects_bad_batches():
+    assert validate_candidates_tool([], original_content=ORIGINAL)["status"] == "error"
+    assert validate_candidates_tool(SPLITS * 5, original_content=ORIGINAL)["status"] == "error"
+    assert validate_candidates_tool(SPLITS, kind="other", original_content=ORIGINAL)["status"] == "error"
+    result = validate_candidates_tool([{"split_part1": "Alpha"}], original_content=ORIGINAL)
+    assert result["message"] == "Candidate 0 is missing split_part2"
+    result = validate_candidates_tool([{"split_part1": "Alpha", "split_part2": ""}], original_content=ORIGINAL)
+    assert result["best"] is None and result["content_refs"] == {}
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from blogger.utils.blob_store import RAW, ZLIB, get_blob_store, main
+from blogger.utils.tools import (
+    list_versions_tool,
+    read_version_tool,
+    save_section_tool,
+    save_step_tool,
+)
+
+
+@pytest.fixture
+def posts_dir(tmp_path, monkeypatch):
+    """Set up a posts directory with an organized draft."""
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    (tmp_path / "test-blog").mkdir()
+    (tmp_path / "test-blog" / "2-draft_organized.md").write_text(
+        "# Test\n\n## Introduction\nIntro.\n\n## Body\nBody.\n"
+    )
+    return tmp_path
+
+
+def test_identical_content_is_stored_once(posts_dir):
+    store = get_blob_store(posts_dir)
+    first = store.put(b"same text")
+    assert store.put(b"same text") == first
+    assert store.get(first) == b"same text"
+
+    store.record("blog-a", "1-outline", "shared outline")
+    store.record("blog-b", "1-outline", "shared outline")
+    stats = store.stats()
+    assert stats["versions"] == 2
+    assert stats["blobs"] == 2  # "same text" + "shared outline"
+
+
+def test_history_lives_outside_the_cache_directory(posts_dir):
+    # posts/.blogger/ holds rebuildable caches; versions must survive its removal
+    save_step_tool("test-blog", "1-outline", "# Outline")
+    assert not (posts_dir / ".blogger" / "objects").exists()
+    assert (posts_dir / ".history" / "refs" / "test-blog.json").exists()
+
+
+def test_large_blobs_are_compressed(posts_dir):
+    store = get_blob_store(posts_dir)
+    text = "A sentence that repeats. " * 200
+    digest = store.put(text.encode())
+    raw = store._object_path(digest).read_bytes()
+    assert raw[:1] == ZLIB
+    assert len(raw) < len(text)
+    assert store.get(digest).decode() == text
+
+    assert store._object_path(store.put(b"tiny")).read_bytes()[:1] == RAW
+
+
+def test_corrupt_blob_is_detected(posts_dir):
+    store = get_blob_store(posts_dir)
+    digest = store.put(b"original")
+    store._object_path(digest).write_bytes(RAW + b"tampered")
+    with pytest.raises(ValueError):
+        store.get(digest)
+
+
+def test_step_saves_are_versioned(posts_dir):
+    save_step_tool("test-blog", "1-outline", "## v1")
+    save_step_tool("test-blog", "1-outline", "## v2")
+    save_step_tool("test-blog", "1-outline", "## v2")  # Unchanged: no new version
+
+    listed = list_versions_tool("test-blog", "1-outline")
+    assert listed["status"] == "success"
+    assert [v["version"] for v in listed["versions"]["1-outline"]] == [1, 2]
+
+    assert read_version_tool("test-blog", "1-outline")["content"] == "## v2"
+    assert read_version_tool("test-blog", "1-outline", 1)["content"] == "## v1"
+    assert read_version_tool("test-blog", "1-outline", -2)["content"] == "## v1"
+    assert read_version_tool("test-blog", "1-outline", 5)["status"] == "error"
+    assert read_version_tool("test-blog", "2-outline")["status"] == "error"
+
+
+def test_section_saves_are_versioned(posts_dir):
+    save_section_tool("test-blog", "Body", "## Body\nFirst polish.")
+    save_section_tool("test-blog", "Body", "## Body\nSecond polish.")
+
+    versions = list_versions_tool("test-blog")["versions"]
+    assert len(versions["section:Body"]) == 2
+    assert read_version_tool("test-blog", "section:Body", 1)["content"] == "## Body\nFirst polish."
+
+
+def test_cli_stats_and_gc(posts_dir, capsys):
+    store = get_blob_store(posts_dir)
+    store.put(b"orphan")
+    save_step_tool("test-blog", "1-outline", "## kept")
+
+    assert main(["--posts-dir", str(posts_dir), "stats"]) == 0
+    assert json.loads(capsys.readouterr().out)["blobs"] == 2
+
+    assert main(["--posts-dir", str(posts_dir), "gc"]) == 0
+    assert "Removed 1" in capsys.readouterr().out
+    assert read_version_tool("test-blog", "1-outline")["content"] == "## kept"
@@ -0,0 +1,76 @@
+import pytest
+
+from blogger.utils.tools import get_blog_context_tool
+
+ANALYSIS = """---
+mode: deep
+complexity_score: 8.0
+---
+Summary.
+
+## Content Chunks
+
+**Chunk #1** [quote] (Score: 9.0/10)
+> A quote.
+"""
+
+
+@pytest.fixture
+def posts_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    blog_dir = tmp_path / "test-blog"
+    blog_dir.mkdir()
+    (blog_dir / "draft.md").write_text("# Draft\n\n" + "A line of the draft.\n" * 50)
+    (blog_dir / "1-outline.md").write_text("# Title\n\n## Intro\nWhy.\n\n## Body\nWhat.\n")
+    (blog_dir / "0-analysis.md").write_text(ANALYSIS)
+    return tmp_path
+
+
+def test_all_artifacts_in_one_call(posts_dir):
+    result = get_blog_context_tool("test-blog")
+
+    assert result["status"] == "success"
+    artifacts = result["artifacts"]
+    assert artifacts["status"]["next_action"] == "Run Curator (Step 2)"
+    assert artifacts["draft"]["content"].startswith("# Draft")
+    assert artifacts["draft"]["truncated"] is False
+    assert artifacts["outline"]["total_lines"] == 7
+    assert artifacts["analysis"] == {
+        "available": True,
+        "data": {"mode": "deep", "complexity_score": "8.0"},
+        "chunk_count": 1,
+    }
+    # No organized draft yet: sections come from the outline
+    assert artifacts["sections"]["source"] == "1-outline.md"
+    assert [s["title"] for s in artifacts["sections"]["sections"]] == ["Intro", "Body"]
+    assert result["missing"] == ["organized"]
+
+
+def test_subset_and_caps(posts_dir):
+    result = get_blog_context_tool("test-blog", artifacts=["draft"], max_chars=100)
+
+    assert list(result["artifacts"]) == ["draft"]
+    draft = result["artifacts"]["draft"]
+    assert draft["truncated"] is True
+    assert len(draft["content"]) <= 100
+    assert draft["content"].endswith("\n")
+    assert draft["shown_lines"] == draft["content"].count("\n")
+    assert draft["total_lines"] == 52
+
+
+def test_organized_sections(posts_dir):
+    (posts_dir / "test-blog" / "2-draft_organized.md").write_text("## Intro\nText.\n\n## Body\nMore text.\n")
+    result = get_blog_context_tool("test-blog", artifacts=["organized", "sections"])
+
+    sections = result["artifacts"]["sections"]
+    assert sections["source"] == "2-draft_organized.md"
+    assert sections["sections"][0] == {"title": "Intro", "chars": len("## Intro\nText.\n")}
+
+
+def test_inferred_blog_and_errors(posts_dir):
+    result = get_blog_context_tool(artifacts=["status"])
+    assert result["blog_id"] == "test-blog"
+    assert result["inferred"] is True
+
+    assert get_blog_context_tool("nope")["status"] == "error"
+    assert get_blog_context_tool("test-blog", artifacts=["everything"])["status"] == "error"
@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from blogger.utils.doc_cache import DocumentCache, cache_stats, get_document_cache
+from blogger.utils.tools import read_analysis_tool, read_section_tool, save_section_tool
+
+ORGANIZED = "# Test\n\n## Introduction\nIntro.\n\n## Body\nBody.\n"
+
+ANALYSIS = """---
+mode: light
+complexity_score: 3.5
+main_topics:
+  - AI agents
+---
+Short draft.
+"""
+
+
+def settle(path, seconds=10):
+    """Backdate a file so its mtime is outside the racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+@pytest.fixture
+def blog_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    get_document_cache().invalidate()
+    blog_dir = tmp_path / "test-blog"
+    blog_dir.mkdir()
+    (blog_dir / "2-draft_organized.md").write_text(ORGANIZED)
+    (blog_dir / "0-analysis.md").write_text(ANALYSIS)
+    settle(blog_dir / "2-draft_organized.md")
+    settle(blog_dir / "0-analysis.md")
+    return blog_dir
+
+
+def test_hits_until_file_changes(tmp_path):
+    cache = DocumentCache()
+    path = tmp_path / "doc.md"
+    path.write_text("one")
+    settle(path)
+
+    first = cache.get(path)
+    assert cache.get(path) is first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    path.write_text("two!")
+    assert cache.get(path).text == "two!"
+    assert cache.stats()["misses"] == 2
+
+
+def test_parsed_forms_are_computed_once(tmp_path):
+    cache = DocumentCache()
+    path = tmp_path / "doc.md"
+    path.write_text("## A\n## B\n")
+    settle(path)
+
+    calls = []
+    parser = lambda text: calls.append(text) or text.count("##")
+    assert cache.get(path).parsed("count", parser) == 2
+    assert cache.get(path).parsed("count", parser) == 2
+    assert len(calls) == 1
+    assert cache.stats()["parse_hits"] == 1
+
+
+def test_racy_entries_are_revalidated(tmp_path):
+    cache = DocumentCache()
+    path = tmp_path / "doc.md"
+    path.write_text("fresh")  # mtime is "now": not trusted yet
+
+    document = cache.get(path)
+    document.parsed("upper", str.upper)
+    assert cache.get(path) is document  # Re-read, same text: parsed forms kept
+    assert cache.stats()["revalidated"] == 1
+
+    # Same size, same mtime, different content: still detected
+    st = path.stat()
+    path.write_text("FRESH")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert cache.get(path).text == "FRESH"
+
+
+def test_lru_eviction(tmp_path):
+    cache = DocumentCache(max_bytes=10)
+    for name in ["a", "b", "c"]:
+        (tmp_path / name).write_text(name * 4)
+        settle(tmp_path / name)
+        cache.get(tmp_path / name)
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 8
+    assert stats["evictions"] == 1
+
+
+def test_section_tools_share_parsed_sections(blog_dir):
+    before = cache_stats()
+    assert read_section_tool("test-blog", "Introduction")["status"] == "success"
+    assert read_section_tool("test-blog", "Body")["status"] == "success"
+    after = cache_stats()
+    assert after["parse_misses"] - before["parse_misses"] == 1
+    assert after["parse_hits"] - before["parse_hits"] == 1
+
+    # A saved section produces a new version of the document
+    save_section_tool("test-blog", "Body", "## Body\nPolished.")
+    assert read_section_tool("test-blog", "Body")["section_content"] == "## Body\nPolished."
+
+
+def test_analysis_is_parsed_once(blog_dir):
+    before = cache_stats()
+    first = read_analysis_tool("test-blog")
+    second = read_analysis_tool("test-blog")
+    assert first == second
+    assert first["data"]["main_topics"] == ["AI agents"]
+    assert cache_stats()["parse_misses"] - before["parse_misses"] == 1
+
+    (blog_dir / "0-analysis.md").write_text(ANALYSIS.replace("3.5", "7.0"))
+    assert read_analysis_tool("test-blog")["data"]["complexity_score"] == "7.0"
@@ -0,0 +1,109 @@
+import random
+from array import array
+
+import pytest
+
+from blogger.utils import fingerprints as fp
+from blogger.utils import text_utils
+from blogger.utils.text_utils import check_content_integrity, check_reorganization_integrity
+
+
+def test_set_operations_on_sorted_arrays():
+    a = array("Q", [1, 3, 5, 7])
+    b = array("Q", [3, 4, 7, 9])
+    assert list(fp.union(a, b)) == [1, 3, 4, 5, 7, 9]
+    assert list(fp.difference(a, b)) == [1, 5]
+    assert list(fp.intersection(a, b)) == [3, 7]
+    assert fp.contains(a, 5) and not fp.contains(a, 4)
+
+
+def test_fingerprints_follow_line_normalization():
+    assert fp.fingerprint_lines("  Hello \n\nHELLO\nworld") == fp.fingerprint_lines("world\nhello")
+    assert len(fp.fingerprint_lines("")) == 0
+    assert list(fp.iter_lines("a\nb\n")) == ["a", "b", ""]
+
+
+def test_samples_in_document_order():
+    text = "Keep\nLost one\nKeep\nLost two\nLost three"
+    missing = fp.fingerprint_lines("lost three\nlost one\nlost two")
+    assert fp.sample_lines([text], missing) == ["lost one", "lost two"]
+    assert fp.sample_lines([text, text], missing, limit=len(missing)) == ["lost one", "lost two", "lost three"]
+
+
+def test_runs_give_the_same_array():
+    text = "\n".join(f"Line {i % 50}" for i in range(500))
+    expected = array("Q", sorted({fp.fingerprint(f"line {i}") for i in range(50)}))
+    assert fp.fingerprint_lines(text) == expected
+    assert fp.sorted_distinct((fp.fingerprint(line) for line in fp.iter_normalized(text)), 7) == expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fingerprint_mode_matches_exact_mode(seed):
+    rng = random.Random(seed)
+    lines = [f"Paragraph {i} text" for i in range(30)]
+    raw = "\n\n".join(lines)
+    ok = [l for l in lines if rng.random() < 0.6]
+    not_ok = [l for l in lines if l not in ok]
+    # Random corruption: drop, add or duplicate a line
+    action = rng.choice(["none", "drop", "add", "dup"])
+    if action == "drop" and ok:
+        ok.pop(rng.randrange(len(ok)))
+    elif action == "add":
+        not_ok.append("Invented paragraph")
+    elif action == "dup" and ok:
+        not_ok.append(ok[0])
+    args = (raw, "\n\n".join(ok), "\n\n".join(not_ok))
+
+    exact_valid, exact_msg = check_content_integrity(*args, fingerprint=False)
+    fp_valid, fp_msg = check_content_integrity(*args, fingerprint=True)
+    assert fp_valid == exact_valid
+    # Same failure kind and count (samples may differ in order)
+    assert fp_msg.split("(e.g.")[0] == exact_msg.split("(e.g.")[0]
+
+
+def test_reorganization_fingerprint_mode():
+    outline = "# Title\n\n## Intro\nDescription ignored\n## End"
+    draft = "First\n\nSecond"
+    good = "# Title\n\n## Intro\n\nFirst\n\n## End\n\nSecond"
+    assert check_reorganization_integrity(draft, outline, good, fingerprint=True) == (True, "")
+    assert check_reorganization_integrity(draft, outline, good + "\n\nNew", fingerprint=True) == (
+        False, "Added content: 1 paragraphs not in draft or outline (e.g., 'new')"
+    )
+    assert check_reorganization_integrity(draft, outline, "# Title\n\n## Intro\n\nFirst", fingerprint=True) == (
+        False, "Lost content: 2 paragraphs missing (e.g., 'second', '## end')"
+    )
+
+
+def test_large_inputs_switch_to_fingerprints(monkeypatch):
+    calls = []
+    original = text_utils._check_content_integrity_fingerprints
+    monkeypatch.setattr(
+        text_utils, "_check_content_integrity_fingerprints",
+        lambda *a: calls.append(1) or original(*a),
+    )
+    monkeypatch.setattr(text_utils, "FINGERPRINT_MIN_CHARS", 100)
+
+    assert check_content_integrity("A\n\nB", "A", "B") == (True, "")
+    assert calls == []
+    big = "\n".join(f"line {i}" for i in range(50))
+    assert check_content_integrity(big, big, "") == (True, "")
+    assert calls == [1]
+
+
+def test_large_organization_check_keeps_no_parsed_draft(monkeypatch):
+    monkeypatch.setattr(text_utils, "FINGERPRINT_MIN_CHARS", 100)
+    parsed = []
+    original = text_utils.parse_markdown
+    monkeypatch.setattr(text_utils, "parse_markdown", lambda t: parsed.append(t) or original(t))
+    outline = "# T\n## One\n## Two"
+    draft = "```\n## not a heading\n```\n" + "\n".join(f"Paragraph {i}" for i in range(50))
+    organized = "# T\n## One\n" + draft + "\n## Two"
+
+    report = text_utils.check_organization(draft, outline, organized)
+
+    assert report["integrity"] == (True, "")
+    assert report["heading_order"] == (True, "")
+    assert organized not in parsed  # Only the outline was parsed
+
+    swapped = organized.replace("## One", "## Zero").replace("## Two", "## One").replace("## Zero", "## Two")
+    assert text_utils.check_organization(draft, outline, swapped)["heading_order"][0] is False
@@ -0,0 +1,103 @@
+import io
+
+from blogger.utils.html_text import extract_article, extract_text, stream_article, stream_text
+
+
+class FakeResponse(io.BytesIO):
+    """A response body that records how much of it was read."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, n=-1):
+        self.reads += 1
+        return super().read(n)
+
+
+def test_drops_scripts_and_collapses_whitespace():
+    html = """<html><head><title>T</title><style>body { color: red }</style>
+    <script>if (a < b) { alert("<p>no</p>") }</script></head>
+    <body><p>Hello&nbsp;<b>big</b>
+       world &amp; friends</p><noscript>Enable JS</noscript></body></html>"""
+    assert extract_text(html, 1000) == "T Hello big world & friends"
+
+
+def test_budget_stops_reading_early():
+    body = b"<p>" + b"word " * 200_000 + b"</p>"  # ~1MB
+    response = FakeResponse(body)
+
+    result = stream_text(response, max_chars=1000, chunk_size=4096)
+
+    assert len(result["text"]) == 1000
+    assert result["complete"] is False
+    assert result["bytes_read"] <= 2 * 4096
+    assert response.reads <= 2
+
+
+def test_multibyte_characters_split_across_chunks():
+    body = "<p>Déjà vu — café</p>".encode("utf-8")
+    result = stream_text(FakeResponse(body), max_chars=100, chunk_size=3)
+    assert result == {"text": "Déjà vu — café", "bytes_read": len(body), "complete": True}
+
+
+def test_tags_split_across_chunks():
+    body = b"<p>before</p><scr" + b"ipt>hidden()</scr" + b"ipt><p>after</p>"
+    result = stream_text(FakeResponse(body), max_chars=100, chunk_size=5)
+    assert result["text"] == "before after"
+
+
+ARTICLE_PAGE = """<html><head><title>My Post | Site</title></head><body>
+<header class="site-header"><a href="/">Home</a> <a href="/blog">Blog</a></header>
+<nav><ul><li><a href="/a">Link A</a></li><li><a href="/b">Link B</a></li></ul></nav>
+<div id="cookie-banner">We use cookies to improve your experience, please accept them all.</div>
+<div class="layout">
+ <div class="post-content">
+  <h1>Caching in practice</h1>
+  <p>Caching is the art of remembering, and like all arts, it takes practice and care.</p>
+  <h2>Why it matters</h2>
+  <p>Every request avoided is latency saved, bandwidth saved, and a happier user.</p>
+  <pre><code>cache = {}
+cache[key] = value</code></pre>
+  <ul><li>Invalidate on write, always, without exceptions.</li></ul>
+  <div class="share-buttons"><a href="/tw">Share on Twitter and other networks</a></div>
+ </div>
+ <div class="sidebar"><p><a href="/x">Related post one, a long title for testing</a></p></div>
+</div>
+<footer>Copyright 2024, all rights reserved by the company.</footer>
+</body></html>"""
+
+
+def test_article_keeps_main_content_only():
+    result = extract_article(ARTICLE_PAGE, 50000)
+
+    assert result["found"] is True
+    assert result["title"] == "My Post | Site"
+    assert result["headings"] == [
+        {"title": "Caching in practice", "level": 1},
+        {"title": "Why it matters", "level": 2},
+    ]
+    assert result["text"] == (
+        "# Caching in practice\n\n"
+        "Caching is the art of remembering, and like all arts, it takes practice and care.\n\n"
+        "## Why it matters\n\n"
+        "Every request avoided is latency saved, bandwidth saved, and a happier user.\n\n"
+        "```\ncache = {}\ncache[key] = value\n```\n\n"
+        "- Invalidate on write, always, without exceptions."
+    )
+    for chrome in ("Home", "Link A", "cookies", "Share", "Related", "Copyright"):
+        assert chrome not in result["text"]
+
+
+def test_article_falls_back_to_all_blocks():
+    result = extract_article("<p>Short.</p><p>Tiny.</p>", 100)
+    assert result["found"] is False
+    assert result["text"] == "Short.\n\nTiny."
+
+
+def test_stream_article_stops_at_byte_limit():
+    body = b"<div><p>" + b"a, " * 100_000 + b"</p></div>"
+    result = stream_article(FakeResponse(body), 500, max_bytes=10_000, chunk_size=4096)
+    assert result["bytes_read"] == 10_000
+    assert result["complete"] is False
+    assert len(result["text"]) == 500
@@ -0,0 +1,172 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from blogger.utils.http_cache import HttpCache, freshness
+from blogger.utils.tools import fetch_webpage_tool
+
+PAGE = b"<html><head><style>p {}</style></head><body><p>Hello <b>cached</b> world</p></body></html>"
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves PAGE with the validators/cache headers configured on the server."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if server.fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        etag = server.etag
+        if etag and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        if server.last_modified and self.headers.get("If-Modified-Since") == server.last_modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(server.body)))
+        if etag:
+            self.send_header("ETag", etag)
+        if server.last_modified:
+            self.send_header("Last-Modified", server.last_modified)
+        if server.cache_control:
+            self.send_header("Cache-Control", server.cache_control)
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.HTTP_CACHE_DIR", tmp_path / "http")
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    httpd.requests = []
+    httpd.body = PAGE
+    httpd.etag = '"v1"'
+    httpd.last_modified = None
+    httpd.cache_control = "max-age=0"
+    httpd.fail = False
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/post"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_freshness():
+    assert freshness({"Cache-Control": "public, max-age=600"}) == 600
+    assert freshness({"Cache-Control": "no-cache"}) == 0
+    assert freshness({"Cache-Control": "no-store"}) is None
+    assert freshness({}) > 0
+
+
+def test_fresh_entries_skip_the_network(server):
+    server.cache_control = "max-age=600"
+
+    first = fetch_webpage_tool(server.url)
+    assert first["content"] == "Hello cached world"
+    assert first["cached"] is False
+
+    second = fetch_webpage_tool(server.url)
+    assert second["content"] == "Hello cached world"
+    assert second["cached"] is True
+    assert len(server.requests) == 1
+
+
+def test_malformed_entry_is_a_miss(server, tmp_path):
+    server.cache_control = "max-age=600"
+    fetch_webpage_tool(server.url)
+    cache = HttpCache(tmp_path / "http")
+    path = cache._path(server.url)
+    entry = cache.get(server.url)
+
+    for broken in ('["not", "an", "entry"]', json.dumps({k: v for k, v in entry.items() if k != "fetched_at"})):
+        path.write_text(broken)
+        assert cache.get(server.url) is None
+        result = fetch_webpage_tool(server.url)
+        assert result["status"] == "success" and result["cached"] is False
+
+
+def test_stale_entries_are_revalidated_with_etag(server):
+    fetch_webpage_tool(server.url)
+
+    result = fetch_webpage_tool(server.url)
+    assert result["cached"] is True
+    assert len(server.requests) == 2
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+
+    # Changed page: new validator, new content
+    server.etag = '"v2"'
+    server.body = b"<p>Updated</p>"
+    result = fetch_webpage_tool(server.url)
+    assert result == {"status": "success", "url": server.url, "content": "Updated", "cached": False}
+
+
+def test_revalidation_with_last_modified(server):
+    server.etag = None
+    server.last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+    fetch_webpage_tool(server.url)
+
+    assert fetch_webpage_tool(server.url)["cached"] is True
+    assert server.requests[1]["If-Modified-Since"] == server.last_modified
+
+
+def test_no_store_is_not_cached(server, tmp_path):
+    server.cache_control = "no-store"
+    fetch_webpage_tool(server.url)
+    fetch_webpage_tool(server.url)
+    assert len(server.requests) == 2
+    assert HttpCache(tmp_path / "http").get(server.url) is None
+
+
+def test_stale_copy_served_when_server_fails(server):
+    fetch_webpage_tool(server.url)
+    server.fail = True
+
+    result = fetch_webpage_tool(server.url)
+    assert result["status"] == "success"
+    assert result["stale"] is True
+    assert result["content"] == "Hello cached world"
+
+
+def test_errors_without_cache(server):
+    server.fail = True
+    assert fetch_webpage_tool(server.url)["status"] == "error"
+    assert fetch_webpage_tool("ftp://example.com")["status"] == "error"
+
+
+def test_article_mode_is_cached_separately(server):
+    server.cache_control = "max-age=600"
+    server.body = (
+        b"<title>Post</title><nav><a href='/'>Home</a></nav>"
+        b"<article><h2>Intro</h2><p>Long enough paragraph, with commas, to count as content.</p></article>"
+    )
+
+    text = fetch_webpage_tool(server.url)
+    article = fetch_webpage_tool(server.url, mode="article")
+    assert "Home" in text["content"]
+    assert article["content"] == "## Intro\n\nLong enough paragraph, with commas, to count as content."
+    assert article["title"] == "Post"
+    assert article["headings"] == [{"title": "Intro", "level": 2}]
+    assert len(server.requests) == 2
+
+    cached = fetch_webpage_tool(server.url, mode="article")
+    assert cached["cached"] is True
+    assert cached["headings"] == article["headings"]
+    assert "title" not in fetch_webpage_tool(server.url)
+    assert len(server.requests) == 2
+
+    assert fetch_webpage_tool(server.url, mode="summary")["status"] == "error"
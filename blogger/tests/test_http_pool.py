@@ -0,0 +1,163 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from blogger.utils.http_cache import HttpCache
+from blogger.utils.http_pool import ConnectionPool, DeadlineExceeded
+from blogger.utils.tools import fetch_webpages_tool
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """
+    Keep-alive handler; /slow/* paths take server.slow seconds to answer,
+    /trickle/* paths answer at once but send their body over server.slow seconds.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.slow if self.path.startswith("/slow") else server.delay)
+            body = f"<p>Page {self.path}</p>".encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            if self.path.startswith("/trickle"):
+                for i in range(len(body)):
+                    self.wfile.write(body[i:i + 1])
+                    self.wfile.flush()
+                    time.sleep(server.slow / len(body))
+            else:
+                self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.HTTP_CACHE_DIR", tmp_path / "http")
+    pool = ConnectionPool(per_host=2)
+    monkeypatch.setattr("blogger.utils.tools.get_connection_pool", lambda: pool)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.active = httpd.max_active = 0
+    httpd.delay = 0
+    httpd.slow = 0
+    httpd.pool = pool
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    pool.close()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_batch_fetch_returns_pages_in_order(server):
+    urls = [f"{server.base}/post/{i}" for i in range(5)]
+
+    result = fetch_webpages_tool(urls + [urls[0]])  # Duplicates are fetched once
+
+    assert result["status"] == "success"
+    assert result["fetched"] == 5 and result["failed"] == 0
+    assert [r["url"] for r in result["results"]] == urls
+    assert result["results"][3]["content"] == "Page /post/3"
+
+
+def test_connections_are_reused_and_limited_per_host(server):
+    server.delay = 0.05
+    urls = [f"{server.base}/post/{i}" for i in range(8)]
+
+    result = fetch_webpages_tool(urls)
+
+    assert result["fetched"] == 8
+    assert server.max_active <= 2
+    assert server.pool.stats["connections"] <= 2
+    assert server.pool.stats["reused"] >= 6
+
+
+def test_deadline_returns_partial_results(server):
+    server.slow = 3
+    urls = [f"{server.base}/post/1", f"{server.base}/slow/1"]
+
+    started = time.monotonic()
+    result = fetch_webpages_tool(urls, deadline=1)
+
+    assert time.monotonic() - started < 2
+    assert result["fetched"] == 1
+    assert result["timed_out"] == [urls[1]]
+    assert result["results"][0]["content"] == "Page /post/1"
+    assert result["results"][1]["status"] == "error"
+
+
+def test_failures_are_not_reported_as_timeouts(server, monkeypatch):
+    original = HttpCache.get
+
+    def get(self, url, variant=None):
+        if "/denied" in url:
+            raise PermissionError("cache not readable")
+        return original(self, url, variant)
+
+    monkeypatch.setattr(HttpCache, "get", get)
+    urls = [f"{server.base}/post/1", f"{server.base}/denied/1"]
+
+    result = fetch_webpages_tool(urls)
+
+    assert result["timed_out"] == []
+    assert result["fetched"] == 1 and result["failed"] == 1
+    assert "cache not readable" in result["results"][1]["message"]
+
+
+def test_deadline_after_slot_keeps_idle_connection(server, monkeypatch):
+    pool = server.pool
+    with pool.open(f"{server.base}/post/1") as response:
+        response.read()
+    idle = sum(len(conns) for conns in pool._idle.values())
+    assert idle == 1
+
+    # The deadline passes right after the slot is acquired
+    calls = []
+    original = ConnectionPool._remaining
+
+    def remaining(self, deadline):
+        calls.append(deadline)
+        if len(calls) > 1:
+            raise DeadlineExceeded()
+        return original(self, deadline)
+
+    monkeypatch.setattr(ConnectionPool, "_remaining", remaining)
+    with pytest.raises(DeadlineExceeded):
+        pool.open(f"{server.base}/post/2", deadline=time.monotonic() + 5)
+    assert sum(len(conns) for conns in pool._idle.values()) == idle
+
+
+def test_deadline_bounds_body_reads(server):
+    # Headers arrive at once, then a byte every ~0.2s: no single read times out
+    server.slow = 4
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        with server.pool.open(f"{server.base}/trickle/1", deadline=started + 1) as response:
+            while response.read(1024):
+                pass
+    assert time.monotonic() - started < 1.5
+
+
+def test_invalid_batches():
+    assert fetch_webpages_tool([])["status"] == "error"
+    assert fetch_webpages_tool([f"http://example.com/{i}" for i in range(50)])["status"] == "error"
+    result = fetch_webpages_tool(["ftp://example.com/file"])
+    assert result["failed"] == 1
@@ -0,0 +1,179 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from blogger.utils.layout import (
+    FlatLayout,
+    ShardedLayout,
+    blog_dir,
+    get_layout_state,
+    get_layout,
+    list_blog_ids,
+    main,
+    reshard,
+)
+from blogger.utils.tools import (
+    get_workflow_status_tool,
+    infer_blog_id_tool,
+    read_draft_tool,
+    read_file_tool,
+    save_step_tool,
+)
+
+
+@pytest.fixture
+def posts_dir(tmp_path, monkeypatch):
+    """Set up a flat posts directory with three blogs."""
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    for blog_id in ["alpha-post", "beta-post", "gamma-post"]:
+        (tmp_path / blog_id).mkdir()
+        (tmp_path / blog_id / "draft.md").write_text(f"# {blog_id}\n\nBody.\n")
+    return tmp_path
+
+
+def test_default_layout_is_flat(posts_dir):
+    assert isinstance(get_layout(posts_dir), FlatLayout)
+    assert blog_dir(posts_dir, "alpha-post") == posts_dir / "alpha-post"
+    assert list_blog_ids(posts_dir) == {"alpha-post", "beta-post", "gamma-post"}
+
+
+def test_reshard_round_trip(posts_dir):
+    assert get_workflow_status_tool()["total_blogs"] == 3
+
+    result = reshard(posts_dir, ShardedLayout(width=2))
+    assert result["moved"] == 3
+
+    layout = get_layout(posts_dir)
+    assert isinstance(layout, ShardedLayout)
+    for blog_id in ["alpha-post", "beta-post", "gamma-post"]:
+        path = blog_dir(posts_dir, blog_id)
+        assert path == posts_dir / layout.shard(blog_id) / blog_id
+        assert (path / "draft.md").exists()
+        assert not (posts_dir / blog_id).exists()
+
+    # The workflow index notices the layout change
+    assert get_workflow_status_tool()["total_blogs"] == 3
+
+    # Re-running is a no-op
+    assert reshard(posts_dir, ShardedLayout(width=2))["moved"] == 0
+
+    reshard(posts_dir, FlatLayout())
+    assert sorted(p.name for p in posts_dir.iterdir() if not p.name.startswith(".")) == [
+        "alpha-post", "beta-post", "gamma-post",
+    ]
+    assert get_workflow_status_tool()["total_blogs"] == 3
+
+
+def test_tools_use_sharded_paths(posts_dir):
+    reshard(posts_dir, ShardedLayout())
+
+    result = save_step_tool("delta-post", "draft", "# Delta\n\n## Kubernetes\n")
+    assert result["status"] == "success"
+    assert (blog_dir(posts_dir, "delta-post") / "draft.md").exists()
+    assert not (posts_dir / "delta-post").exists()
+
+    assert read_draft_tool("delta-post")["content"] == "# Delta\n\n## Kubernetes\n"
+    assert read_file_tool("posts/delta-post/draft.md")["status"] == "success"
+    assert infer_blog_id_tool("kubernetes")["blog_id"] == "delta-post"
+
+    blogs = {b["blog_id"] for b in get_workflow_status_tool()["blogs"]}
+    assert blogs == {"alpha-post", "beta-post", "gamma-post", "delta-post"}
+
+
+def test_layout_survives_a_cache_wipe(posts_dir):
+    reshard(posts_dir, ShardedLayout(width=1))
+    assert (posts_dir / ".layout.json").exists()
+    assert not (posts_dir / ".blogger" / "layout.json").exists()
+
+    # The layout file is kept out of the ignored cache directory
+    gitignore = (Path(__file__).parents[2] / ".gitignore").read_text()
+    assert "posts/.layout.json" not in [line.strip() for line in gitignore.splitlines()]
+
+
+def test_layout_file_from_older_versions_is_read(posts_dir):
+    sharded = ShardedLayout(width=1)
+    reshard(posts_dir, sharded)
+    legacy = posts_dir / ".blogger" / "layout.json"
+    legacy.parent.mkdir(exist_ok=True)
+    (posts_dir / ".layout.json").rename(legacy)
+
+    assert get_layout(posts_dir).to_dict() == sharded.to_dict()
+    reshard(posts_dir, FlatLayout())  # Rewritten in the new place
+    assert not legacy.exists()
+    assert isinstance(get_layout(posts_dir), FlatLayout)
+
+
+def test_sharded_tree_without_layout_file_is_detected(posts_dir):
+    sharded = ShardedLayout(width=1)
+    reshard(posts_dir, sharded)
+    (posts_dir / ".layout.json").unlink()  # Fresh clone, file never committed
+
+    state = get_layout_state(posts_dir)
+    assert state.layout.to_dict() == sharded.to_dict() and state.previous is None
+    assert list_blog_ids(posts_dir) == {"alpha-post", "beta-post", "gamma-post"}
+
+    # A flat blog with a hex name is not a shard
+    (posts_dir / "ab" / "draft").mkdir(parents=True)
+    other = posts_dir.parent / "flat-posts"
+    (other / "ab" / "images").mkdir(parents=True)
+    assert isinstance(get_layout(other), FlatLayout)
+
+
+def test_interrupted_reshard_keeps_blogs_reachable(posts_dir):
+    # Simulate a migration that stopped after moving one blog
+    sharded = ShardedLayout()
+    reshard(posts_dir, sharded)
+    reshard(posts_dir, FlatLayout())
+    layout_file = posts_dir / ".layout.json"
+    layout_file.write_text(json.dumps({"layout": sharded.to_dict(), "previous": {"type": "flat"}}))
+    moved = posts_dir / sharded.relpath("alpha-post")
+    moved.parent.mkdir()
+    (posts_dir / "alpha-post").rename(moved)
+
+    assert blog_dir(posts_dir, "alpha-post") == moved
+    assert blog_dir(posts_dir, "beta-post") == posts_dir / "beta-post"
+    assert list_blog_ids(posts_dir) == {"alpha-post", "beta-post", "gamma-post"}
+    assert read_draft_tool("beta-post")["status"] == "success"
+
+    # Resuming finishes the job
+    assert reshard(posts_dir, sharded)["moved"] == 2
+    assert not (posts_dir / "beta-post").exists()
+    assert (blog_dir(posts_dir, "beta-post") / "draft.md").exists()
+
+
+def test_cli(posts_dir, capsys):
+    assert main(["--posts-dir", str(posts_dir), "reshard", "--layout", "sharded", "--width", "1"]) == 0
+    assert "Moved 3 blogs" in capsys.readouterr().out
+
+    assert main(["--posts-dir", str(posts_dir), "show"]) == 0
+    shown = json.loads(capsys.readouterr().out)
+    assert shown["layout"] == {"type": "sharded", "width": 1}
+    assert shown["blogs"] == 3
+
+
+@pytest.mark.parametrize("backend", ["polling", "inotify"])
+def test_watcher_follows_sharded_layout(posts_dir, backend):
+    import sys
+    if backend == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    from blogger.tests.test_watcher import wait_for
+    from blogger.utils.watcher import start_posts_watcher, stop_posts_watcher
+
+    layout = ShardedLayout(width=1)
+    reshard(posts_dir, layout)
+    start_posts_watcher(posts_dir, backend=backend, interval=0.05)
+    try:
+        # A blog in a shard directory that doesn't exist yet
+        new_dir = blog_dir(posts_dir, "zeta-post")
+        new_dir.mkdir(parents=True, exist_ok=True)
+        (new_dir / "draft.md").write_text("# Zeta\n")
+        (blog_dir(posts_dir, "alpha-post") / "1-outline.md").write_text("## Intro\n")
+
+        def updated():
+            blogs = {b["blog_id"]: b for b in get_workflow_status_tool()["blogs"]}
+            return "zeta-post" in blogs and blogs["alpha-post"]["current_step"] == 2
+
+        assert wait_for(updated)
+    finally:
+        stop_posts_watcher(posts_dir)
@@ -0,0 +1,107 @@
+import random
+
+from blogger.utils.line_diff import diagnose_content_split, diagnose_reorganization, diff_opcodes
+from blogger.utils.tools import validate_content_split_tool, validate_organization_tool
+
+
+def _lcs_length(a, b):
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b):
+            cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev[-1]
+
+
+def test_diff_is_a_minimal_edit_script():
+    rng = random.Random(7)
+    for _ in range(500):
+        a = [rng.choice("abcd") for _ in range(rng.randrange(20))]
+        b = [rng.choice("abcd") for _ in range(rng.randrange(20))]
+        rebuilt, equal = [], 0
+        for tag, i1, i2, j1, j2 in diff_opcodes(a, b):
+            if tag == "equal":
+                assert a[i1:i2] == b[j1:j2]
+                equal += i2 - i1
+            if tag != "delete":
+                rebuilt += b[j1:j2]
+        assert rebuilt == b
+        assert equal == _lcs_length(a, b)
+
+
+def test_split_diagnostics_locate_each_problem():
+    raw = "Intro\n\nFirst point\n\nSecond point\n\nTangent\n\nOutro"
+    part1 = "Intro\n\nSecond point\n\nOutro\n\nInvented line"
+    part2 = "Tangent\n\nOutro"
+
+    report = diagnose_content_split(raw, part1, part2)
+
+    assert report["lost"] == [
+        {"line": 3, "text": "first point", "part1_after_line": 1, "part2_after_line": 0}
+    ]
+    assert report["added"] == [
+        {"part": "part1", "line": 7, "text": "invented line", "after_original_line": 9}
+    ]
+    assert report["duplicated"] == [
+        {"text": "outro", "original_line": 9, "part1_line": 5, "part2_line": 3}
+    ]
+    assert report["counts"] == {"lost": 1, "added": 1, "duplicated": 1}
+
+
+def test_reorganization_diagnostics():
+    draft = "Alpha\nBeta\nGamma\nDelta"
+    outline = "# Post\n## One\n## Two"
+    organized = "# Post\n## One\nAlpha\nNew claim\n## Two\nDelta\nGamma"
+
+    report = diagnose_reorganization(draft, outline, organized)
+
+    # Beta was replaced by the invented line right after Alpha
+    assert report["lost"] == [{"line": 2, "text": "beta", "reorganized_after_line": 3}]
+    assert report["added"] == [{"line": 4, "text": "new claim", "after_draft_line": 2}]
+    assert report["missing_headings"] == []
+    assert report["moved"] == 1  # Gamma moved after Delta: allowed
+
+    report = diagnose_reorganization(draft, outline, "# Post\n" + draft)
+    assert report["missing_headings"] == [
+        {"outline_line": 2, "text": "## one"},
+        {"outline_line": 3, "text": "## two"},
+    ]
+
+
+def test_shuffled_sections_fall_back_to_unique_lines():
+    # 20 sections of 200 lines in a new order: far too many edits for the diff
+    sections = [
+        [f"## Section {i}"] + [f"Paragraph {i}.{j}" for j in range(199)] for i in range(20)
+    ]
+    draft = "\n".join(line for section in sections for line in section)
+    outline = "\n".join(section[0] for section in sections)
+    shuffled = sections[:]
+    random.Random(3).shuffle(shuffled)
+    removed = shuffled[0][50]
+    shuffled[0] = shuffled[0][:50] + shuffled[0][51:]  # one paragraph lost
+    organized = "\n".join(line for section in shuffled for line in section)
+
+    report = diagnose_reorganization(draft, outline, organized)
+
+    assert report["alignment"] == "unique_lines"
+    assert report["counts"] == {"lost": 1, "added": 0, "missing_headings": 0}
+    lost = report["lost"][0]
+    assert lost["text"] == removed.lower()
+    # It belongs right after the paragraph that preceded it
+    assert organized.split("\n")[lost["reorganized_after_line"] - 1] == shuffled[0][49]
+    assert report["moved"] > 0
+
+    # Small edits still get the exact diff
+    assert diagnose_reorganization(draft, outline, draft)["alignment"] == "diff"
+
+
+def test_tools_return_diagnostics_on_request():
+    result = validate_content_split_tool("A\n\nB\n\nC", "A", "C", diagnose=True)
+    assert result["valid"] is False
+    assert result["diagnostics"]["lost"][0]["line"] == 3
+    assert "diagnostics" not in validate_content_split_tool("A\n\nB\n\nC", "A", "C")
+    assert "diagnostics" not in validate_content_split_tool("A\n\nB", "A", "B", diagnose=True)
+
+    result = validate_organization_tool("X\nY", "## H", "## H\nX", diagnose=True)
+    assert result["diagnostics"]["lost"] == [{"line": 2, "text": "y", "reorganized_after_line": 2}]
@@ -0,0 +1,72 @@
+from blogger.utils.markdown_model import ParsedMarkdown, parse_markdown
+from blogger.utils.text_utils import (
+    check_heading_order,
+    check_organization,
+    check_outline_structure,
+    check_reorganization_integrity,
+    normalize_and_split,
+)
+from blogger.utils.tools import validate_organization_tool
+
+OUTLINE = "# Title\n\n## Introduction\nWhat this covers\n\n## Body\n\n## Conclusion"
+DRAFT = "Intro text\n\nBody text\n\n```python\n# a comment\nprint(1)\n```\n\nThe end"
+ORGANIZED = (
+    "# Title\n\n## Introduction\n\nIntro text\n\n## Body\n\nBody text\n\n"
+    "```python\n# a comment\nprint(1)\n```\n\n## Conclusion\n\nThe end"
+)
+
+
+def test_model_fields():
+    doc = ParsedMarkdown(ORGANIZED)
+    assert doc.lines == ORGANIZED.split("\n")
+    assert doc.line_set == normalize_and_split(ORGANIZED)
+    assert doc.heading_lines(1) == ["# title"]
+    assert doc.heading_lines(2) == ["## introduction", "## body", "## conclusion"]
+    start, end = doc.code_fences[0]
+    assert doc.lines[start] == "```python" and doc.lines[end] == "```"
+    assert doc.in_code(start + 1) and not doc.in_code(0)
+    assert "# a comment" in doc.hash_lines  # Still a line of the document
+
+
+def test_unclosed_fence_runs_to_the_end():
+    doc = ParsedMarkdown("## A\n~~~\n## B")
+    assert doc.code_fences == [(1, 2)]
+    assert doc.heading_lines(2) == ["## a"]
+
+
+def test_parse_is_cached_and_accepts_models():
+    doc = parse_markdown(ORGANIZED)
+    assert parse_markdown(ORGANIZED) is doc
+    assert parse_markdown(doc) is doc
+
+
+def test_checks_accept_parsed_models():
+    outline, organized = parse_markdown(OUTLINE), parse_markdown(ORGANIZED)
+    assert check_reorganization_integrity(DRAFT, outline, organized) == (True, "")
+    assert check_heading_order(outline, organized) == (True, "")
+    assert check_outline_structure(outline) == (True, [])
+
+
+def test_code_comments_are_not_headings():
+    organized = ORGANIZED.replace("# a comment", "## a comment")
+    draft = DRAFT.replace("# a comment", "## a comment")
+    assert check_heading_order(OUTLINE, organized) == (True, "")
+    assert check_reorganization_integrity(draft, OUTLINE, organized) == (True, "")
+
+
+def test_combined_checks_report_timings():
+    report = check_organization(DRAFT, OUTLINE, ORGANIZED)
+    assert report["integrity"] == (True, "")
+    assert report["heading_order"] == (True, "")
+    assert report["outline_structure"] == (True, [])
+    assert set(report["timings_ms"]) == {"parse", "integrity", "heading_order", "outline_structure"}
+
+
+def test_tool_reports_outline_warnings_without_failing():
+    outline = "# Title\n\n## Body"
+    organized = "# Title\n\n## Body\n\nText"
+    result = validate_organization_tool("Text", outline, organized)
+    assert result["valid"] is True
+    assert result["checks"]["outline_structure"] is False
+    assert "Outline structure: only 1 sections (need 3+)" in result["warnings"]
+    assert "heading_order" in result["timings_ms"]
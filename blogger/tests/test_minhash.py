@@ -0,0 +1,119 @@
+import random
+import time
+
+import pytest
+
+from blogger.utils.minhash import MAX_EDIT_LINES, jaccard, match_edits, shingles
+from blogger.utils.text_utils import check_content_integrity, check_reorganization_integrity
+from blogger.utils.tools import validate_content_split_tool
+
+PARAGRAPHS = [
+    "Python generators produce values lazily, one at a time.",
+    "Memory usage stays flat even for very large inputs.",
+    "The itertools module offers many building blocks for pipelines.",
+    "Profiling first avoids optimizing the wrong function.",
+]
+
+
+def test_shingles_ignore_whitespace_runs():
+    assert shingles("a  quick   fox") == shingles("a quick fox")
+    assert jaccard(shingles("same line"), shingles("same line")) == 1.0
+
+
+def test_match_edits_pairs_similar_lines_one_to_one():
+    old = ["the quick brown fox jumps over the lazy dog", "completely different words here"]
+    new = ["nothing alike at all", "the quick brown fox jumped over the lazy dog"]
+
+    pairs = match_edits(old, new, 0.7)
+
+    assert [(i, j) for i, j, _ in pairs] == [(0, 1)]
+    assert pairs[0][2] >= 0.7
+    assert match_edits(old, [], 0.7) == []
+
+
+def test_match_edits_finds_pairs_among_many_lines():
+    old = [f"Paragraph number {i} talks about topic {i * 7} in detail." for i in range(300)]
+    new = [line.replace("detail", "details") for line in old]
+
+    pairs = match_edits(old, new[::-1], 0.8)
+
+    assert len(pairs) == 300
+    assert all(j == 299 - i for i, j, _ in pairs)
+
+
+def test_match_edits_is_fast_on_many_edited_lines():
+    rng = random.Random(2)
+    words = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randrange(3, 9))) for _ in range(3000)]
+    old = [" ".join(rng.choices(words, k=30))[:150] for _ in range(MAX_EDIT_LINES)]
+    new = []
+    for line in old:
+        chars = list(line)
+        for _ in range(3):
+            chars[rng.randrange(len(chars))] = rng.choice("abcdefgh")
+        new.append("".join(chars))
+
+    started = time.monotonic()
+    pairs = match_edits(old, new[::-1])
+    # A MinHash per permutation took ~7s here; one hash per shingle takes well under 1s
+    assert time.monotonic() - started < 3
+    assert sum(j == len(old) - 1 - i for i, j, _ in pairs) >= 0.95 * len(old)
+
+
+def test_match_edits_bounds_templated_lines():
+    # Near-identical lines collide in every band: all pairs would be candidates
+    old = [f"| row {i} | nothing in particular at all |" for i in range(MAX_EDIT_LINES + 5)]
+
+    started = time.monotonic()
+    pairs = match_edits(old, old)
+    assert time.monotonic() - started < 3
+    assert [i for i, _, _ in pairs] == list(range(MAX_EDIT_LINES))
+
+
+@pytest.mark.parametrize("fingerprint", [False, True])
+def test_tolerant_split_accepts_edited_paragraphs(fingerprint):
+    raw = "\n\n".join(PARAGRAPHS)
+    edited = PARAGRAPHS[1].replace("very large", "very, very large")
+    ok = "\n\n".join([PARAGRAPHS[0], edited])
+    not_ok = "\n\n".join(PARAGRAPHS[2:])
+
+    valid, message = check_content_integrity(raw, ok, not_ok, fingerprint=fingerprint)
+    assert not valid and message.startswith("Lost content: 1 ")
+
+    valid, message = check_content_integrity(raw, ok, not_ok, fingerprint=fingerprint, tolerance=0.6)
+    assert valid
+    assert message.startswith("Edited content: 1 paragraphs")
+    assert "very, very large" in message
+
+
+@pytest.mark.parametrize("fingerprint", [False, True])
+def test_tolerant_split_still_reports_rewrites(fingerprint):
+    raw = "\n\n".join(PARAGRAPHS)
+    ok = "\n\n".join(PARAGRAPHS[:1] + ["An entirely new paragraph about something else."])
+    not_ok = "\n\n".join(PARAGRAPHS[2:])
+
+    valid, message = check_content_integrity(raw, ok, not_ok, fingerprint=fingerprint, tolerance=0.8)
+
+    assert not valid
+    assert message.startswith("Lost content: 1 paragraphs")
+
+
+def test_tolerant_reorganization():
+    outline = "# Title\n\n## Part"
+    draft = "\n\n".join(PARAGRAPHS[:2])
+    organized = "# Title\n\n## Part\n\n" + PARAGRAPHS[0] + "\n\n" + PARAGRAPHS[1].replace("flat", "flat-ish")
+
+    assert not check_reorganization_integrity(draft, outline, organized)[0]
+    valid, message = check_reorganization_integrity(draft, outline, organized, tolerance=0.7)
+    assert valid and message.startswith("Edited content: 1 ")
+
+
+def test_validation_tool_reports_edits():
+    raw = "\n\n".join(PARAGRAPHS)
+    ok = "\n\n".join([PARAGRAPHS[0], PARAGRAPHS[1].rstrip(".")])
+    not_ok = "\n\n".join(PARAGRAPHS[2:])
+
+    assert validate_content_split_tool(raw, ok, not_ok)["valid"] is False
+
+    result = validate_content_split_tool(raw, ok, not_ok, tolerance=0.8)
+    assert result["valid"] is True
+    assert result["edited"].startswith("Edited content: 1 ")
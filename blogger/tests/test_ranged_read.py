@@ -0,0 +1,122 @@
+import pytest
+
+from blogger.utils.ranged_read import read_range
+from blogger.utils.tools import read_draft_tool, read_file_tool, read_previous_content_tool
+
+DRAFT = """# Title
+
+Intro line.
+
+## Setup
+Setup line 1.
+Setup line 2.
+
+### Details
+Nested détails.
+
+## Results
+Result line.
+"""
+
+
+@pytest.fixture
+def draft_path(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    (tmp_path / "test-blog").mkdir()
+    path = tmp_path / "test-blog" / "draft.md"
+    path.write_text(DRAFT)
+    return path
+
+
+def test_full_read_reports_size(draft_path):
+    result = read_draft_tool("test-blog")
+    assert result["content"] == DRAFT
+    assert result["total_lines"] == 13
+    assert result["total_bytes"] == len(DRAFT.encode("utf-8"))
+    assert "range" not in result
+
+
+def test_line_range_paging(draft_path):
+    result = read_draft_tool("test-blog", offset=0, limit=5)
+    assert result["content"] == "# Title\n\nIntro line.\n\n## Setup\n"
+    assert result["has_more"] is True
+    assert result["range"] == {"unit": "lines", "start": 0, "end": 5, "total": 13}
+
+    pages = [result["content"]]
+    while result["has_more"]:
+        result = read_draft_tool("test-blog", offset=result["next_offset"], limit=5)
+        pages.append(result["content"])
+    assert "".join(pages) == DRAFT
+
+    assert read_draft_tool("test-blog", offset=100)["content"] == ""
+
+
+def test_byte_range_respects_utf8(draft_path):
+    data = DRAFT.encode("utf-8")
+    split = data.index("é".encode("utf-8")) + 1  # Inside the two-byte "é"
+
+    first = read_range(draft_path, offset=0, limit=split, unit="bytes")
+    second = read_range(draft_path, offset=first["next_offset"], unit="bytes")
+    assert first["content"] + second["content"] == DRAFT
+    assert first["range"]["end"] == split - 1
+
+
+def test_heading_section(draft_path):
+    result = read_draft_tool("test-blog", heading="setup")
+    assert result["heading"] == "Setup"
+    assert result["heading_line"] == 4
+    # Nested headings belong to the section; the next "##" ends it
+    assert result["content"] == "## Setup\nSetup line 1.\nSetup line 2.\n\n### Details\nNested détails.\n\n"
+
+    paged = read_draft_tool("test-blog", heading="Setup", offset=1, limit=2)
+    assert paged["content"] == "Setup line 1.\nSetup line 2.\n"
+    assert paged["next_offset"] == 3
+
+    missing = read_draft_tool("test-blog", heading="Benchmarks")
+    assert missing["status"] == "error"
+    assert "Available headings" in missing["message"]
+
+
+def test_invalid_range(draft_path):
+    assert read_draft_tool("test-blog", unit="pages", limit=1)["status"] == "error"
+    assert read_draft_tool("test-blog", offset=-1)["status"] == "error"
+
+
+def test_other_read_tools(draft_path):
+    result = read_file_tool(str(draft_path), heading="Results")
+    assert result["content"] == "## Results\nResult line.\n"
+
+    result = read_previous_content_tool("test-blog", limit=1)
+    assert result["content"] == "# Title\n"
+    assert result["total_lines"] == 13
+
+
+def test_organized_draft_ranges_include_journal(draft_path):
+    from blogger.utils.tools import save_section_tool
+
+    (draft_path.parent / "2-draft_organized.md").write_text(DRAFT)
+    save_section_tool("test-blog", "Results", "## Results\nPolished result.")
+
+    result = read_file_tool(str(draft_path.parent / "2-draft_organized.md"), heading="Results")
+    assert result["content"] == "## Results\nPolished result."
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.md"
+    path.write_text("")
+    result = read_range(path, limit=10)
+    assert result["content"] == ""
+    assert result["total_lines"] == 0
+    assert result["has_more"] is False
+
+
+def test_heading_section_skips_fenced_code():
+    doc = b"# Post\n\n## Setup\n\nRun:\n\n```bash\n# install deps\npip install x\n```\n\nThen done.\n\n## Next\nmore\n"
+    result = read_range(doc, heading="Setup")
+    assert result["content"].endswith("Then done.\n\n")
+    assert "# install deps" in result["content"]
+    assert result["has_more"] is False
+    # Lines inside the fence are not offered as headings either
+    with pytest.raises(LookupError) as e:
+        read_range(doc, heading="zzzz")
+    assert "install deps" not in str(e.value)
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from blogger.utils.search_index import SEARCH_INDEX_FILENAME, get_search_index, tokenize, trigrams
+from blogger.utils.tools import infer_blog_id_tool, save_step_tool
+from blogger.utils.workflow_index import INDEX_DIRNAME
+
+
+@pytest.fixture
+def posts_dir(tmp_path, monkeypatch):
+    """Set up a posts directory with three blogs."""
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+
+    blogs = {
+        "my-ai-journey-1": "# My AI Journey\n\n## Getting Started\n",
+        "my-ai-journey-2": "# My AI Journey, Part 2\n\n## Working with AI agents\n",
+        "rust-notes": "# Learning Rust\n\n## Ownership\n\n## Borrowing\n",
+    }
+    for blog_id, draft in blogs.items():
+        (tmp_path / blog_id).mkdir()
+        (tmp_path / blog_id / "draft.md").write_text(draft)
+
+    return tmp_path
+
+
+def test_tokenize_and_trigrams():
+    assert tokenize("The blog about AI-Agents") == ["ai", "agents"]
+    assert trigrams("ai") == {"$ai", "ai$"}
+
+
+def test_hint_matches_heading(posts_dir):
+    result = infer_blog_id_tool("the agents post")
+
+    assert result["status"] == "success"
+    assert result["blog_id"] == "my-ai-journey-2"
+    assert result["confidence"] == "high"
+
+
+def test_hint_matches_title(posts_dir):
+    result = infer_blog_id_tool("learning rust")
+    assert result["blog_id"] == "rust-notes"
+
+    # Fuzzy: trigrams tolerate small spelling differences (with low confidence)
+    result = infer_blog_id_tool("ownershp")
+    assert result["candidates"][0]["blog_id"] == "rust-notes"
+
+
+def test_ambiguous_hint_returns_ranked_candidates(posts_dir):
+    result = infer_blog_id_tool("AI journey")
+
+    assert result["confidence"] == "low"
+    candidate_ids = [c["blog_id"] for c in result["candidates"]]
+    assert set(candidate_ids[:2]) == {"my-ai-journey-1", "my-ai-journey-2"}
+    assert "rust-notes" not in candidate_ids
+    scores = [c["score"] for c in result["candidates"]]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_unmatched_hint_falls_back_to_most_recent(posts_dir):
+    result = infer_blog_id_tool("zzz qqq")
+    assert result["confidence"] == "medium"
+    assert result["reason"] == "Most recently modified blog"
+
+
+def test_index_is_updated_when_step_saved(posts_dir):
+    assert get_search_index(posts_dir).search("kubernetes") == []
+
+    save_step_tool("rust-notes", "1-outline", "# Learning Rust\n\n## Deploying to Kubernetes\n")
+
+    results = get_search_index(posts_dir).search("kubernetes")
+    assert [r["blog_id"] for r in results] == ["rust-notes"]
+
+    data = json.loads((posts_dir / INDEX_DIRNAME / SEARCH_INDEX_FILENAME).read_text())
+    assert "Deploying to Kubernetes" in data["docs"]["rust-notes"]["headings"]
@@ -0,0 +1,104 @@
+import pytest
+
+from blogger.utils import section_check
+from blogger.utils.section_check import section_print
+from blogger.utils.section_journal import read_organized
+from blogger.utils.text_utils import check_heading_order
+from blogger.utils.tools import save_section_tool
+
+OUTLINE = "# Test Blog\n\n## Introduction\n\n## Body Section\n\n## Conclusion\n"
+CONTENT = """# Test Blog
+
+## Introduction
+Intro content here.
+
+## Body Section
+Body content here.
+
+## Conclusion
+Conclusion content.
+"""
+
+
+@pytest.fixture
+def blog(tmp_path, monkeypatch):
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    blog_dir = tmp_path / "test-blog"
+    blog_dir.mkdir()
+    (blog_dir / "2-draft_organized.md").write_text(CONTENT)
+    (blog_dir / "1-outline.md").write_text(OUTLINE)
+    return "test-blog"
+
+
+def test_section_print_ignores_formatting():
+    assert section_print("## Intro\n\n  Text  ") == section_print("## INTRO\nText\n")
+    assert section_print("## Intro\nText")[1] != section_print("## Intro\nOther")[1]
+    assert section_print("## A\n## B")[2] == 2
+
+
+def test_valid_save_is_revalidated(blog, tmp_path):
+    result = save_section_tool("test-blog", "Body Section", "## Body Section\nPolished body.")
+
+    assert result["status"] == "success"
+    assert result["revalidation"] == {"valid": True, "section": 2, "changed": True, "problems": []}
+    # Agrees with the full validation of the document
+    assert check_heading_order(OUTLINE, read_organized(tmp_path / "test-blog")) == (True, "")
+
+    unchanged = save_section_tool("test-blog", "Body Section", "## Body Section\n\nPolished body.")
+    assert unchanged["revalidation"]["changed"] is False
+
+
+def test_renamed_heading_is_flagged(blog):
+    result = save_section_tool("test-blog", "Conclusion", "## Conclusions\nDone.")
+
+    assert result["status"] == "success"
+    revalidation = result["revalidation"]
+    assert revalidation["valid"] is False
+    assert revalidation["problems"] == [
+        "Section #3 is '## conclusions', the outline expects '## conclusion'"
+    ]
+
+    # Later saves keep reporting the tracked problem of the other section
+    later = save_section_tool("test-blog", "Introduction", "## Introduction\nHello.")
+    assert later["revalidation"]["valid"] is False
+    assert later["revalidation"]["problems"][0].startswith("Section #3")
+
+
+def test_extra_heading_shifts_sections(blog):
+    result = save_section_tool("test-blog", "Introduction", "## Introduction\nHi.\n\n## Aside\nMore.")
+
+    assert result["revalidation"]["valid"] is False
+    assert "2 '## ' headings" in result["revalidation"]["problems"][0]
+
+
+def test_only_the_saved_section_is_printed(blog, monkeypatch):
+    save_section_tool("test-blog", "Introduction", "## Introduction\nFirst pass.")
+
+    printed = []
+    original = section_check.section_print
+    monkeypatch.setattr(section_check, "section_print", lambda text: printed.append(text) or original(text))
+    result = save_section_tool("test-blog", "Body Section", "## Body Section\nSecond pass.")
+
+    assert result["revalidation"]["valid"] is True
+    assert printed == ["## Body Section\nSecond pass."]
+
+
+def test_no_outline_no_revalidation(blog, tmp_path):
+    (tmp_path / "test-blog" / "1-outline.md").unlink()
+    result = save_section_tool("test-blog", "Introduction", "## Introduction\nHello.")
+    assert result["status"] == "success"
+    assert "revalidation" not in result
+
+
+def test_fenced_heading_is_not_a_section(blog, tmp_path):
+    polished = "## Body Section\n\nWrite a heading like:\n\n```md\n## Example heading\n```\n"
+
+    result = save_section_tool("test-blog", "Body Section", polished)
+
+    assert result["status"] == "success"
+    assert result["revalidation"]["valid"] is True
+    assert section_print(polished)[::2] == ("## body section", 1)
+    # The journaled document keeps its three sections
+    later = save_section_tool("test-blog", "Conclusion", "## Conclusion\nBye.")
+    assert later["revalidation"] == {"valid": True, "section": 3, "changed": True, "problems": []}
+    assert "## Example heading" in read_organized(tmp_path / "test-blog")
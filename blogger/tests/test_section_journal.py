@@ -0,0 +1,175 @@
+import json
+
+import pytest
+
+from blogger.utils.section_journal import (
+    JOURNAL_FILENAME,
+    STALE_JOURNAL_FILENAME,
+    compact,
+    read_organized,
+    replace_section,
+    save_section,
+)
+from blogger.utils.tools import (
+    finalize_post_tool,
+    read_file_tool,
+    read_section_tool,
+    save_section_tool,
+    save_step_tool,
+)
+
+ORGANIZED = """# Test Blog
+
+## Introduction
+Intro content here.
+
+## Body Section
+Body content here.
+
+## Conclusion
+Conclusion content.
+"""
+
+
+@pytest.fixture
+def blog_dir(tmp_path, monkeypatch):
+    """Set up a blog with an organized draft."""
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    blog_dir = tmp_path / "test-blog"
+    blog_dir.mkdir()
+    (blog_dir / "2-draft_organized.md").write_text(ORGANIZED)
+    return blog_dir
+
+
+def test_saves_append_to_journal(blog_dir):
+    save_section_tool("test-blog", "Body Section", "## Body Section\nPolished body.")
+    save_section_tool("test-blog", "Introduction", "## Introduction\nPolished intro.")
+
+    # The base file is untouched; the journal holds one header + two records
+    assert (blog_dir / "2-draft_organized.md").read_text() == ORGANIZED
+    lines = (blog_dir / JOURNAL_FILENAME).read_text().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[1])["heading"] == "Body Section"
+
+    # Every reader sees the journaled sections
+    expected = replace_section(
+        replace_section(ORGANIZED, 1, "## Body Section\nPolished body."),
+        0, "## Introduction\nPolished intro.",
+    )
+    assert read_organized(blog_dir) == expected
+    assert read_section_tool("test-blog", "Body Section")["section_content"] == "## Body Section\nPolished body."
+    assert read_file_tool(str(blog_dir / "2-draft_organized.md"))["content"] == expected
+
+
+def test_replay_matches_in_place_rewrites(blog_dir):
+    """A fresh process replaying the journal gets the same document."""
+    save_section(blog_dir, 2, "Conclusion", "## Conclusion\nBye.")
+    # A section may be split in two by the Writer: later indices shift
+    save_section(blog_dir, 0, "Introduction", "## Introduction\nHi.\n\n## Motivation\nWhy.")
+    content = save_section(blog_dir, 3, "Conclusion", "## Conclusion\nGoodbye.")
+
+    import blogger.utils.section_journal as section_journal
+    section_journal._views.clear()
+    assert read_organized(blog_dir) == content
+    assert content.endswith("## Conclusion\nGoodbye.")
+    assert "## Motivation\nWhy." in content
+
+
+def test_cached_views_are_bounded(tmp_path, monkeypatch):
+    import blogger.utils.section_journal as section_journal
+
+    monkeypatch.setattr(section_journal, "VIEWS_MAX_CHARS", 2 * len(ORGANIZED))
+    monkeypatch.setattr(section_journal, "_views", section_journal.OrderedDict())
+    blogs = []
+    for i in range(4):
+        blog = tmp_path / f"blog-{i}"
+        blog.mkdir()
+        (blog / "2-draft_organized.md").write_text(ORGANIZED)
+        blogs.append(blog)
+
+    # Bulk reads (search index sync) don't fill the cache
+    for blog in blogs:
+        assert read_organized(blog, remember=False) == ORGANIZED
+    assert not section_journal._views
+
+    # Saves and reads keep the most recently used drafts only
+    for blog in blogs:
+        save_section(blog, 0, "Introduction", "## Introduction\nHi.")
+    assert list(section_journal._views) == blogs[2:]
+    assert "Hi." in read_organized(blogs[0])  # Evicted: replayed again from disk
+
+
+def test_finalize_compacts_journal(blog_dir):
+    save_section_tool("test-blog", "Body Section", "## Body Section\nPolished body.")
+    result = finalize_post_tool("test-blog")
+
+    assert result["status"] == "success"
+    assert not (blog_dir / JOURNAL_FILENAME).exists()
+    assert "Polished body." in (blog_dir / "2-draft_organized.md").read_text()
+    assert "Polished body." in (blog_dir / "3-final.md").read_text()
+    assert compact(blog_dir) is False
+
+
+def test_large_journal_is_compacted(blog_dir, monkeypatch):
+    monkeypatch.setattr("blogger.utils.section_journal.COMPACT_MIN_BYTES", 0)
+    save_section_tool("test-blog", "Body Section", "## Body Section\n" + "Long body. " * 100)
+
+    assert not (blog_dir / JOURNAL_FILENAME).exists()
+    assert "Long body." in (blog_dir / "2-draft_organized.md").read_text()
+
+
+def test_replaced_base_invalidates_journal(blog_dir):
+    save_section_tool("test-blog", "Body Section", "## Body Section\nPolished body.")
+
+    # A new Curator run replaces the organized draft
+    save_step_tool("test-blog", "2-draft_organized", "# New\n\n## Fresh\nText.\n")
+    assert read_organized(blog_dir) == "# New\n\n## Fresh\nText.\n"
+
+    # So does an external editor: a leftover journal doesn't apply to it
+    save_section_tool("test-blog", "Fresh", "## Fresh\nPolished.")
+    (blog_dir / "2-draft_organized.md").write_text("# Edited\n\n## Fresh\nBy hand, longer.\n")
+    assert read_organized(blog_dir) == "# Edited\n\n## Fresh\nBy hand, longer.\n"
+
+
+def test_external_edit_reports_discarded_sections(blog_dir):
+    save_section_tool("test-blog", "Introduction", "## Introduction\nPolished intro.")
+    save_section_tool("test-blog", "Body Section", "## Body Section\nPolished body.")
+
+    # The user edits the stale file on disk, keeping the polished intro only
+    (blog_dir / "2-draft_organized.md").write_text(
+        ORGANIZED.replace("Intro content here.", "Polished intro.") + "\nEdited by hand.\n"
+    )
+    assert "Polished body." not in read_organized(blog_dir)
+
+    # The lost edit is kept aside and reported by the next save
+    stale = (blog_dir / STALE_JOURNAL_FILENAME).read_text()
+    assert "Polished body." in stale
+    assert not (blog_dir / JOURNAL_FILENAME).exists()
+    result = save_section_tool("test-blog", "Conclusion", "## Conclusion\nPolished end.")
+    assert result["status"] == "success"
+    assert result["discarded_sections"] == [{"section": 1, "heading": "Body Section"}]
+    assert "'Body Section'" in result["warning"]
+
+    # Reported once
+    result = save_section_tool("test-blog", "Conclusion", "## Conclusion\nPolished end, again.")
+    assert "discarded_sections" not in result
+
+    # A new Curator run reports the edits it replaces as well
+    result = save_step_tool("test-blog", "2-draft_organized", "# New\n\n## Fresh\nText.\n")
+    assert result["discarded_sections"] == [{"section": 2, "heading": "Conclusion"}]
+
+
+def test_torn_record_is_ignored(blog_dir):
+    save_section_tool("test-blog", "Body Section", "## Body Section\nPolished body.")
+    with open(blog_dir / JOURNAL_FILENAME, "a") as f:
+        f.write('{"section": 0, "heading": "Intro')  # Interrupted append
+
+    import blogger.utils.section_journal as section_journal
+    section_journal._views.clear()
+    assert "Polished body." in read_organized(blog_dir)
+    assert "Intro content here." in read_organized(blog_dir)
+
+    save_section_tool("test-blog", "Conclusion", "## Conclusion\nPolished end.")
+    section_journal._views.clear()
+    content = read_organized(blog_dir)
+    assert "Polished body." in content and "Polished end." in content
@@ -1,6 +1,13 @@
 import pytest
 from pathlib import Path
-from blogger.utils.tools import read_section_tool, save_section_tool, finalize_post_tool, POSTS_DIR
+from blogger.utils.section_journal import read_organized
+from blogger.utils.tools import (
+    POSTS_DIR,
+    check_section_preservation,
+    finalize_post_tool,
+    read_section_tool,
+    save_section_tool,
+)
 
 @pytest.fixture
 def mock_blog(tmp_path, monkeypatch):
@@ -62,8 +69,8 @@ def test_save_section_success(mock_blog):
     
     assert result["status"] == "success"
     
-    # Verify file content
-    updated_content = organized_path.read_text()
+    # Verify content (the section is journaled until the draft is compacted)
+    updated_content = read_organized(organized_path.parent)
     assert "Updated body content." in updated_content
     assert "Intro content here." in updated_content  # Intro preserved
     assert "Conclusion content." in updated_content # Conclusion preserved
@@ -94,3 +101,69 @@ def test_finalize_post_success(mock_blog):
     final_content = final_path.read_text()
     assert "Intro content here." in final_content
     assert "*Generated by AI Blog Partner on" in final_content
+
+
+QUOTED_SECTION = """## Body Section
+Intro line.
+
+> Simplicity is prerequisite for reliability.
+> — Edsger Dijkstra
+
+```python
+def add(a, b):
+    return a + b
+```
+"""
+
+
+@pytest.fixture
+def quoted_blog(mock_blog):
+    blog_id, organized_path = mock_blog
+    content = organized_path.read_text().replace("## Body Section\nBody content here.\nMore body.\n", QUOTED_SECTION)
+    organized_path.write_text(content)
+    return blog_id, organized_path
+
+
+def test_check_section_preservation():
+    polished = QUOTED_SECTION.replace("Intro line.", "A better intro.")
+    assert check_section_preservation(QUOTED_SECTION, polished)["ok"] is True
+
+    # Quote kept inline, code reformatted only by trailing spaces
+    inline = '## Body Section\nAs Dijkstra put it, "Simplicity is prerequisite for reliability."\n\n```python\ndef add(a, b):   \n    return a + b\n```'
+    assert check_section_preservation(QUOTED_SECTION, inline)["ok"] is True
+
+    report = check_section_preservation(QUOTED_SECTION, "## Body Section\n```python\ndef add(a, b):\n    return b + a\n```")
+    assert report["ok"] is False
+    assert report["code_blocks"]["changed"] == ["def add(a, b):"]
+    assert report["code_blocks"]["added"] == 1
+    assert report["quotes"]["missing"] == ["Simplicity is prerequisite for reliability."]
+
+    # Two identical blocks merged into one: one of them is missing
+    block = "```bash\nmake test\n```"
+    report = check_section_preservation(f"## S\n{block}\n\nText.\n\n{block}", f"## S\n{block}\n\nText.")
+    assert report["ok"] is False
+    assert report["code_blocks"]["changed"] == ["make test"]
+    assert report["code_blocks"]["languages"] == ["bash"]
+
+
+def test_save_section_rejects_lost_quote(quoted_blog):
+    blog_id, organized_path = quoted_blog
+    polished = QUOTED_SECTION.split("> Simplicity")[0] + "```python\ndef add(a, b):\n    return a + b\n```"
+
+    result = save_section_tool(blog_id, "Body Section", polished)
+    assert result["status"] == "error"
+    assert result["preservation"]["quotes"]["missing"] == ["Simplicity is prerequisite for reliability."]
+    assert "Simplicity" in read_organized(organized_path.parent)  # Not saved
+
+    result = save_section_tool(blog_id, "Body Section", polished, allow_changes=True)
+    assert result["status"] == "success"
+    assert result["preservation"]["ok"] is False
+    assert "Simplicity" not in read_organized(organized_path.parent)
+
+
+def test_save_section_keeps_code_and_quotes(quoted_blog):
+    blog_id, _ = quoted_blog
+    result = save_section_tool(blog_id, "Body Section", QUOTED_SECTION.replace("Intro line.", "Better intro."))
+    assert result["status"] == "success"
+    assert result["preservation"]["ok"] is True
+    assert result["preservation"]["code_blocks"]["languages"] == ["python"]
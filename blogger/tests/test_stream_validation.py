@@ -0,0 +1,98 @@
+import random
+import tracemalloc
+
+import pytest
+
+from blogger.utils import stream_validation
+from blogger.utils.stream_validation import (
+    check_content_integrity_stream,
+    check_reorganization_integrity_stream,
+    stream_fingerprints,
+)
+from blogger.utils.fingerprints import fingerprint_lines
+from blogger.utils.text_utils import check_content_integrity, check_reorganization_integrity
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_runs_are_merged(monkeypatch):
+    monkeypatch.setattr(stream_validation, "RUN_LINES", 3)
+    text = "\n".join(f"line {i % 7}" for i in range(40))
+    assert stream_fingerprints(text.split("\n")) == fingerprint_lines(text)
+
+
+def test_paths_split_on_newlines_only(tmp_path):
+    text = "Alpha\r\nBeta\rGamma\n\n  delta  "
+    path = tmp_path / "doc.md"
+    path.write_bytes(text.encode("utf-8"))
+    assert stream_fingerprints(path) == fingerprint_lines(text)
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_content_stream_matches_in_memory_check(tmp_path, seed):
+    rng = random.Random(seed)
+    lines = [f"Paragraph {i} text" for i in range(40)]
+    ok = [l for l in lines if rng.random() < 0.5]
+    not_ok = [l for l in lines if l not in ok]
+    action = rng.choice(["none", "drop", "add", "dup"])
+    if action == "drop" and ok:
+        ok.pop(rng.randrange(len(ok)))
+    elif action == "add":
+        not_ok.append("Invented paragraph")
+    elif action == "dup" and ok:
+        not_ok.append(ok[0])
+    texts = ["\n\n".join(lines), "\n\n".join(ok), "\n\n".join(not_ok)]
+    paths = [_write(tmp_path / f"{name}.md", text) for name, text in zip("abc", texts)]
+
+    expected = check_content_integrity(*texts, fingerprint=False)
+    from_paths = check_content_integrity_stream(*paths)
+    from_iterators = check_content_integrity_stream(*(iter(t.split("\n")) for t in texts))
+
+    assert from_paths[0] == from_iterators[0] == expected[0]
+    assert from_paths[1].split("(e.g.")[0] == expected[1].split("(e.g.")[0]
+    assert from_iterators[1] == expected[1].split(" (e.g.")[0]
+
+
+def test_reorganization_stream(tmp_path):
+    outline = _write(tmp_path / "outline.md", "# Title\n\n## Intro\nOutline notes\n\n## End")
+    draft = ["First", "Second"]
+    good = "# Title\n\n## Intro\n\nFirst\n\n## End\n\nSecond"
+    bad = "# Title\n\n## Intro\n\nFirst\n\nOutline notes"
+
+    assert check_reorganization_integrity_stream(draft, outline, good.split("\n")) == (True, "")
+    valid, message = check_reorganization_integrity_stream(draft, outline, _write(tmp_path / "bad.md", bad))
+    expected = check_reorganization_integrity("First\nSecond", outline.read_text(), bad)
+    assert not valid and message.split("(e.g.")[0] == expected[1].split("(e.g.")[0]
+    assert "outline notes" in check_reorganization_integrity_stream(
+        draft, outline, _write(tmp_path / "bad2.md", good + "\n\nOutline notes")
+    )[1]
+
+
+def _peak_memory(path):
+    tracemalloc.start()
+    try:
+        valid, _ = check_content_integrity_stream(path, path, [])
+        return valid, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory_follows_distinct_lines_not_input_size(tmp_path):
+    distinct = 20_000
+    paths = {}
+    for repeats in (1, 8):
+        path = paths[repeats] = tmp_path / f"draft-{repeats}.md"
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(distinct * repeats):
+                f.write(f"Transcript paragraph {i % distinct} with some filler text to make it longer\n\n")
+
+    small_valid, small_peak = _peak_memory(paths[1])
+    large_valid, large_peak = _peak_memory(paths[8])
+
+    assert small_valid and large_valid
+    # 8x the input, same distinct lines: the peak barely moves (the input is ~12MB)
+    assert large_peak < small_peak * 1.5
+    assert large_peak < paths[8].stat().st_size / 4
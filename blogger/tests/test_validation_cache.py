@@ -0,0 +1,65 @@
+import pytest
+
+from blogger.utils import validation_cache
+from blogger.utils.text_utils import check_content_integrity, normalize_and_split
+from blogger.utils.tools import validate_content_split_tool, validate_organization_tool
+from blogger.utils.validation_cache import HashCache, cache_stats, content_hash, normalized_lines
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    validation_cache.clear_caches()
+    yield
+    validation_cache.clear_caches()
+
+
+def test_content_hash():
+    assert content_hash("abc") == content_hash("abc")
+    assert content_hash("abc") != content_hash("abd")
+    assert len(content_hash("")) == 32
+
+
+def test_line_sets_are_shared_between_checks():
+    original = "Intro\n\nBody line\n\nConclusion"
+    check_content_integrity(original, "Intro\n\nBody line", "Conclusion")
+    check_content_integrity(original, "Intro", "Body line\n\nConclusion")
+
+    stats = cache_stats()["line_sets"]
+    # 5 distinct texts; the original is normalized only once
+    assert stats["misses"] == 5
+    assert stats["hits"] == 1
+    assert normalized_lines(original, normalize_and_split) == frozenset({"intro", "body line", "conclusion"})
+
+
+def test_repeated_validation_reuses_the_verdict():
+    args = ("A\n\nB\n\nC", "A\n\nB", "C")
+    first = validate_content_split_tool(*args)
+    second = validate_content_split_tool(*args)
+
+    assert first == second and first["valid"] is True
+    verdicts = cache_stats()["verdicts"]
+    assert verdicts == {"hits": 1, "misses": 1, "entries": 1, "weight": 1}
+
+    # Different inputs get their own verdict
+    assert validate_content_split_tool("A\n\nB\n\nC", "A", "C")["valid"] is False
+
+
+def test_organization_verdict_cached():
+    outline = "# T\n\n## Intro\n\n## End"
+    organized = "# T\n\n## Intro\n\nText\n\n## End"
+    first = validate_organization_tool("Text", outline, organized)
+    second = validate_organization_tool("Text", outline, organized)
+    assert first == second and first["valid"] is True
+    assert cache_stats()["verdicts"]["hits"] == 1
+
+    bad = validate_organization_tool("Text", outline, "# T\n\n## End\n\nText\n\n## Intro")
+    assert bad["checks"] == {"integrity": True, "heading_order": False, "outline_structure": False}
+
+
+def test_hash_cache_evicts_by_weight():
+    cache = HashCache(max_weight=10)
+    cache.get_or_compute("a", lambda: 1, weight=6)
+    cache.get_or_compute("b", lambda: 2, weight=6)  # Evicts "a"
+    assert cache.get_or_compute("a", lambda: 3, weight=6) == 3
+    assert cache.get_or_compute("big", lambda: 4, weight=11) == 4  # Not stored
+    assert cache.stats()["entries"] == 1
@@ -5,7 +5,10 @@ These tests verify that the validation tool wrappers return the correct
 dict structure for use by the Curator agent.
 """
 
+import pytest
+
 from blogger.utils.tools import (
+    save_step_tool,
     validate_content_split_tool,
     validate_organization_tool,
 )
@@ -327,3 +330,79 @@ This approach works well.
         assert result["valid"] is True
         assert result["checks"]["integrity"] is True
         assert result["checks"]["heading_order"] is True
+
+
+@pytest.fixture
+def saved_blog(tmp_path, monkeypatch):
+    """A blog with its draft, split and outline saved."""
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    blog_dir = tmp_path / "ref-blog"
+    blog_dir.mkdir()
+    (blog_dir / "draft.md").write_text("Intro text\n\nBody text\n\nTangent")
+    (blog_dir / "draft_ok.md").write_text("Intro text\n\nBody text")
+    (blog_dir / "draft_not_ok.md").write_text("Tangent")
+    (blog_dir / "1-outline.md").write_text("# Post\n\n## Intro\n\n## Body")
+    return "ref-blog", blog_dir
+
+
+class TestStepReferences:
+    """Validation and saving by blog_id + step instead of full text."""
+
+    def test_split_read_from_saved_steps(self, saved_blog):
+        blog_id, _ = saved_blog
+        result = validate_content_split_tool(blog_id=blog_id)
+        assert result["valid"] is True
+        assert result["content_refs"] == {}
+
+    def test_only_new_texts_are_sent(self, saved_blog):
+        blog_id, _ = saved_blog
+        result = validate_content_split_tool(
+            split_part1="Intro text", split_part2="Body text\n\nTangent", blog_id=blog_id
+        )
+        assert result["valid"] is True
+        assert set(result["content_refs"]) == {"split_part1", "split_part2"}
+
+        result = validate_content_split_tool(split_part1="Intro text", blog_id=blog_id)
+        assert result["valid"] is False  # "Body text" lost (part 2 read from draft_not_ok)
+
+    def test_explicit_step_names(self, saved_blog):
+        blog_id, blog_dir = saved_blog
+        (blog_dir / "outline_v2.md").write_text("# Post\n\n## Body\n\n## Intro")
+        organized = "# Post\n\n## Intro\n\nIntro text\n\n## Body\n\nBody text"
+
+        assert validate_organization_tool(organized_content=organized, blog_id=blog_id)["valid"] is True
+        result = validate_organization_tool(
+            organized_content=organized, blog_id=blog_id, outline_step="outline_v2"
+        )
+        assert result["checks"]["heading_order"] is False
+
+    def test_missing_inputs(self, saved_blog):
+        blog_id, _ = saved_blog
+        result = validate_organization_tool(draft_ok="x", outline="y")
+        assert result["status"] == "error" and "organized_content" in result["message"]
+        result = validate_organization_tool(blog_id=blog_id)  # Nothing organized yet
+        assert result["status"] == "error" and "2-draft_organized" in result["message"]
+
+    def test_save_validated_text_by_reference(self, saved_blog):
+        blog_id, blog_dir = saved_blog
+        organized = "# Post\n\n## Intro\n\nIntro text\n\n## Body\n\nBody text"
+        result = validate_organization_tool(organized_content=organized, blog_id=blog_id)
+        ref = result["content_refs"]["organized_content"]
+
+        saved = save_step_tool(blog_id, "2-draft_organized", content_ref=ref)
+        assert saved["status"] == "success"
+        assert (blog_dir / "2-draft_organized.md").read_text() == organized
+
+        # Saved steps can now be validated by reference alone
+        assert validate_organization_tool(blog_id=blog_id)["valid"] is True
+
+    def test_save_copy_of_step(self, saved_blog):
+        blog_id, blog_dir = saved_blog
+        assert save_step_tool(blog_id, "outline_backup", source_step="1-outline")["status"] == "success"
+        assert (blog_dir / "outline_backup.md").read_text() == (blog_dir / "1-outline.md").read_text()
+
+    def test_save_requires_exactly_one_source(self, saved_blog):
+        blog_id, _ = saved_blog
+        assert save_step_tool(blog_id, "x")["status"] == "error"
+        assert save_step_tool(blog_id, "x", content="a", source_step="draft")["status"] == "error"
+        assert save_step_tool(blog_id, "x", content_ref="0" * 16)["status"] == "error"
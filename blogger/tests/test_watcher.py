@@ -0,0 +1,109 @@
+import sys
+import time
+
+import pytest
+
+from blogger.utils.tools import get_workflow_status_tool, read_draft_tool, save_step_tool
+from blogger.utils.watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    get_posts_watcher,
+    start_posts_watcher,
+    stop_posts_watcher,
+)
+from blogger.utils.workflow_index import get_workflow_index
+
+BACKENDS = ["polling"]
+if sys.platform.startswith("linux"):
+    BACKENDS.append("inotify")
+
+
+def wait_for(condition, timeout=5.0):
+    """Poll until condition() is true (watchers report changes asynchronously)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture(params=BACKENDS)
+def watched_posts(request, tmp_path, monkeypatch):
+    """A posts directory with one blog and a running watcher."""
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+    (tmp_path / "first-post").mkdir()
+    (tmp_path / "first-post" / "draft.md").write_text("# First\n")
+
+    watcher = start_posts_watcher(tmp_path, backend=request.param, interval=0.05)
+    yield tmp_path, watcher
+    stop_posts_watcher(tmp_path)
+
+
+def test_backend_selection(watched_posts):
+    posts_dir, watcher = watched_posts
+    assert isinstance(watcher, (InotifyWatcher, PollingWatcher))
+    assert get_posts_watcher(posts_dir) is watcher
+    assert start_posts_watcher(posts_dir) is watcher
+
+
+def test_status_follows_external_changes(watched_posts):
+    posts_dir, _ = watched_posts
+    assert get_workflow_status_tool()["total_blogs"] == 1
+
+    (posts_dir / "second-post").mkdir()
+    (posts_dir / "second-post" / "draft.md").write_text("# Second\n")
+    (posts_dir / "first-post" / "1-outline.md").write_text("## Intro\n")
+
+    def updated():
+        blogs = {b["blog_id"]: b for b in get_workflow_status_tool()["blogs"]}
+        return (
+            "second-post" in blogs
+            and blogs["first-post"]["next_action"] == "Run Curator (Step 2)"
+        )
+
+    assert wait_for(updated)
+
+
+def test_only_reported_blogs_are_rescanned(watched_posts, monkeypatch):
+    posts_dir, watcher = watched_posts
+    (posts_dir / "second-post").mkdir()
+    index = get_workflow_index(posts_dir)
+    assert wait_for(lambda: "second-post" in index.refresh())
+
+    scanned = []
+    import blogger.utils.workflow_index as workflow_index
+    original_scan = workflow_index.scan_blog
+    monkeypatch.setattr(
+        workflow_index, "scan_blog",
+        lambda blog_dir: scanned.append(blog_dir.name) or original_scan(blog_dir),
+    )
+
+    # Let any pending events for the setup settle, then check a quiet refresh
+    time.sleep(0.2)
+    index.refresh()
+    scanned.clear()
+    index.refresh()
+    assert scanned == []
+
+    (posts_dir / "second-post" / "draft.md").write_text("# Second\n")
+    assert wait_for(lambda: index.refresh()["second-post"]["files"]["draft"])
+    assert set(scanned) == {"second-post"}
+
+
+def test_reads_are_served_from_memory_until_changed(watched_posts):
+    posts_dir, watcher = watched_posts
+    draft_path = posts_dir / "first-post" / "draft.md"
+
+    assert read_draft_tool("first-post")["content"] == "# First\n"
+    assert draft_path in watcher._contents
+
+    # Our own saves are visible immediately
+    save_step_tool("first-post", "draft", "# First, edited\n")
+    assert read_draft_tool("first-post")["content"] == "# First, edited\n"
+
+    # External edits are picked up once the watcher reports them
+    draft_path.write_text("# First, edited outside\n")
+    assert wait_for(
+        lambda: read_draft_tool("first-post")["content"] == "# First, edited outside\n"
+    )
@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+from blogger.utils.tools import get_workflow_status_tool, save_step_tool
+from blogger.utils.workflow_index import INDEX_DIRNAME, INDEX_FILENAME, WorkflowIndex
+
+
+@pytest.fixture
+def posts_dir(tmp_path, monkeypatch):
+    """Set up a posts directory with two blogs at different steps."""
+    monkeypatch.setattr("blogger.utils.tools.POSTS_DIR", tmp_path)
+
+    old = tmp_path / "old-post"
+    old.mkdir()
+    (old / "draft.md").write_text("# Old\n")
+    (old / "1-outline.md").write_text("# Old\n\n## Intro\n")
+    os.utime(old / "draft.md", (1_000_000, 1_000_000))
+    os.utime(old / "1-outline.md", (1_000_000, 1_000_000))
+
+    new = tmp_path / "new-post"
+    new.mkdir()
+    (new / "draft.md").write_text("# New\n")
+
+    return tmp_path
+
+
+def test_status_matches_file_system(posts_dir):
+    result = get_workflow_status_tool()
+
+    assert result["status"] == "success"
+    assert result["total_blogs"] == 2
+    assert result["recommended"] == "new-post"
+
+    blogs = {b["blog_id"]: b for b in result["blogs"]}
+    assert blogs["old-post"]["current_step"] == 2
+    assert blogs["old-post"]["completed_steps"] == [1]
+    assert blogs["old-post"]["next_action"] == "Run Curator (Step 2)"
+    assert blogs["new-post"]["current_step"] == 1
+    assert blogs["new-post"]["files"]["draft"] is True
+    assert blogs["new-post"]["files"]["outline"] is False
+
+
+def test_index_is_persisted_and_hidden_dir_skipped(posts_dir):
+    get_workflow_status_tool()
+
+    index_path = posts_dir / INDEX_DIRNAME / INDEX_FILENAME
+    assert index_path.exists()
+    data = json.loads(index_path.read_text())
+    assert set(data["blogs"]) == {"old-post", "new-post"}
+
+    # A second call must not report the index directory as a blog
+    assert get_workflow_status_tool()["total_blogs"] == 2
+
+
+def test_new_files_are_picked_up(posts_dir):
+    get_workflow_status_tool()
+
+    (posts_dir / "old-post" / "2-draft_organized.md").write_text("## Intro\n")
+    (posts_dir / "third-post").mkdir()
+
+    result = get_workflow_status_tool()
+    blogs = {b["blog_id"]: b for b in result["blogs"]}
+    assert result["total_blogs"] == 3
+    assert blogs["old-post"]["next_action"] == "Run Writer (Step 3)"
+    assert blogs["third-post"]["current_step"] == 0
+
+
+def test_save_step_updates_index(posts_dir):
+    get_workflow_status_tool()
+
+    save_step_tool("new-post", "1-outline", "# New\n\n## Intro\n")
+
+    data = json.loads((posts_dir / INDEX_DIRNAME / INDEX_FILENAME).read_text())
+    assert data["blogs"]["new-post"]["files"]["outline"] is True
+    assert data["blogs"]["new-post"]["current_step"] == 2
+
+
+def test_unchanged_blogs_are_not_rescanned(posts_dir, monkeypatch):
+    index = WorkflowIndex(posts_dir)
+    index.refresh()
+
+    # Make every entry look settled (outside the racy window)
+    for entry in index.blogs.values():
+        entry["scanned_ns"] = entry["dir_mtime_ns"] + 10 * 10**9
+    index._containers_scanned_ns = max(index._containers.values()) + 10 * 10**9
+
+    scanned = []
+    import blogger.utils.workflow_index as workflow_index
+    original_scan = workflow_index.scan_blog
+    monkeypatch.setattr(
+        workflow_index, "scan_blog",
+        lambda blog_dir: scanned.append(blog_dir.name) or original_scan(blog_dir),
+    )
+
+    index.refresh()
+    assert scanned == []
+
+    (posts_dir / "old-post" / "3-final.md").write_text("Done")
+    entries = index.refresh()
+    assert scanned == ["old-post"]
+    assert entries["old-post"]["next_action"] == "Complete!"
+
+
+def test_status_limit_returns_most_recent(posts_dir):
+    result = get_workflow_status_tool(limit=1)
+
+    assert [b["blog_id"] for b in result["blogs"]] == ["new-post"]
+    assert result["total_blogs"] == 2
+    assert result["matched_blogs"] == 2
+
+
+def test_status_filters(posts_dir):
+    result = get_workflow_status_tool(status="in_progress")
+    assert [b["blog_id"] for b in result["blogs"]] == ["old-post"]
+
+    result = get_workflow_status_tool(step=1)
+    assert [b["blog_id"] for b in result["blogs"]] == ["new-post"]
+
+    result = get_workflow_status_tool(since="2000-01-01")
+    assert [b["blog_id"] for b in result["blogs"]] == ["new-post"]
+    assert result["matched_blogs"] == 1
+
+    result = get_workflow_status_tool(status="complete")
+    assert result["blogs"] == []
+    assert result["recommended"] is None
+
+
+def test_status_invalid_filters(posts_dir):
+    assert get_workflow_status_tool(status="done")["status"] == "error"
+    assert get_workflow_status_tool(since="last week")["status"] == "error"
@@ -0,0 +1,96 @@
+"""
+Async variants of the file and network tools.
+
+ADK calls plain (sync) function tools directly on the event loop, so a
+fetch_webpage_tool call waiting on a slow server, or a read of a large
+draft, stalls every other `adk web` session served by that loop. The
+agents register the coroutine versions defined here instead: each call is
+offloaded to a bounded thread pool and the loop keeps serving other
+sessions meanwhile.
+
+The wrappers keep the name, docstring and signature of the sync tool, so
+the model sees exactly the same function declarations. The sync tools in
+tools.py remain the implementation (and what tests and scripts call).
+
+Pool size: BLOGGER_TOOL_THREADS (default 8).
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from blogger.utils import tools
+
+DEFAULT_TOOL_THREADS = 8
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool used by the async tools (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = int(os.environ.get("BLOGGER_TOOL_THREADS", DEFAULT_TOOL_THREADS))
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, workers),
+                thread_name_prefix="blogger-tool",
+            )
+        return _executor
+
+
+def make_async(func):
+    """
+    Wrap a sync tool into a coroutine function running it in the tool pool.
+
+    Args:
+        func: Sync tool function
+
+    Returns:
+        Async function with the same name, docstring and signature
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the caller's context (e.g. tracing context vars)
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(get_tool_executor(), call)
+
+    return wrapper
+
+
+# Workflow discovery
+get_workflow_status_tool = make_async(tools.get_workflow_status_tool)
+infer_blog_id_tool = make_async(tools.infer_blog_id_tool)
+get_blog_context_tool = make_async(tools.get_blog_context_tool)
+
+# Reading and saving steps
+read_draft_tool = make_async(tools.read_draft_tool)
+read_file_tool = make_async(tools.read_file_tool)
+read_previous_content_tool = make_async(tools.read_previous_content_tool)
+save_step_tool = make_async(tools.save_step_tool)
+fetch_webpage_tool = make_async(tools.fetch_webpage_tool)
+fetch_webpages_tool = make_async(tools.fetch_webpages_tool)
+
+# Sections
+read_section_tool = make_async(tools.read_section_tool)
+save_section_tool = make_async(tools.save_section_tool)
+finalize_post_tool = make_async(tools.finalize_post_tool)
+
+# Version history
+list_versions_tool = make_async(tools.list_versions_tool)
+read_version_tool = make_async(tools.read_version_tool)
+
+# Validation (reads the step files, normalizes whole drafts)
+validate_content_split_tool = make_async(tools.validate_content_split_tool)
+validate_organization_tool = make_async(tools.validate_organization_tool)
+validate_candidates_tool = make_async(tools.validate_candidates_tool)
+
+# Analysis
+save_analysis_tool = make_async(tools.save_analysis_tool)
+read_analysis_tool = make_async(tools.read_analysis_tool)
@@ -0,0 +1,156 @@
+"""
+Validate several candidate splits or organizations in one call.
+
+When the Curator hesitates between candidate splits (or organizations) it
+used to validate each one in its own model turn, re-normalizing the same
+original every time. validate_candidates normalizes the reference texts
+once, checks every candidate against them and ranks the results:
+
+    ranking = validate_candidates("split", ["draft text"], [(part1, part2), ...])
+    ranking = validate_candidates("organization", [draft_ok, outline], [organized, ...])
+
+Large batches run in a process pool (the checks are CPU-bound and hold the
+GIL). The normalized reference goes to each worker once, through the pool
+initializer, not with every candidate. Small batches are checked in-process,
+where starting workers would cost more than it saves.
+
+Workers are forked where the platform allows it (no re-import of the
+agents). A fork copies the locks of the shared caches (validation_cache)
+in whatever state another thread held them, so the worker path never
+touches them: _check only calls uncached functions (normalize_and_split,
+the ParsedMarkdown constructor, check_*_sets and check_heading_lists),
+never parse_markdown or a cached check.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from blogger.utils.markdown_model import ParsedMarkdown
+from blogger.utils.text_utils import (
+    check_content_integrity_sets,
+    check_heading_lists,
+    check_reorganization_integrity_sets,
+    normalize_and_split,
+)
+
+CANDIDATE_KINDS = ("split", "organization")
+
+# Candidates accepted per batch
+BATCH_MAX_CANDIDATES = 16
+
+# Worker processes (the pool is only used with 2+)
+BATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+# Batches smaller than this (total characters) are checked in-process
+PROCESS_MIN_CHARS = 256 * 1024
+
+# Reference data of a worker process, set once by _init_worker
+_reference = None
+
+
+def _prepare(kind: str, references: list[str]) -> dict:
+    """Normalized form of the reference texts, computed once per batch."""
+    if kind == "split":
+        (original,) = references
+        return {"kind": kind, "raw": frozenset(normalize_and_split(original))}
+    draft_ok, outline = references
+    outline = ParsedMarkdown(outline)
+    return {
+        "kind": kind,
+        "expected": frozenset(normalize_and_split(draft_ok)) | outline.hash_lines,
+        "outline_headings": outline.heading_lines(2),
+    }
+
+
+def _check(reference: dict, candidate) -> dict:
+    """Verdict and problem counts of one candidate (runs in forked workers: no caches)."""
+    if reference["kind"] == "split":
+        raw = reference["raw"]
+        ok = frozenset(normalize_and_split(candidate[0]))
+        not_ok = frozenset(normalize_and_split(candidate[1]))
+        combined = ok | not_ok
+        valid, message = check_content_integrity_sets(raw, ok, not_ok)
+        return {
+            "valid": valid,
+            "message": message,
+            "lost": len(raw - combined),
+            "added": len(combined - raw),
+            "duplicated": len(ok & not_ok),
+        }
+
+    expected = reference["expected"]
+    organized = ParsedMarkdown(candidate)
+    valid, message = check_reorganization_integrity_sets(expected, organized.line_set)
+    heading_valid, heading_msg = check_heading_lists(
+        reference["outline_headings"], organized.heading_lines(2)
+    )
+    return {
+        "valid": valid and heading_valid,
+        "message": "; ".join(m for m in (message, heading_msg) if m),
+        "lost": len(expected - organized.line_set),
+        "added": len(organized.line_set - expected),
+        "heading_order": heading_valid,
+    }
+
+
+def _init_worker(reference: dict) -> None:
+    global _reference
+    _reference = reference
+
+
+def _check_in_worker(candidate) -> dict:
+    return _check(_reference, candidate)
+
+
+def _rank_key(result: dict) -> tuple:
+    """Valid first, then fewest lost/added/duplicated lines, then input order."""
+    problems = result["lost"] + result["added"] + result.get("duplicated", 0)
+    return (not result["valid"], problems, not result.get("heading_order", True), result["candidate"])
+
+
+def _pool_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else None)
+
+
+def validate_candidates(kind: str, references: list[str], candidates: list) -> list[dict]:
+    """
+    Check candidates against one set of reference texts and rank them.
+
+    Args:
+        kind: "split" (references [original], candidates (part1, part2)) or
+            "organization" (references [draft_ok, outline], candidates organized texts)
+        references: Reference texts, normalized once
+        candidates: Candidates, in input order
+
+    Returns:
+        [{"candidate": index, "valid", "message", "lost", "added",
+          "duplicated" (split) | "heading_order" (organization)}], best first
+
+    Example:
+        >>> ranking = validate_candidates("split", ["A\\nB"], [("A", ""), ("A", "B")])
+        >>> [(r["candidate"], r["valid"], r["lost"]) for r in ranking]
+        [(1, True, 0), (0, False, 1)]
+    """
+    if kind not in CANDIDATE_KINDS:
+        raise ValueError(f"Unknown candidate kind '{kind}' (expected one of {', '.join(CANDIDATE_KINDS)})")
+    reference = _prepare(kind, references)
+
+    size = sum(len(text) for text in references)
+    size += sum(len(part) for c in candidates for part in (c if kind == "split" else (c,)))
+    workers = min(BATCH_WORKERS, len(candidates))
+    if workers > 1 and size >= PROCESS_MIN_CHARS:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=_pool_context(),
+            initializer=_init_worker,
+            initargs=(reference,),
+        ) as pool:
+            results = list(pool.map(_check_in_worker, candidates))
+    else:
+        results = [_check(reference, candidate) for candidate in candidates]
+
+    for index, result in enumerate(results):
+        result["candidate"] = index
+    return sorted(results, key=_rank_key)
@@ -0,0 +1,316 @@
+"""
+Content-addressed store for step and section versions.
+
+Every save_step_tool / save_section_tool call records the saved text as a
+version of a named ref ("1-outline", "section:Introduction", ...) so earlier
+versions stay available without copies like outline_v1.md or
+section-4-back.md piling up next to the draft.
+
+Layout under posts/.history/:
+
+    objects/<sha256[:2]>/<sha256[2:]>   one file per distinct content
+    refs/<blog_id>.json                 {"refs": {name: [version, ...]}}
+
+Unlike posts/.blogger/ (caches, rebuilt on demand and not committed), the
+history cannot be rebuilt from the posts: it lives in its own directory,
+which is kept under version control with the posts.
+
+Blobs are named by the SHA-256 of their content, so identical text (the same
+section saved twice, two blogs sharing a paragraph block) is stored once.
+Blobs larger than COMPRESS_MIN_BYTES are zlib-compressed when that saves
+space; a one-byte header tells readers which encoding was used.
+
+Show usage or drop unreferenced blobs with:
+
+    python -m blogger.utils.blob_store stats
+    python -m blogger.utils.blob_store gc
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+
+HISTORY_DIRNAME = ".history"
+OBJECTS_DIRNAME = "objects"
+REFS_DIRNAME = "refs"
+
+# Blob encodings (first byte of each object file)
+RAW = b"r"
+ZLIB = b"z"
+
+# Compressing tiny blobs costs more than it saves
+COMPRESS_MIN_BYTES = 512
+
+# Prefix of the refs used for sections saved by the Writer
+SECTION_REF_PREFIX = "section:"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class BlobStore:
+    """Deduplicated blobs plus per-blog named refs, under posts/.history/."""
+
+    def __init__(self, posts_dir: Path, compress: bool = True):
+        self.root = Path(posts_dir) / HISTORY_DIRNAME
+        self.objects_dir = self.root / OBJECTS_DIRNAME
+        self.refs_dir = self.root / REFS_DIRNAME
+        self.compress = compress
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return self._object_path(digest).exists()
+
+    def put(self, data: bytes) -> str:
+        """
+        Store a blob (no-op if identical content is already stored).
+
+        Args:
+            data: Raw content
+
+        Returns:
+            The SHA-256 hex digest naming the blob
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest
+
+        encoded = RAW + data
+        if self.compress and len(data) >= COMPRESS_MIN_BYTES:
+            compressed = zlib.compress(data, 6)
+            if len(compressed) < len(data):
+                encoded = ZLIB + compressed
+        _atomic_write(path, encoded)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        Read a blob back.
+
+        Raises:
+            FileNotFoundError: If no such blob is stored
+            ValueError: If the blob is corrupt
+        """
+        with open(self._object_path(digest), "rb") as f:
+            encoded = f.read()
+
+        encoding, payload = encoded[:1], encoded[1:]
+        if encoding == ZLIB:
+            data = zlib.decompress(payload)
+        elif encoding == RAW:
+            data = payload
+        else:
+            raise ValueError(f"Unknown blob encoding in {digest}")
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Blob {digest} is corrupt")
+        return data
+
+    # ------------------------------------------------------------------
+    # Refs
+    # ------------------------------------------------------------------
+
+    def _refs_path(self, blog_id: str) -> Path:
+        return self.refs_dir / f"{blog_id}.json"
+
+    def _load_refs(self, blog_id: str) -> dict:
+        try:
+            with open(self._refs_path(blog_id), "r") as f:
+                return json.load(f).get("refs", {})
+        except FileNotFoundError:
+            return {}
+
+    def record(self, blog_id: str, ref: str, text: str) -> dict:
+        """
+        Store text as the newest version of a ref.
+
+        Saving the same text as the current version adds no new version.
+
+        Args:
+            blog_id: Blog the ref belongs to
+            ref: Ref name (e.g. "1-outline", "section:Introduction")
+            text: Content to store
+
+        Returns:
+            {"ref": "...", "version": int, "digest": "...", "size": int, "new_version": bool}
+        """
+        data = text.encode("utf-8")
+        with self._lock:  # Held across put() so gc() can't drop the new blob
+            digest = self.put(data)
+            refs = self._load_refs(blog_id)
+            history = refs.setdefault(ref, [])
+            new_version = not history or history[-1]["digest"] != digest
+            if new_version:
+                history.append({"digest": digest, "size": len(data), "saved_at": time.time()})
+                _atomic_write(
+                    self._refs_path(blog_id),
+                    json.dumps({"refs": refs}, indent=1).encode("utf-8"),
+                )
+
+        return {
+            "ref": ref,
+            "version": len(history),
+            "digest": digest,
+            "size": len(data),
+            "new_version": new_version,
+        }
+
+    def versions(self, blog_id: str) -> dict:
+        """All refs of a blog: {ref: [{"digest", "size", "saved_at"}, ...]}, oldest first."""
+        return self._load_refs(blog_id)
+
+    def read(self, blog_id: str, ref: str, version: int = None) -> tuple[str, dict]:
+        """
+        Read one version of a ref.
+
+        Args:
+            blog_id: Blog the ref belongs to
+            ref: Ref name
+            version: 1-based version number; negative counts from the latest
+                (-1 = latest, -2 = the one before); None = latest
+
+        Returns:
+            (text, version info)
+
+        Raises:
+            KeyError: Unknown ref
+            IndexError: Unknown version
+        """
+        history = self._load_refs(blog_id)[ref]
+        if version is None:
+            version = -1
+        index = version - 1 if version > 0 else len(history) + version
+        if not 0 <= index < len(history):
+            raise IndexError(f"Version {version} not found (ref '{ref}' has {len(history)})")
+
+        info = dict(history[index], version=index + 1)
+        return self.get(info["digest"]).decode("utf-8"), info
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _blob_paths(self):
+        if not self.objects_dir.is_dir():
+            return
+        for shard in os.scandir(self.objects_dir):
+            if shard.is_dir():
+                for entry in os.scandir(shard.path):
+                    if not entry.name.startswith("."):
+                        yield shard.name + entry.name, Path(entry.path)
+
+    def _referenced(self) -> set[str]:
+        digests = set()
+        if self.refs_dir.is_dir():
+            for path in self.refs_dir.glob("*.json"):
+                with open(path, "r") as f:
+                    for history in json.load(f).get("refs", {}).values():
+                        digests.update(v["digest"] for v in history)
+        return digests
+
+    def stats(self) -> dict:
+        """
+        Summarize storage use.
+
+        Returns:
+            {"blobs": int, "stored_bytes": int, "versions": int, "logical_bytes": int}
+            where logical_bytes is what keeping every version as a file would take
+        """
+        blobs = 0
+        stored = 0
+        for _, path in self._blob_paths():
+            blobs += 1
+            stored += path.stat().st_size
+
+        versions = 0
+        logical = 0
+        if self.refs_dir.is_dir():
+            for path in self.refs_dir.glob("*.json"):
+                with open(path, "r") as f:
+                    for history in json.load(f).get("refs", {}).values():
+                        versions += len(history)
+                        logical += sum(v["size"] for v in history)
+
+        return {"blobs": blobs, "stored_bytes": stored, "versions": versions, "logical_bytes": logical}
+
+    def gc(self) -> int:
+        """Delete blobs no ref points to (e.g. after removing a refs file). Returns the count."""
+        with self._lock:
+            referenced = self._referenced()
+            removed = 0
+            for digest, path in list(self._blob_paths()):
+                if digest not in referenced:
+                    path.unlink()
+                    removed += 1
+        return removed
+
+
+_stores: dict[Path, BlobStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_blob_store(posts_dir: Path) -> BlobStore:
+    """Return the process-wide BlobStore for a posts directory."""
+    key = Path(posts_dir).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = BlobStore(posts_dir)
+        return store
+
+
+def main(argv: list[str] = None) -> int:
+    """Command-line entry point: show storage use or collect garbage."""
+    parser = argparse.ArgumentParser(
+        prog="python -m blogger.utils.blob_store",
+        description="Inspect the version store under posts/.history/.",
+    )
+    parser.add_argument(
+        "--posts-dir",
+        default=str(Path(__file__).parent.parent.parent / "posts"),
+        help="Path to the posts/ directory (default: project posts/)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Print storage use")
+    subparsers.add_parser("gc", help="Delete unreferenced blobs")
+    args = parser.parse_args(argv)
+
+    posts_dir = Path(args.posts_dir)
+    if not posts_dir.is_dir():
+        print(f"Posts directory not found: {posts_dir}", file=sys.stderr)
+        return 1
+
+    store = get_blob_store(posts_dir)
+    if args.command == "stats":
+        print(json.dumps(store.stats(), indent=2))
+    else:
+        print(f"Removed {store.gc()} unreferenced blobs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Process-wide cache of step files and their parsed forms.
+
+Within one Writer session the same 2-draft_organized.md, draft.md and
+0-analysis.md are read and re-parsed by almost every tool call. The
+DocumentCache keeps recently used files in memory, together with whatever
+parsed forms the tools derived from them (sections, front-matter, ...):
+
+    doc = get_document_cache().get(path)
+    sections = doc.parsed("sections", parse_sections)
+
+Entries are validated with one stat per file: (size, mtime_ns) must be
+unchanged. Files modified within RACY_WINDOW_NS of being cached are re-read
+on the next access (coarse filesystem timestamps could hide a second
+change); if the text turns out identical, the parsed forms are kept.
+
+Documents built from several files (the organized draft and its section
+journal) pass all of them in `watch`, plus a loader producing the text.
+
+Parsed values are shared between callers and must not be modified.
+
+Hit/miss counters are available from cache_stats() for monitoring.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from blogger.utils.workflow_index import RACY_WINDOW_NS
+
+# Upper bound for the text kept in memory (parsed forms are not counted)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+_MISSING = object()
+
+
+def _stamp(paths: tuple) -> tuple:
+    stamp = []
+    for path in paths:
+        try:
+            st = path.stat()
+            stamp.append((st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+class Document:
+    """Text of a cached file plus its lazily computed parsed forms."""
+
+    def __init__(self, cache: "DocumentCache", path: Path, text: str, stamp: tuple, racy: bool):
+        self.path = path
+        self.text = text
+        self.stamp = stamp
+        self.racy = racy
+        self._cache = cache
+        self._parsed = {}
+
+    def parsed(self, kind: str, parser):
+        """
+        Return parser(text), computed once per version of the document.
+
+        Args:
+            kind: Name of the parsed form (e.g. "sections")
+            parser: Function of the text
+
+        Returns:
+            The (shared, read-only) parsed value
+        """
+        value = self._parsed.get(kind, _MISSING)
+        if value is _MISSING:
+            self._cache._count("parse_misses")
+            value = self._parsed[kind] = parser(self.text)
+        else:
+            self._cache._count("parse_hits")
+        return value
+
+
+class DocumentCache:
+    """Bounded LRU of Documents keyed on path, validated by (size, mtime_ns)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Path, Document] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "revalidated", "evictions", "parse_hits", "parse_misses"), 0
+        )
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def get(self, path: Path, loader=None, watch: tuple = None) -> Document:
+        """
+        Return the cached Document for a file, (re)loading it if it changed.
+
+        Args:
+            path: File path (cache key)
+            loader: Optional function returning the text (default: read path)
+            watch: Files whose (size, mtime_ns) identify the version
+                (default: just path)
+
+        Returns:
+            Document
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = Path(path)
+        watch = tuple(Path(p) for p in watch) if watch else (path,)
+
+        # Stat before reading, so a change during the read is seen next time
+        stamp = _stamp(watch)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp and not entry.racy:
+                self._entries.move_to_end(path)
+                self._counters["hits"] += 1
+                return entry
+
+        if loader is not None:
+            text = loader()
+        else:
+            with open(path, "r") as f:
+                text = f.read()
+
+        now = time.time_ns()
+        racy = any(s is not None and now - s[1] < RACY_WINDOW_NS for s in stamp)
+
+        with self._lock:
+            if entry is not None and entry.stamp == stamp and entry.text == text:
+                # Racy entry confirmed unchanged: keep its parsed forms
+                entry.racy = racy
+                self._counters["revalidated"] += 1
+                return entry
+
+            self._counters["misses"] += 1
+            document = Document(self, path, text, stamp, racy)
+            self._remove(path)
+            if len(text) <= self.max_bytes:
+                self._entries[path] = document
+                self._bytes += len(text)
+                while self._bytes > self.max_bytes:
+                    _, old = self._entries.popitem(last=False)
+                    self._bytes -= len(old.text)
+                    self._counters["evictions"] += 1
+            return document
+
+    def _remove(self, path: Path) -> None:
+        old = self._entries.pop(path, None)
+        if old is not None:
+            self._bytes -= len(old.text)
+
+    def invalidate(self, path: Path = None) -> None:
+        """Drop one entry, every entry under a directory, or (None) everything."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            path = Path(path)
+            for key in [k for k in self._entries if k == path or path in k.parents]:
+                self._remove(key)
+
+    def stats(self) -> dict:
+        """
+        Return the cache counters.
+
+        Returns:
+            {"hits", "misses", "revalidated", "evictions", "parse_hits",
+             "parse_misses", "entries", "bytes", "max_bytes"}
+        """
+        with self._lock:
+            return dict(
+                self._counters,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+
+_cache = DocumentCache()
+
+
+def get_document_cache() -> DocumentCache:
+    """Return the process-wide DocumentCache."""
+    return _cache
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters of the process-wide DocumentCache (for monitoring)."""
+    return _cache.stats()
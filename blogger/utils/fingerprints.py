@@ -0,0 +1,181 @@
+"""
+Line fingerprints for memory-bounded integrity checks.
+
+The exact integrity checks keep every normalized line of three documents
+in Python sets: several times the size of the drafts themselves, which
+hurts with 10MB+ transcripts. In fingerprint mode each normalized line is
+reduced to a 64-bit hash and a document to a sorted array of its distinct
+hashes (8 bytes per distinct line). The array is built in runs: at most
+RUN_LINES hashes are held as Python ints (a set, ~60 bytes each) before
+being sorted into an array and merged with the previous runs. Set algebra
+runs as linear merges over the sorted arrays, and the texts are only
+scanned again to report a few offending lines.
+
+Normalization matches text_utils.normalize_and_split (strip + lowercase,
+blank lines skipped). Fingerprints use Python's string hash, so they are
+only comparable within one process; a collision (2^-64 per pair) could
+hide a changed line, which is acceptable for a sanity check.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left
+
+MASK = (1 << 64) - 1
+
+# Distinct fingerprints collected in a set before being sorted into a run
+RUN_LINES = 1 << 14
+
+
+# Characters split into lines at once by iter_lines
+BLOCK_CHARS = 1 << 20
+
+
+def iter_lines(text: str):
+    """Lines of a text, split block by block (never a list of all of them)."""
+    start, size = 0, len(text)
+    while True:
+        end = text.find("\n", start + BLOCK_CHARS) if start + BLOCK_CHARS < size else -1
+        if end == -1:
+            yield from text[start:].split("\n")
+            return
+        yield from text[start:end].split("\n")
+        start = end + 1
+
+
+def iter_normalized(text: str):
+    """Normalized non-blank lines of a text, in document order."""
+    for line in iter_lines(text):
+        line = line.strip()
+        if line:
+            yield line.lower()
+
+
+def fingerprint(normalized_line: str) -> int:
+    return hash(normalized_line) & MASK
+
+
+def fingerprint_lines(text: str) -> array:
+    """
+    Sorted array of the distinct fingerprints of a text's normalized lines.
+
+    Example:
+        >>> fps = fingerprint_lines("A\\n\\na\\nB")
+        >>> len(fps)
+        2
+    """
+    return sorted_distinct(hash(line) & MASK for line in iter_normalized(text))
+
+
+def _merge_runs(runs: list) -> array:
+    """Merge sorted fingerprint arrays into one sorted array without duplicates."""
+    if len(runs) == 1:
+        return runs[0]
+    merged = array("Q")
+    last = None
+    for value in heapq.merge(*runs):
+        if value != last:
+            merged.append(value)
+            last = value
+    return merged
+
+
+def sorted_distinct(values, run_lines: int = RUN_LINES) -> array:
+    """
+    Sorted array of the distinct fingerprints of an iterable, built in runs.
+
+    Args:
+        values: Fingerprints, in any order, possibly repeated
+        run_lines: Distinct values held in a set before being sorted into a run
+
+    Example:
+        >>> list(sorted_distinct([3, 1, 3, 2, 1], run_lines=2))
+        [1, 2, 3]
+    """
+    runs, current = [], set()
+    for value in values:
+        current.add(value)
+        if len(current) >= run_lines:
+            runs.append(array("Q", sorted(current)))
+            current = set()
+            # Repeated values reappear in later runs: fold runs of similar
+            # size together so their total stays ~ the distinct values
+            while len(runs) > 1 and len(runs[-2]) <= 2 * len(runs[-1]):
+                runs[-2:] = [union(runs[-2], runs[-1])]
+    if current or not runs:
+        runs.append(array("Q", sorted(current)))
+    return _merge_runs(runs)
+
+
+def difference(a: array, b: array) -> array:
+    """Fingerprints in a but not in b (both sorted)."""
+    result = array("Q")
+    j, nb = 0, len(b)
+    for x in a:
+        while j < nb and b[j] < x:
+            j += 1
+        if j == nb or b[j] != x:
+            result.append(x)
+    return result
+
+
+def intersection(a: array, b: array) -> array:
+    """Fingerprints in both a and b (both sorted)."""
+    if len(a) > len(b):
+        a, b = b, a
+    result = array("Q")
+    j, nb = 0, len(b)
+    for x in a:
+        while j < nb and b[j] < x:
+            j += 1
+        if j < nb and b[j] == x:
+            result.append(x)
+    return result
+
+
+def union(a: array, b: array) -> array:
+    """Fingerprints in a or b (both sorted)."""
+    result = array("Q")
+    i = j = 0
+    na, nb = len(a), len(b)
+    while i < na and j < nb:
+        if a[i] < b[j]:
+            result.append(a[i])
+            i += 1
+        elif b[j] < a[i]:
+            result.append(b[j])
+            j += 1
+        else:
+            result.append(a[i])
+            i += 1
+            j += 1
+    result.extend(a[i:])
+    result.extend(b[j:])
+    return result
+
+
+def contains(fps: array, fp: int) -> bool:
+    i = bisect_left(fps, fp)
+    return i < len(fps) and fps[i] == fp
+
+
+def sample_lines(texts, fps: array, limit: int = 2) -> list[str]:
+    """
+    First normalized lines (in document order) whose fingerprint is in fps.
+
+    Args:
+        texts: Texts to scan, in order
+        fps: Sorted fingerprints to look for
+        limit: Number of distinct lines to return
+    """
+    found, seen = [], set()
+    if not fps:
+        return found
+    for text in texts:
+        for line in iter_normalized(text):
+            if line not in seen and contains(fps, fingerprint(line)):
+                found.append(line)
+                seen.add(line)
+                if len(found) == limit:
+                    return found
+    return found
@@ -0,0 +1,430 @@
+"""
+Streaming HTML-to-text extraction for fetched pages.
+
+fetch_webpage_tool only keeps the first FETCH_MAX_CHARS characters of a
+page's text. Instead of downloading the whole body and running regex passes
+over it, the response is decoded and fed to an HTMLParser chunk by chunk:
+
+- text inside script/style/noscript/template is dropped as it streams,
+- whitespace is collapsed on the fly (words joined by single spaces),
+- reading stops as soon as the output budget is reached.
+
+Memory and CPU are bounded by the budget, not by the page size.
+
+The "article" mode (ArticleExtractor / stream_article) keeps only the main
+content of a page, readability-style: the page is split into text blocks,
+each block scores its enclosing containers by text length and commas, and
+the container with the best score, discounted by its link density and
+nudged by class/id hints (content, post vs nav, sidebar, cookie...), is
+taken as the article. Navigation, footers, banners and sidebars are left
+out; the title and the article headings are returned separately.
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+
+# Elements whose content is never visible text
+SKIP_TAGS = frozenset({"script", "style", "noscript", "template"})
+
+# Bytes read from the response per parser feed
+CHUNK_SIZE = 64 * 1024
+
+
+class TextExtractor(HTMLParser):
+    """Collect the visible words of an HTML document, up to max_chars."""
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.words: list[str] = []
+        self.length = 0  # Length of " ".join(self.words)
+        self.done = False
+        self._skip_depth = 0
+        # Trailing word of the last data piece: data can be split at feed
+        # boundaries, so it may continue in the next handle_data call
+        self._partial = ""
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self._skip_depth or self.done:
+            return
+        data = self._partial + data
+        self._partial = ""
+        words = data.split()
+        if words and not data[-1].isspace():
+            self._partial = words.pop()
+        for word in words:
+            self._add(word)
+            if self.done:
+                return
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _add(self, word: str) -> None:
+        self.length += len(word) + (1 if self.words else 0)
+        self.words.append(word)
+        if self.length >= self.max_chars:
+            self.done = True
+
+    def _flush(self) -> None:
+        if self._partial and not self.done:
+            self._add(self._partial)
+        self._partial = ""
+
+    def text(self) -> str:
+        self._flush()
+        return " ".join(self.words)[:self.max_chars]
+
+
+def extract_text(html: str, max_chars: int) -> str:
+    """
+    Extract the visible text of an HTML document (non-streaming convenience).
+
+    Example:
+        >>> extract_text("<p>Hello <b>world</b></p><script>x()</script>", 100)
+        'Hello world'
+    """
+    extractor = TextExtractor(max_chars)
+    extractor.feed(html)
+    extractor.close()
+    return extractor.text()
+
+
+def _decoder(response):
+    """Incremental decoder for the response charset (UTF-8 if unknown)."""
+    charset = "utf-8"
+    headers = getattr(response, "headers", None)
+    if headers is not None and hasattr(headers, "get_content_charset"):
+        charset = headers.get_content_charset() or charset
+    try:
+        return codecs.getincrementaldecoder(charset)(errors="ignore")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+
+def stream_text(response, max_chars: int, chunk_size: int = CHUNK_SIZE) -> dict:
+    """
+    Extract the visible text of an HTTP response while it downloads.
+
+    Args:
+        response: Object with .read(n) (e.g. from urllib.request.urlopen);
+            the charset is taken from its headers when available
+        max_chars: Output budget; reading stops once it is reached
+        chunk_size: Bytes read per step
+
+    Returns:
+        {"text": "...", "bytes_read": int, "complete": bool} where complete is
+        False if the body was not read to the end
+    """
+    decoder = _decoder(response)
+    extractor = TextExtractor(max_chars)
+    bytes_read = 0
+    complete = False
+    while not extractor.done:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            complete = True
+            extractor.feed(decoder.decode(b"", final=True))
+            extractor.close()
+            break
+        bytes_read += len(chunk)
+        extractor.feed(decoder.decode(chunk))
+
+    return {"text": extractor.text(), "bytes_read": bytes_read, "complete": complete}
+
+
+# ---------------------------------------------------------------------------
+# Main-content ("article") extraction
+# ---------------------------------------------------------------------------
+
+# Page chrome that never belongs to the article
+ARTICLE_SKIP_TAGS = SKIP_TAGS | {
+    "nav", "aside", "footer", "form", "button", "select", "iframe", "svg", "dialog",
+}
+
+# Elements that can hold an article (and get scored)
+CONTAINER_TAGS = frozenset({
+    "body", "main", "article", "section", "div", "td", "header", "figure", "table",
+})
+
+# Elements that end a text block
+BLOCK_TAGS = CONTAINER_TAGS | {
+    "p", "pre", "blockquote", "ul", "ol", "li", "dl", "dt", "dd", "tr", "th",
+    "h1", "h2", "h3", "h4", "h5", "h6", "br", "hr", "figcaption",
+}
+
+# Elements without an end tag
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+    "param", "source", "track", "wbr",
+})
+
+HEADING_TAGS = {f"h{level}": level for level in range(1, 7)}
+
+# Hints in class/id attributes
+POSITIVE_HINTS = re.compile(
+    r"article|body|content|entry|main|page|post|story|text|blog", re.IGNORECASE
+)
+NEGATIVE_HINTS = re.compile(
+    r"nav|menu|footer|header|sidebar|comment|cookie|consent|banner|share|social|"
+    r"promo|related|subscribe|newsletter|popup|modal|breadcrumb|widget|\bads?\b",
+    re.IGNORECASE,
+)
+TAG_WEIGHTS = {"article": 25, "main": 25, "div": 5, "td": 3, "header": -10, "body": -5}
+
+# Blocks shorter than this don't vote for their container
+MIN_BLOCK_CHARS = 25
+
+# Raw HTML read in article mode (the whole page is needed to score it)
+ARTICLE_MAX_BYTES = 2 * 1024 * 1024
+
+
+class _Container:
+    __slots__ = ("tag", "parent", "weight", "score", "chars", "link_chars")
+
+    def __init__(self, tag: str, parent, attrs: dict):
+        self.tag = tag
+        self.parent = parent
+        hints = f"{attrs.get('class') or ''} {attrs.get('id') or ''}"
+        weight = TAG_WEIGHTS.get(tag, 0)
+        if POSITIVE_HINTS.search(hints):
+            weight += 25
+        if NEGATIVE_HINTS.search(hints):
+            weight -= 25
+        self.weight = weight
+        self.score = 0.0
+        self.chars = 0
+        self.link_chars = 0
+
+    def ancestors(self):
+        node = self
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def final_score(self) -> float:
+        link_density = self.link_chars / self.chars if self.chars else 0
+        return (self.score + self.weight) * (1 - link_density)
+
+
+class ArticleExtractor(HTMLParser):
+    """Split a page into text blocks and pick the container holding the article."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.meta_title = ""
+        self.blocks = []  # (kind, level, text, link_chars, container)
+        self._stack = []  # (tag, container or None)
+        self._container = None
+        self._skip_depth = 0
+        self._in_title = False
+        self._link_depth = 0
+        self._pre_depth = 0
+        self._pieces = []
+        self._link_chars = 0
+
+    # -- parsing -----------------------------------------------------------
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "meta" and attrs.get("property") == "og:title":
+            self.meta_title = (attrs.get("content") or "").strip()
+        if tag in VOID_TAGS:
+            if tag in BLOCK_TAGS:
+                self._flush()
+            return
+        if self._skip_depth or tag in ARTICLE_SKIP_TAGS:
+            self._skip_depth += tag in ARTICLE_SKIP_TAGS
+            self._stack.append((tag, None))
+            return
+        if tag == "title":
+            self._in_title = True
+        if tag in BLOCK_TAGS:
+            self._flush()
+        container = None
+        if tag in CONTAINER_TAGS:
+            container = self._container = _Container(tag, self._container, attrs)
+        self._stack.append((tag, container))
+        if tag == "a":
+            self._link_depth += 1
+        elif tag == "pre":
+            self._pre_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        # Close the innermost matching element (and anything left open in it)
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
+                break
+        else:
+            return
+        if not self._skip_depth and (tag in BLOCK_TAGS or any(t in BLOCK_TAGS for t, _ in self._stack[i:])):
+            self._flush()
+        for open_tag, container in reversed(self._stack[i:]):
+            if open_tag in ARTICLE_SKIP_TAGS and self._skip_depth:
+                self._skip_depth -= 1
+            elif not self._skip_depth:
+                if open_tag == "a" and self._link_depth:
+                    self._link_depth -= 1
+                elif open_tag == "pre" and self._pre_depth:
+                    self._pre_depth -= 1
+            if container is not None:
+                self._container = container.parent
+        del self._stack[i:]
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+            return
+        if self._skip_depth:
+            return
+        self._pieces.append(data)
+        if self._link_depth:
+            self._link_chars += len(" ".join(data.split()))
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self) -> None:
+        text = "".join(self._pieces)
+        link_chars = self._link_chars
+        self._pieces = []
+        self._link_chars = 0
+        text = text.strip("\n") if self._pre_depth else " ".join(text.split())
+        if not text:
+            return
+
+        kind, level = "paragraph", 0
+        for tag, _ in reversed(self._stack):
+            if tag in HEADING_TAGS:
+                kind, level = "heading", HEADING_TAGS[tag]
+                break
+            if tag in ("pre", "li", "blockquote"):
+                kind = {"pre": "code", "li": "item", "blockquote": "quote"}[tag]
+                break
+            if tag in CONTAINER_TAGS:
+                break
+        container = self._container
+        self.blocks.append((kind, level, text, link_chars, container))
+
+        if container is None:
+            return
+        for node in container.ancestors():
+            node.chars += len(text)
+            node.link_chars += link_chars
+        if kind != "heading" and len(text) >= MIN_BLOCK_CHARS:
+            score = 1 + text.count(",") + min(len(text) // 100, 3)
+            container.score += score
+            if container.parent is not None:
+                container.parent.score += score / 2
+
+    # -- results -----------------------------------------------------------
+
+    def article(self):
+        """The best scoring container, or None if the page has no real text."""
+        candidates = {
+            id(c): c for *_, c in self.blocks if c is not None and c.score > 0
+        }
+        for c in list(candidates.values()):
+            if c.parent is not None and c.parent.score > 0:
+                candidates[id(c.parent)] = c.parent
+        if not candidates:
+            return None
+        return max(candidates.values(), key=lambda c: c.final_score())
+
+    def result(self, max_chars: int) -> dict:
+        """
+        Render the article as markdown-ish text.
+
+        Returns:
+            {"text": "...", "title": "...", "headings": [{"title", "level"}],
+             "found": bool}  (found is False when falling back to all blocks)
+        """
+        best = self.article()
+        lines, headings = [], []
+        for kind, level, text, link_chars, container in self.blocks:
+            if best is not None:
+                chain = list(container.ancestors()) if container is not None else []
+                if best not in chain:
+                    continue
+                # Boilerplate nested inside the article (share bars, related links)
+                inner = chain[:chain.index(best)]
+                if any(node.weight < 0 for node in inner):
+                    continue
+                if kind != "heading" and link_chars > len(text) / 2:
+                    continue
+            if kind == "heading":
+                headings.append({"title": text, "level": level})
+                lines.append("#" * level + " " + text)
+            elif kind == "item":
+                lines.append("- " + text)
+            elif kind == "quote":
+                lines.append("> " + text)
+            elif kind == "code":
+                lines.append("```\n" + text + "\n```")
+            else:
+                lines.append(text)
+
+        title = self.meta_title or " ".join(self.title.split())
+        if not title and headings:
+            title = headings[0]["title"]
+        return {
+            "text": "\n\n".join(lines)[:max_chars],
+            "title": title,
+            "headings": headings,
+            "found": best is not None,
+        }
+
+
+def extract_article(html: str, max_chars: int) -> dict:
+    """Main content of an HTML document (see ArticleExtractor.result)."""
+    extractor = ArticleExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.result(max_chars)
+
+
+def stream_article(
+    response,
+    max_chars: int,
+    max_bytes: int = ARTICLE_MAX_BYTES,
+    chunk_size: int = CHUNK_SIZE,
+) -> dict:
+    """
+    Extract the main content of an HTTP response.
+
+    Unlike stream_text, the page must be seen whole before the article can
+    be chosen; reading stops after max_bytes of HTML.
+
+    Returns:
+        ArticleExtractor.result() plus "bytes_read" and "complete"
+    """
+    decoder = _decoder(response)
+    extractor = ArticleExtractor()
+    bytes_read = 0
+    complete = False
+    while bytes_read < max_bytes:
+        chunk = response.read(min(chunk_size, max_bytes - bytes_read))
+        if not chunk:
+            complete = True
+            extractor.feed(decoder.decode(b"", final=True))
+            break
+        bytes_read += len(chunk)
+        extractor.feed(decoder.decode(chunk))
+    extractor.close()
+    return dict(extractor.result(max_chars), bytes_read=bytes_read, complete=complete)
@@ -0,0 +1,185 @@
+"""
+On-disk cache of pages fetched by fetch_webpage_tool.
+
+Agents re-read the same reference pages (previous posts, docs) over and
+over; each fetch costs a network round-trip plus HTML cleanup. The cache
+stores the cleaned text of each URL with the response validators:
+
+    .cache/http/<sha256(url)>.json
+    {"url", "content", "etag", "last_modified", "fetched_at", "max_age"}
+
+Other extractions of the same page (e.g. the main-content "article" mode)
+are stored as separate variants: <sha256(url + "#" + variant)>.json.
+
+- Fresh entries (younger than max-age) are served without any request.
+- Stale entries are revalidated with a conditional request
+  (If-None-Match / If-Modified-Since); a 304 answer renews the entry
+  without downloading or cleaning the page again.
+- If a stale entry can't be revalidated (network error), its content is
+  still served, marked as stale.
+
+Freshness follows Cache-Control (max-age, no-cache, no-store); responses
+without it stay fresh for DEFAULT_TTL seconds.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Freshness lifetime of responses without Cache-Control: max-age
+DEFAULT_TTL = 3600
+
+CACHE_VERSION = 1
+
+
+def freshness(headers) -> int | None:
+    """
+    How long a response may be served from the cache without revalidation.
+
+    Args:
+        headers: Response headers (anything with .get())
+
+    Returns:
+        Seconds of freshness, 0 to always revalidate, or None if the
+        response must not be stored at all
+    """
+    cache_control = (headers.get("Cache-Control") or "").lower()
+    directives = {d.strip() for d in cache_control.split(",")}
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    match = re.search(r"(?:^|,)\s*max-age\s*=\s*(\d+)", cache_control)
+    if match:
+        return int(match.group(1))
+    return DEFAULT_TTL
+
+
+def _well_formed(entry) -> bool:
+    """Whether a decoded cache file has the fields readers rely on."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("content"), str)
+        and all(
+            isinstance(entry.get(field), (int, float)) and not isinstance(entry.get(field), bool)
+            for field in ("fetched_at", "max_age")
+        )
+    )
+
+
+class HttpCache:
+    """Cleaned page text per URL, with validators, as JSON files in one directory."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+
+    def _path(self, url: str, variant: str = None) -> Path:
+        key = url if variant is None else f"{url}#{variant}"
+        return self.cache_dir / (hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, url: str, variant: str = None) -> dict | None:
+        """Return the cached entry for a URL (fresh or stale), or None (also if malformed)."""
+        try:
+            with open(self._path(url, variant), "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if not _well_formed(entry):
+            return None
+        if entry.get("version") != CACHE_VERSION or entry.get("url") != url:
+            return None
+        if entry.get("variant") != variant:
+            return None
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: dict, now: float = None) -> bool:
+        now = time.time() if now is None else now
+        return now - entry["fetched_at"] < entry["max_age"]
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        """Request headers revalidating a cached entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, content: str, headers, variant: str = None, **extra) -> dict | None:
+        """
+        Cache the cleaned content of a 200 response.
+
+        Args:
+            url: Requested URL
+            content: Cleaned page text
+            headers: Response headers
+            variant: Name of the extraction, if not the default one
+            **extra: Additional fields to keep with the entry
+
+        Returns:
+            The stored entry, or None if the response is not cacheable
+        """
+        max_age = freshness(headers)
+        if max_age is None:
+            self.delete(url, variant)
+            return None
+        entry = {
+            "version": CACHE_VERSION,
+            "url": url,
+            "content": content,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "max_age": max_age,
+            **extra,
+        }
+        if variant is not None:
+            entry["variant"] = variant
+        if not entry["etag"] and not entry["last_modified"] and max_age == 0:
+            # Would have to be refetched every time anyway
+            self.delete(url, variant)
+            return None
+        self._write(url, entry)
+        return entry
+
+    def renew(self, url: str, entry: dict, headers) -> dict:
+        """Record a 304 Not Modified answer: the entry is fresh again."""
+        entry = dict(entry, fetched_at=time.time())
+        if headers.get("Cache-Control"):
+            # Otherwise the lifetime announced with the original 200 still applies
+            max_age = freshness(headers)
+            if max_age is None:
+                self.delete(url, entry.get("variant"))
+                return entry
+            entry["max_age"] = max_age
+        # A 304 may carry updated validators
+        entry["etag"] = headers.get("ETag") or entry.get("etag")
+        entry["last_modified"] = headers.get("Last-Modified") or entry.get("last_modified")
+        self._write(url, entry)
+        return entry
+
+    def delete(self, url: str, variant: str = None) -> None:
+        try:
+            os.unlink(self._path(url, variant))
+        except FileNotFoundError:
+            pass
+
+    def _write(self, url: str, entry: dict) -> None:
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self._path(url, entry.get("variant")))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
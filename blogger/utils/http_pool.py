@@ -0,0 +1,275 @@
+"""
+Keep-alive HTTP connection pool for batch page fetches.
+
+urllib.request.urlopen opens (and TLS-handshakes) a new connection per
+request. fetch_webpages_tool fetches many pages at once, often several from
+the same site, so it goes through this pool instead:
+
+- idle connections are kept per (scheme, host, port) and reused by the next
+  request to the same host (until IDLE_TIMEOUT),
+- at most `per_host` requests run against one host at a time; additional
+  requests wait for a slot,
+- every wait (slot, connect, headers, each body read) is bounded by an
+  optional absolute deadline, so a batch can stop on time and report what
+  finished.
+
+Responses mimic urlopen's: .status, .headers, .url, .read(n), usable as a
+context manager; HTTP errors (>= 400, and 304) raise urllib's HTTPError.
+A connection goes back to the pool only if its response was read to the end.
+"""
+
+import http.client
+import ssl
+import threading
+import time
+from collections import defaultdict
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+
+# Concurrent requests allowed against one host
+DEFAULT_PER_HOST = 4
+
+# Idle connections kept per host, and for how long (seconds)
+MAX_IDLE_PER_HOST = 4
+IDLE_TIMEOUT = 30.0
+
+# Bytes per system call when a whole body is read against a deadline
+READ_CHUNK = 64 * 1024
+
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Errors meaning a reused keep-alive connection was closed by the server
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class DeadlineExceeded(URLError):
+    """The request could not complete before the batch deadline."""
+
+    def __init__(self):
+        super().__init__("deadline exceeded")
+
+
+class PooledResponse:
+    """An HTTP response whose connection returns to the pool once fully read."""
+
+    def __init__(
+        self, pool: "ConnectionPool", key: tuple, conn, response, url: str,
+        sock=None, timeout: float = None, deadline: float = None,
+    ):
+        self._pool = pool
+        self._key = key
+        self._conn = conn
+        self._response = response
+        self._sock = sock
+        self._timeout = timeout
+        self._deadline = deadline
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self._closed = False
+
+    def read(self, n: int = -1) -> bytes:
+        """
+        Read up to n bytes of the body (all of it if n < 0).
+
+        With a deadline, the socket timeout is cut to the time left before
+        every read, and n >= 0 reads make at most one system call (they may
+        return fewer bytes), so a slowly trickling body can't outlast it.
+
+        Raises:
+            DeadlineExceeded: The deadline passed before or during the read
+        """
+        if self._deadline is None:
+            # http.client reads until EOF for -1, which never comes on a kept-alive connection
+            return self._response.read(n if n >= 0 else None)
+        if n < 0:
+            return b"".join(iter(lambda: self.read(READ_CHUNK), b""))
+        remaining = self._pool._remaining(self._deadline)
+        if self._sock is not None:
+            self._sock.settimeout(min(self._timeout, remaining))
+        try:
+            data = self._response.read1(n)
+        except TimeoutError as e:
+            if time.monotonic() >= self._deadline:
+                raise DeadlineExceeded() from e
+            raise
+        if self._response.length == 0:
+            self._response.read(0)  # Marks the response complete (read1 doesn't)
+        return data
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # Fully read responses leave the connection ready for the next request
+        reusable = self._response.isclosed() and not self._response.will_close
+        if not reusable:
+            self._response.close()
+        self._pool._release(self._key, self._conn, reusable)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    """Per-host keep-alive connections and concurrency slots."""
+
+    def __init__(
+        self,
+        per_host: int = DEFAULT_PER_HOST,
+        max_idle: int = MAX_IDLE_PER_HOST,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ):
+        self.per_host = per_host
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._slots = defaultdict(lambda: threading.BoundedSemaphore(self.per_host))
+        self._idle = defaultdict(list)  # key -> [(conn, idle_since)]
+        self._ssl_context = None
+        self.stats = {"connections": 0, "reused": 0}
+
+    @staticmethod
+    def _key(url: str) -> tuple:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise URLError(f"unsupported URL: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        return parts.scheme, parts.hostname, port
+
+    def open(self, url: str, headers: dict = None, timeout: float = 10, deadline: float = None):
+        """
+        GET a URL, following redirects.
+
+        Args:
+            url: http(s) URL
+            headers: Request headers
+            timeout: Socket timeout per connect/read (seconds)
+            deadline: Optional time.monotonic() value by which to give up
+
+        Returns:
+            PooledResponse (close it, or use it as a context manager)
+
+        Raises:
+            HTTPError: Status >= 400 or 304
+            DeadlineExceeded: The deadline passed while waiting
+            URLError / OSError: Connection failures
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._request(url, headers or {}, timeout, deadline)
+            location = response.headers.get("Location")
+            if response.status in REDIRECT_CODES and location:
+                response.close()
+                url = urljoin(url, location)
+                continue
+            if response.status >= 400 or response.status == 304:
+                response.close()
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return response
+        raise HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+    def _request(self, url: str, headers: dict, timeout: float, deadline: float) -> PooledResponse:
+        key = self._key(url)
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        with self._lock:
+            slot = self._slots[key]
+        if not slot.acquire(timeout=self._remaining(deadline)):
+            raise DeadlineExceeded()
+        try:
+            while True:
+                # Before taking a connection: DeadlineExceeded here has nothing to close
+                request_timeout = min(timeout, self._remaining(deadline) or timeout)
+                conn, reused = self._connection(key)
+                conn.timeout = request_timeout
+                try:
+                    if conn.sock is not None:
+                        conn.sock.settimeout(conn.timeout)
+                    conn.request("GET", path, headers=headers)
+                    sock = conn.sock  # Cleared by getresponse() if the server closes after
+                    response = conn.getresponse()
+                    break
+                except _STALE_ERRORS:
+                    conn.close()
+                    if not reused:
+                        raise
+                    # The server dropped an idle connection: retry on a fresh one
+                except TimeoutError as e:
+                    conn.close()
+                    if deadline is not None and time.monotonic() >= deadline:
+                        # The socket timeout was cut short by the deadline
+                        raise DeadlineExceeded() from e
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+        except BaseException:
+            slot.release()
+            raise
+        return PooledResponse(self, key, conn, response, url, sock, timeout, deadline)
+
+    def _remaining(self, deadline: float) -> float | None:
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded()
+        return remaining
+
+    def _connection(self, key: tuple):
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle[key]
+            while idle:
+                conn, since = idle.pop()
+                if now - since < self.idle_timeout:
+                    self.stats["reused"] += 1
+                    return conn, True
+                conn.close()
+            self.stats["connections"] += 1
+
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, context=self._ssl_context), False
+        return http.client.HTTPConnection(host, port), False
+
+    def _release(self, key: tuple, conn, reusable: bool) -> None:
+        with self._lock:
+            idle = self._idle[key]
+            if reusable and len(idle) < self.max_idle:
+                idle.append((conn, time.monotonic()))
+            else:
+                conn.close()
+            slot = self._slots[key]
+        slot.release()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            for idle in self._idle.values():
+                for conn, _ in idle:
+                    conn.close()
+            self._idle.clear()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Return the process-wide ConnectionPool (created on first use)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+        return _pool
@@ -0,0 +1,384 @@
+"""
+Directory layouts for the posts/ tree.
+
+- FlatLayout (default): posts/<blog_id>/
+- ShardedLayout: posts/<shard>/<blog_id>/ where <shard> is the first hex
+  characters of sha1(blog_id), so no directory holds more than a few hundred
+  entries even with tens of thousands of blogs.
+
+The active layout is recorded in posts/.layout.json, so every tool and
+every process resolves paths the same way. Unlike the caches in
+posts/.blogger/, it cannot be rebuilt and is kept under version control
+with the posts (a posts/.blogger/layout.json written by older versions is
+still read). Without either file (e.g. a clone made before the file was
+committed) a tree whose top-level directories are all shards holding their
+own blogs is recognized as sharded; anything else is flat. Lookups stay
+O(1): the shard is computed from the blog_id, never searched for.
+
+Reshard an existing tree with:
+
+    python -m blogger.utils.layout reshard --layout sharded
+    python -m blogger.utils.layout reshard --layout flat
+
+A migration first records both layouts, then moves blog directories one by
+one (a rename each). Until it finishes, blog_dir() looks in the new location
+first and falls back to the old one, and an interrupted run can simply be
+started again.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+LAYOUT_FILENAME = ".layout.json"  # In posts/, next to the blogs
+
+# Where older versions kept it (inside the ignored cache directory)
+LEGACY_LAYOUT_PATH = (".blogger", "layout.json")
+
+DEFAULT_SHARD_WIDTH = 2
+
+
+class FlatLayout:
+    """posts/<blog_id>/"""
+
+    name = "flat"
+    depth = 0  # Number of directory levels between posts/ and blog directories
+
+    def relpath(self, blog_id: str) -> str:
+        """Blog directory path relative to posts/."""
+        return blog_id
+
+    def to_dict(self) -> dict:
+        return {"type": self.name}
+
+    def container_relpaths(self, posts_dir: Path) -> list[str]:
+        """Directories whose mtime changes when blogs are added or removed."""
+        return [""]
+
+    def list_blog_ids(self, posts_dir: Path) -> list[str]:
+        with os.scandir(posts_dir) as entries:
+            return [
+                e.name for e in entries
+                if e.is_dir() and not e.name.startswith(".")
+            ]
+
+
+class ShardedLayout:
+    """posts/<sha1(blog_id)[:width]>/<blog_id>/"""
+
+    name = "sharded"
+    depth = 1
+
+    def __init__(self, width: int = DEFAULT_SHARD_WIDTH):
+        self.width = width
+
+    def shard(self, blog_id: str) -> str:
+        return hashlib.sha1(blog_id.encode("utf-8")).hexdigest()[:self.width]
+
+    def relpath(self, blog_id: str) -> str:
+        return os.path.join(self.shard(blog_id), blog_id)
+
+    def to_dict(self) -> dict:
+        return {"type": self.name, "width": self.width}
+
+    def is_shard_name(self, name: str) -> bool:
+        return len(name) == self.width and all(c in "0123456789abcdef" for c in name)
+
+    def _shards(self, posts_dir: Path) -> list[str]:
+        with os.scandir(posts_dir) as entries:
+            return [e.name for e in entries if e.is_dir() and self.is_shard_name(e.name)]
+
+    def container_relpaths(self, posts_dir: Path) -> list[str]:
+        return [""] + self._shards(posts_dir)
+
+    def list_blog_ids(self, posts_dir: Path) -> list[str]:
+        blog_ids = []
+        for shard in self._shards(posts_dir):
+            with os.scandir(os.path.join(posts_dir, shard)) as entries:
+                blog_ids.extend(
+                    e.name for e in entries
+                    if e.is_dir() and not e.name.startswith(".")
+                )
+        return blog_ids
+
+
+LAYOUTS = {
+    FlatLayout.name: FlatLayout,
+    ShardedLayout.name: ShardedLayout,
+}
+
+
+def layout_from_dict(data: dict):
+    """Build a layout from its layout.json representation."""
+    layout_type = data.get("type", FlatLayout.name)
+    if layout_type == ShardedLayout.name:
+        return ShardedLayout(width=int(data.get("width", DEFAULT_SHARD_WIDTH)))
+    if layout_type == FlatLayout.name:
+        return FlatLayout()
+    raise ValueError(f"Unknown posts layout '{layout_type}'. Use one of: {', '.join(LAYOUTS)}")
+
+
+# layout: the active layout; previous: the layout being migrated away from (or None)
+LayoutState = namedtuple("LayoutState", ["layout", "previous"])
+
+_states: dict[Path, tuple] = {}  # posts_dir -> (layout.json stamp, LayoutState)
+_states_lock = threading.Lock()
+
+
+def _layout_path(posts_dir: Path) -> Path:
+    return Path(posts_dir) / LAYOUT_FILENAME
+
+
+def _existing_layout_path(posts_dir: Path) -> tuple[Path | None, tuple]:
+    """
+    (layout file to read or None, cache stamp). Without a file the stamp is
+    the mtime of posts/ itself, which changes as top-level directories come
+    and go, so a detected layout is re-detected when it may have changed.
+    """
+    for path in (_layout_path(posts_dir), Path(posts_dir).joinpath(*LEGACY_LAYOUT_PATH)):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            continue
+        return path, (str(path), st.st_mtime_ns, st.st_size)
+    try:
+        return None, ("detected", os.stat(posts_dir).st_mtime_ns)
+    except FileNotFoundError:
+        return None, ("detected", None)
+
+
+def detect_layout(posts_dir: Path):
+    """
+    Guess the layout of a tree that has no layout file.
+
+    Sharded if every top-level directory is a shard name of one width and
+    every directory inside a shard is a blog hashing to that shard (so a
+    flat blog named like "ab" doesn't fool it); flat otherwise.
+    """
+    try:
+        with os.scandir(posts_dir) as entries:
+            names = [e.name for e in entries if e.is_dir() and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return FlatLayout()
+    widths = {len(name) for name in names}
+    if len(widths) != 1:
+        return FlatLayout()
+    layout = ShardedLayout(width=widths.pop())
+    found = False
+    for name in names:
+        if not layout.is_shard_name(name):
+            return FlatLayout()
+        with os.scandir(os.path.join(posts_dir, name)) as entries:
+            for e in entries:
+                if e.is_dir() and not e.name.startswith("."):
+                    if layout.shard(e.name) != name:
+                        return FlatLayout()
+                    found = True
+    return layout if found else FlatLayout()
+
+
+def get_layout_state(posts_dir: Path) -> LayoutState:
+    """
+    Return the layout configured for a posts directory.
+
+    Cached per process and revalidated with one stat of the layout file
+    (see detect_layout when there is none).
+
+    Args:
+        posts_dir: Path to the posts/ directory
+
+    Returns:
+        LayoutState(layout, previous); previous is set while a reshard runs
+    """
+    path, stamp = _existing_layout_path(posts_dir)
+
+    key = Path(posts_dir)
+    cached = _states.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    if path is None:
+        state = LayoutState(detect_layout(posts_dir), None)
+    else:
+        with open(path, "r") as f:
+            data = json.load(f)
+        previous = data.get("previous")
+        state = LayoutState(
+            layout_from_dict(data.get("layout", {})),
+            layout_from_dict(previous) if previous else None,
+        )
+
+    with _states_lock:
+        _states[key] = (stamp, state)
+    return state
+
+
+def get_layout(posts_dir: Path):
+    """Return the active layout for a posts directory."""
+    return get_layout_state(posts_dir).layout
+
+
+def blog_dir(posts_dir: Path, blog_id: str) -> Path:
+    """
+    Resolve the directory of a blog under the configured layout.
+
+    Args:
+        posts_dir: Path to the posts/ directory
+        blog_id: Blog identifier
+
+    Returns:
+        Path to the blog directory (which may not exist yet)
+    """
+    layout, previous = get_layout_state(posts_dir)
+    path = Path(posts_dir) / layout.relpath(blog_id)
+    if previous is not None and not path.exists():
+        # Mid-migration: the blog may not have been moved yet
+        old_path = Path(posts_dir) / previous.relpath(blog_id)
+        if old_path.exists():
+            return old_path
+    return path
+
+
+def _list_ids(layout, posts_dir: Path, involved: tuple) -> list[str]:
+    """
+    List blog_ids of one layout, ignoring shard directories of the others.
+
+    While flat and sharded layouts coexist (mid-reshard), a flat listing
+    would otherwise report shard directories like "3f" as blogs.
+    """
+    blog_ids = layout.list_blog_ids(posts_dir)
+    if isinstance(layout, FlatLayout):
+        for other in involved:
+            if isinstance(other, ShardedLayout):
+                blog_ids = [b for b in blog_ids if not other.is_shard_name(b)]
+    return blog_ids
+
+
+def list_blog_ids(posts_dir: Path) -> set[str]:
+    """All blog_ids under posts/ (both layouts while a reshard runs)."""
+    state = get_layout_state(posts_dir)
+    blog_ids = set(_list_ids(state.layout, posts_dir, state))
+    if state.previous is not None:
+        blog_ids |= set(_list_ids(state.previous, posts_dir, state))
+    return blog_ids
+
+
+def container_relpaths(posts_dir: Path) -> list[str]:
+    """Directories whose mtimes reveal added/removed blogs."""
+    layout, previous = get_layout_state(posts_dir)
+    relpaths = layout.container_relpaths(posts_dir)
+    if previous is not None:
+        relpaths += [r for r in previous.container_relpaths(posts_dir) if r not in relpaths]
+    return relpaths
+
+
+def _write_layout_file(posts_dir: Path, data: dict) -> None:
+    path = _layout_path(posts_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+    # The file moved out of posts/.blogger/: don't leave a stale copy there
+    try:
+        os.unlink(Path(posts_dir).joinpath(*LEGACY_LAYOUT_PATH))
+    except FileNotFoundError:
+        pass
+
+
+def reshard(posts_dir: Path, target) -> dict:
+    """
+    Move every blog directory to the target layout.
+
+    Safe to re-run after an interruption: blogs already in place are skipped.
+
+    Args:
+        posts_dir: Path to the posts/ directory
+        target: FlatLayout or ShardedLayout instance
+
+    Returns:
+        {"moved": int, "skipped": int, "layout": {...}}
+    """
+    posts_dir = Path(posts_dir)
+    state = get_layout_state(posts_dir)
+    source = state.previous or state.layout
+
+    # 1. Record the migration so lookups check both locations meanwhile
+    _write_layout_file(posts_dir, {"layout": target.to_dict(), "previous": source.to_dict()})
+
+    moved = 0
+    skipped = 0
+    for blog_id in sorted(_list_ids(source, posts_dir, (source, target))):
+        src = posts_dir / source.relpath(blog_id)
+        dst = posts_dir / target.relpath(blog_id)
+        if src == dst or dst.exists():
+            skipped += 1
+            continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        os.rename(src, dst)
+        moved += 1
+
+    # 2. Drop shard directories left empty by the old layout
+    if isinstance(source, ShardedLayout):
+        for shard in source._shards(posts_dir):
+            try:
+                os.rmdir(posts_dir / shard)
+            except OSError:
+                pass  # Not empty: still used by the new layout
+
+    # 3. Migration complete
+    _write_layout_file(posts_dir, {"layout": target.to_dict()})
+
+    return {"moved": moved, "skipped": skipped, "layout": target.to_dict()}
+
+
+def main(argv: list[str] = None) -> int:
+    """Command-line entry point: show or change the posts/ layout."""
+    parser = argparse.ArgumentParser(
+        prog="python -m blogger.utils.layout",
+        description="Show or change the directory layout of posts/.",
+    )
+    parser.add_argument(
+        "--posts-dir",
+        default=str(Path(__file__).parent.parent.parent / "posts"),
+        help="Path to the posts/ directory (default: project posts/)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("show", help="Print the current layout")
+    reshard_parser = subparsers.add_parser("reshard", help="Move blogs to another layout")
+    reshard_parser.add_argument("--layout", choices=sorted(LAYOUTS), required=True)
+    reshard_parser.add_argument(
+        "--width", type=int, default=DEFAULT_SHARD_WIDTH,
+        help="Hex characters per shard directory (sharded layout only)",
+    )
+    args = parser.parse_args(argv)
+
+    posts_dir = Path(args.posts_dir)
+    if not posts_dir.is_dir():
+        print(f"Posts directory not found: {posts_dir}", file=sys.stderr)
+        return 1
+
+    if args.command == "show":
+        layout, previous = get_layout_state(posts_dir)
+        print(json.dumps({
+            "layout": layout.to_dict(),
+            "previous": previous.to_dict() if previous else None,
+            "blogs": len(list_blog_ids(posts_dir)),
+        }, indent=2))
+        return 0
+
+    target = layout_from_dict({"type": args.layout, "width": args.width})
+    result = reshard(posts_dir, target)
+    print(f"Moved {result['moved']} blogs ({result['skipped']} already in place) "
+          f"to layout {json.dumps(result['layout'])}")
+    print("Restart running `adk web` processes so watchers pick up the new layout.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
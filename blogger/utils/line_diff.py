@@ -0,0 +1,431 @@
+"""
+Line-located diagnostics for failed integrity checks.
+
+The integrity checks compare line *sets*: on failure they report a count and
+two arbitrary samples, which leaves the agent re-reading whole documents to
+find the problem. The functions here compute a minimal edit script between
+the normalized lines of the documents (Myers' O(ND) diff, in its
+linear-space divide-and-conquer form) and report every lost, added and
+duplicated line with its line number in the original files, plus where in
+the other document it belongs.
+
+    diff_opcodes(a, b)                -> [("equal"|"delete"|"insert", i1, i2, j1, j2)]
+    diagnose_content_split(raw, p1, p2)
+    diagnose_reorganization(draft_ok, outline, reorganized)
+
+Line numbers in reports are 1-based and refer to the unnormalized texts
+(blank lines count). Normalization matches normalize_and_split.
+
+Myers' diff costs O((N+M)D) for D edits, and a reorganized draft (sections
+shuffled) has D close to N+M. Past MAX_EDITS edits the diff gives up and
+the documents are aligned by their unique lines instead (patience-style:
+lines occurring once on each side, matched by a longest increasing
+subsequence, O(N log N)); lost/added lines are exactly the same, only the
+"belongs after" positions and the moved count are approximations. Reports
+say which alignment was used in "alignment": "diff" or "unique_lines".
+"""
+
+from bisect import bisect_left
+from collections import Counter
+
+# Entries reported per category (the counts are always complete)
+MAX_ITEMS = 50
+
+# Edit distance above which the diff falls back to the unique-line alignment
+MAX_EDITS = 400
+
+# Characters of line text quoted in reports
+TEXT_PREVIEW = 80
+
+
+# ---------------------------------------------------------------------------
+# Myers diff
+# ---------------------------------------------------------------------------
+
+class TooManyEdits(Exception):
+    """The edit script would exceed the allowed number of edits."""
+
+
+def _middle_snake(a, alo, ahi, b, blo, bhi, max_edits: int = None) -> tuple[int, int, int, int]:
+    """
+    Middle snake of the shortest edit script between a[alo:ahi] and b[blo:bhi].
+
+    Returns:
+        (x0, y0, x1, y1): the snake runs from (x0, y0) to (x1, y1) (absolute indexes)
+
+    Raises:
+        TooManyEdits: The edit distance exceeds max_edits
+    """
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta & 1
+    limit = (n + m + 1) // 2 + 1
+    if max_edits is not None and abs(delta) > max_edits:
+        raise TooManyEdits()
+    offset = limit + 1
+    forward = [0] * (2 * offset + 1)  # Furthest x reached per diagonal k = x - y
+    backward = [0] * (2 * offset + 1)  # Same, from the end (reversed coordinates)
+
+    for d in range(limit):
+        if max_edits is not None and 2 * d - 1 > max_edits:
+            raise TooManyEdits()
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            if odd and delta - (d - 1) <= k <= delta + (d - 1):
+                if x + backward[offset + delta - k] >= n:
+                    return alo + x0, blo + y0, alo + x, blo + y
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + k] = x
+            if not odd and -d <= delta - k <= d:
+                if x + forward[offset + delta - k] >= n:
+                    return ahi - x, bhi - y, ahi - x0, bhi - y0
+
+    raise AssertionError("no middle snake found")  # Unreachable for valid input
+
+
+def _diff(a, b, alo, ahi, blo, bhi, ops: list, max_edits: int = None) -> None:
+    # Common prefix and suffix need no search
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        ops.append(("equal", alo, blo))
+        alo += 1
+        blo += 1
+    suffix = 0
+    while alo < ahi - suffix and blo < bhi - suffix and a[ahi - 1 - suffix] == b[bhi - 1 - suffix]:
+        suffix += 1
+    ahi_s, bhi_s = ahi - suffix, bhi - suffix
+
+    if alo == ahi_s:
+        ops.extend(("insert", alo, j) for j in range(blo, bhi_s))
+    elif blo == bhi_s:
+        ops.extend(("delete", i, blo) for i in range(alo, ahi_s))
+    else:
+        x0, y0, x1, y1 = _middle_snake(a, alo, ahi_s, b, blo, bhi_s, max_edits)
+        _diff(a, b, alo, x0, blo, y0, ops, max_edits)
+        ops.extend(("equal", x0 + i, y0 + i) for i in range(x1 - x0))
+        _diff(a, b, x1, ahi_s, y1, bhi_s, ops, max_edits)
+
+    ops.extend(("equal", ahi_s + i, bhi_s + i) for i in range(suffix))
+
+
+def diff_opcodes(a: list, b: list, max_edits: int = None) -> list[tuple]:
+    """
+    Minimal edit script turning sequence a into sequence b.
+
+    Args:
+        a, b: Sequences of hashable items (e.g. normalized lines)
+        max_edits: Give up (TooManyEdits) past this many edits (None: no limit)
+
+    Returns:
+        Grouped operations (tag, i1, i2, j1, j2) like difflib's opcodes,
+        where tag is "equal", "delete" (a[i1:i2] removed) or "insert"
+        (b[j1:j2] added)
+
+    Example:
+        >>> diff_opcodes(list("abcd"), list("acxd"))
+        [('equal', 0, 1, 0, 1), ('delete', 1, 2, 1, 1), ('equal', 2, 3, 1, 2), ('insert', 3, 3, 2, 3), ('equal', 3, 4, 3, 4)]
+    """
+    steps = []
+    _diff(a, b, 0, len(a), 0, len(b), steps, max_edits)
+    steps.append(("end", len(a), len(b)))
+
+    # Group the steps; within each run of changes, deletes come before inserts
+    opcodes = []
+    i1 = j1 = 0
+    equal = True
+    for tag, i, j in steps:
+        if (tag == "equal") != equal or tag == "end":
+            if equal and i > i1:
+                opcodes.append(("equal", i1, i, j1, j))
+            elif not equal:
+                if i > i1:
+                    opcodes.append(("delete", i1, i, j1, j1))
+                if j > j1:
+                    opcodes.append(("insert", i, i, j1, j))
+            i1, j1, equal = i, j, tag == "equal"
+    return opcodes
+
+
+# ---------------------------------------------------------------------------
+# Diagnostics
+# ---------------------------------------------------------------------------
+
+def _normalized(text: str) -> tuple[list[str], list[int]]:
+    """Normalized non-blank lines of a text and their 1-based line numbers."""
+    lines, numbers = [], []
+    for number, line in enumerate((text or "").split("\n"), start=1):
+        line = line.strip()
+        if line:
+            lines.append(line.lower())
+            numbers.append(number)
+    return lines, numbers
+
+
+def _preview(line: str) -> str:
+    return line if len(line) <= TEXT_PREVIEW else line[:TEXT_PREVIEW] + "..."
+
+
+def _line_before(numbers: list[int], index: int) -> int:
+    """Line number of the item before position index (0 = start of file)."""
+    return numbers[index - 1] if index > 0 else 0
+
+
+def _alignment(opcodes: list[tuple]) -> tuple[dict, dict, list]:
+    """
+    Summarize an edit script.
+
+    Returns:
+        (matched: {a index: b index}, anchor: {a index: b position where
+        deleted a lines would go}, inserts: [(b index, a position)])
+    """
+    matched, anchor, inserts = {}, {}, []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            for k in range(i2 - i1):
+                matched[i1 + k] = j1 + k
+        elif tag == "delete":
+            for i in range(i1, i2):
+                anchor[i] = j1
+        else:
+            inserts.extend((j, i1) for j in range(j1, j2))
+    return matched, anchor, inserts
+
+
+def _unique_line_alignment(a: list, b: list) -> tuple[dict, dict, list]:
+    """
+    _alignment without a diff: match the lines occurring once in a and once
+    in b, keeping the longest run of them that appears in the same order.
+    Duplicated lines are never matched, so they count as moved.
+
+    Example:
+        >>> _unique_line_alignment(list("abcd"), list("cdab"))[0]
+        {2: 0, 3: 1}
+    """
+    count_a, count_b = Counter(a), Counter(b)
+    position_b = {line: j for j, line in enumerate(b) if count_b[line] == 1}
+    pairs = [(i, position_b[line]) for i, line in enumerate(a) if count_a[line] == 1 and line in position_b]
+
+    # Longest increasing subsequence of the b positions (patience sorting)
+    tails, tail_pairs, previous = [], [], [None] * len(pairs)
+    for k, (_, j) in enumerate(pairs):
+        p = bisect_left(tails, j)
+        if p == len(tails):
+            tails.append(j)
+            tail_pairs.append(k)
+        else:
+            tails[p] = j
+            tail_pairs[p] = k
+        previous[k] = tail_pairs[p - 1] if p else None
+    chain = []
+    k = tail_pairs[-1] if tail_pairs else None
+    while k is not None:
+        chain.append(pairs[k])
+        k = previous[k]
+    matched = dict(reversed(chain))
+
+    # Unmatched lines go after the nearest preceding line found once on the
+    # other side, matched or moved (a moved section keeps its neighbours)
+    position_a = {line: i for i, line in enumerate(a) if count_a[line] == 1}
+    anchor, last_j = {}, -1
+    for i, line in enumerate(a):
+        if i in matched:
+            last_j = matched[i]
+        else:
+            anchor[i] = last_j + 1
+            if line in position_b:
+                last_j = position_b[line]
+    matched_b = {j: i for i, j in matched.items()}
+    inserts, last_i = [], -1
+    for j, line in enumerate(b):
+        if j in matched_b:
+            last_i = matched_b[j]
+        else:
+            inserts.append((j, last_i + 1))
+            if line in position_a:
+                last_i = position_a[line]
+    return matched, anchor, inserts
+
+
+def _align(a: list, b: list) -> tuple[tuple, str]:
+    """(_alignment of a and b, name of the method used)."""
+    try:
+        return _alignment(diff_opcodes(a, b, MAX_EDITS)), "diff"
+    except TooManyEdits:
+        return _unique_line_alignment(a, b), "unique_lines"
+
+
+def _capped(items: list) -> list:
+    return items[:MAX_ITEMS]
+
+
+def diagnose_content_split(raw_draft: str, part1: str, part2: str) -> dict:
+    """
+    Locate the lines that make a content split invalid.
+
+    Each part is diffed against the original draft. A line of the draft
+    matched by neither diff and found in neither part is lost; a line of a
+    part whose text isn't in the draft is added; a line present in both
+    parts is duplicated.
+
+    Returns:
+        {
+            "lost": [{"line": n, "text": "...", "part1_after_line": n, "part2_after_line": n}],
+            "added": [{"part": "part1"|"part2", "line": n, "text": "...", "after_original_line": n}],
+            "duplicated": [{"text": "...", "original_line": n|None, "part1_line": n, "part2_line": n}],
+            "counts": {"lost": int, "added": int, "duplicated": int},
+            "alignment": "diff" | "unique_lines"
+        }
+        where "*_after_line" is the line of that file after which the lost
+        line belongs (0 = at the start).
+
+    Example:
+        >>> report = diagnose_content_split("A\\n\\nB\\n\\nC", "A", "C")
+        >>> report["lost"]
+        [{'line': 3, 'text': 'b', 'part1_after_line': 1, 'part2_after_line': 0}]
+    """
+    raw, raw_numbers = _normalized(raw_draft)
+    parts = {"part1": _normalized(part1), "part2": _normalized(part2)}
+    raw_set = set(raw)
+
+    aligned = {name: _align(raw, lines) for name, (lines, _) in parts.items()}
+    alignments = {name: alignment for name, (alignment, _) in aligned.items()}
+    part_sets = {name: set(lines) for name, (lines, _) in parts.items()}
+
+    lost = []
+    for i, line in enumerate(raw):
+        if any(i in alignments[name][0] or line in part_sets[name] for name in parts):
+            continue
+        entry = {"line": raw_numbers[i], "text": _preview(line)}
+        for name, (_, numbers) in parts.items():
+            entry[f"{name}_after_line"] = _line_before(numbers, alignments[name][1][i])
+        lost.append(entry)
+
+    added = []
+    for name, (lines, numbers) in parts.items():
+        for j, i in alignments[name][2]:
+            if lines[j] not in raw_set:
+                added.append({
+                    "part": name,
+                    "line": numbers[j],
+                    "text": _preview(lines[j]),
+                    "after_original_line": _line_before(raw_numbers, i),
+                })
+
+    duplicated = []
+    lines1, numbers1 = parts["part1"]
+    lines2, numbers2 = parts["part2"]
+    first2 = {}
+    for j, line in enumerate(lines2):
+        first2.setdefault(line, numbers2[j])
+    first_raw = {}
+    for i, line in enumerate(raw):
+        first_raw.setdefault(line, raw_numbers[i])
+    seen = set()
+    for j, line in enumerate(lines1):
+        if line in first2 and line not in seen:
+            seen.add(line)
+            duplicated.append({
+                "text": _preview(line),
+                "original_line": first_raw.get(line),
+                "part1_line": numbers1[j],
+                "part2_line": first2[line],
+            })
+
+    return {
+        "lost": _capped(lost),
+        "added": _capped(added),
+        "duplicated": _capped(duplicated),
+        "counts": {"lost": len(lost), "added": len(added), "duplicated": len(duplicated)},
+        "alignment": "diff" if all(m == "diff" for _, m in aligned.values()) else "unique_lines",
+    }
+
+
+def diagnose_reorganization(draft_ok: str, outline_text: str, reorganized_text: str) -> dict:
+    """
+    Locate the lines that make a reorganization invalid.
+
+    The reorganized text is diffed against draft_ok. Draft lines it lacks
+    are lost, its lines found neither in the draft nor among the outline
+    headings are added, and outline headings it lacks are missing.
+
+    Returns:
+        {
+            "lost": [{"line": n, "text": "...", "reorganized_after_line": n}],
+            "added": [{"line": n, "text": "...", "after_draft_line": n}],
+            "missing_headings": [{"outline_line": n, "text": "..."}],
+            "moved": int,    # draft lines placed elsewhere (allowed)
+            "counts": {"lost": int, "added": int, "missing_headings": int},
+            "alignment": "diff" | "unique_lines"
+        }
+
+    Example:
+        >>> report = diagnose_reorganization("A\\nB", "## H", "## H\\nA")
+        >>> report["lost"]
+        [{'line': 2, 'text': 'b', 'reorganized_after_line': 2}]
+    """
+    draft, draft_numbers = _normalized(draft_ok)
+    reorganized, reorganized_numbers = _normalized(reorganized_text)
+    outline, outline_numbers = _normalized(outline_text)
+    headings = {
+        line: number for line, number in zip(outline, outline_numbers) if line.startswith("#")
+    }
+    draft_set = set(draft)
+    reorganized_set = set(reorganized)
+
+    (matched, anchor, inserts), method = _align(draft, reorganized)
+
+    lost, moved = [], 0
+    for i, line in enumerate(draft):
+        if i in matched:
+            continue
+        if line in reorganized_set:
+            moved += 1
+            continue
+        lost.append({
+            "line": draft_numbers[i],
+            "text": _preview(line),
+            "reorganized_after_line": _line_before(reorganized_numbers, anchor[i]),
+        })
+
+    added = [
+        {
+            "line": reorganized_numbers[j],
+            "text": _preview(reorganized[j]),
+            "after_draft_line": _line_before(draft_numbers, i),
+        }
+        for j, i in inserts
+        if reorganized[j] not in draft_set and reorganized[j] not in headings
+    ]
+
+    missing_headings = [
+        {"outline_line": number, "text": _preview(line)}
+        for line, number in headings.items()
+        if line not in reorganized_set and line not in draft_set
+    ]
+
+    return {
+        "lost": _capped(lost),
+        "added": _capped(added),
+        "missing_headings": _capped(missing_headings),
+        "moved": moved,
+        "counts": {"lost": len(lost), "added": len(added), "missing_headings": len(missing_headings)},
+        "alignment": method,
+    }
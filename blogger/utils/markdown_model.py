@@ -0,0 +1,113 @@
+"""
+One shared parse of a markdown document for the validators.
+
+validate_organization_tool runs the integrity check and the heading-order
+check over the same outline and organized text, and each of them used to
+split and lowercase both texts on its own (the outline structure check did
+it a third time). A ParsedMarkdown holds everything they need, computed in
+one pass over the lines:
+
+    doc = parse_markdown(text)
+    doc.lines            # raw lines (text.split("\\n"))
+    doc.normalized       # stripped + lowercased lines ("" for blank lines)
+    doc.line_set         # distinct non-blank normalized lines (= normalize_and_split)
+    doc.headings[2]      # [(line index, normalized heading line)] of "## " headings
+    doc.hash_lines       # normalized lines starting with "#" (authorized outline lines)
+    doc.code_fences      # [(first line, last line)] of ``` / ~~~ fenced blocks
+
+Heading lists skip lines inside code fences (a "## " comment in a code
+block is not a section). parse_markdown caches the model by content hash,
+so every check and every retry with the same text shares one parse. Models
+are shared and must not be modified.
+"""
+
+from blogger.utils.fingerprints import iter_lines
+from blogger.utils.validation_cache import cached_by_content
+
+MAX_HEADING_LEVEL = 6
+
+_FENCES = ("```", "~~~")
+
+
+class ParsedMarkdown:
+    """Lines, normalized lines, headings by level and code fences of a document."""
+
+    __slots__ = ("text", "lines", "normalized", "line_set", "headings", "hash_lines", "code_fences")
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.lines = self.text.split("\n")
+        self.normalized = [line.strip().lower() for line in self.lines]
+        self.line_set = frozenset(line for line in self.normalized if line)
+        self.headings = {level: [] for level in range(1, MAX_HEADING_LEVEL + 1)}
+        self.hash_lines = frozenset(line for line in self.line_set if line.startswith("#"))
+        self.code_fences = []
+
+        fence, fence_start = None, 0
+        for index, line in enumerate(self.normalized):
+            if fence:
+                if line.startswith(fence):
+                    self.code_fences.append((fence_start, index))
+                    fence = None
+                continue
+            if line.startswith(_FENCES):
+                fence, fence_start = line[:3], index
+                continue
+            if line.startswith("#"):
+                level = len(line) - len(line.lstrip("#"))
+                if level <= MAX_HEADING_LEVEL and line[level:level + 1] == " ":
+                    self.headings[level].append((index, line))
+        if fence:
+            # Unclosed fence: runs to the end of the document
+            self.code_fences.append((fence_start, len(self.lines) - 1))
+
+    def heading_lines(self, level: int) -> list[str]:
+        """
+        Normalized heading lines of one level, in document order.
+
+        Example:
+            >>> parse_markdown("# T\\n## A\\n```\\n## not a heading\\n```\\n## B").heading_lines(2)
+            ['## a', '## b']
+        """
+        return [line for _, line in self.headings[level]]
+
+    def in_code(self, index: int) -> bool:
+        """Whether line index lies inside a fenced code block (fences included)."""
+        return any(start <= index <= end for start, end in self.code_fences)
+
+
+def iter_heading_lines(text: str, level: int):
+    """
+    Normalized heading lines of one level, as ParsedMarkdown.heading_lines,
+    without building (or caching) a model: for texts too large to keep
+    parsed. Lines are split block by block and only headings are lowercased.
+
+    Example:
+        >>> list(iter_heading_lines("## A\\n~~~\\n## no\\n~~~\\n  ## B ", 2))
+        ['## a', '## b']
+    """
+    fence = None
+    for line in iter_lines(text or ""):
+        line = line.strip()
+        if fence:
+            if line.startswith(fence):
+                fence = None
+            continue
+        if line.startswith(_FENCES):
+            fence = line[:3]
+        elif line.startswith("#"):
+            found = len(line) - len(line.lstrip("#"))
+            if found == level and line[level:level + 1] == " ":
+                yield line.lower()
+
+
+def parse_markdown(text) -> ParsedMarkdown:
+    """
+    ParsedMarkdown of a text, cached by content hash.
+
+    Args:
+        text: Markdown text, or an already parsed document (returned as is)
+    """
+    if isinstance(text, ParsedMarkdown):
+        return text
+    return cached_by_content("markdown", text or "", ParsedMarkdown)
@@ -0,0 +1,239 @@
+"""
+Ranged reads of large markdown files.
+
+Lets the read tools return part of a file instead of the whole thing:
+- a line range (offset/limit in lines),
+- a byte range (offset/limit in bytes, snapped to UTF-8 character boundaries),
+- the section under a heading (optionally paged with offset/limit).
+
+Files are memory-mapped, so only the pages a read touches are loaded. The
+line-start index of a file is built once and cached per (path, size,
+mtime_ns); paging through a multi-megabyte transcript costs one bisect and
+one slice per read.
+"""
+
+import mmap
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+
+from blogger.utils.text_utils import find_best_heading_match
+
+UNITS = ("lines", "bytes")
+
+# Markdown ATX headings ("# Title" ... "###### Title")
+HEADING_RE = re.compile(rb"^(#{1,6})[ \t]+(.+?)[ \t]*\r?$", re.MULTILINE)
+
+# Code fence lines (``` or ~~~), as in markdown_model.ParsedMarkdown
+FENCE_RE = re.compile(rb"^[ \t]*(```|~~~)", re.MULTILINE)
+
+# Line-start indexes kept for the most recently read files
+LINE_INDEX_CACHE_SIZE = 16
+
+_line_indexes: OrderedDict = OrderedDict()  # (path, size, mtime_ns) -> array
+_line_indexes_lock = threading.Lock()
+
+
+def _build_line_starts(buf) -> array:
+    """Byte offset of the start of every line (empty for an empty buffer)."""
+    starts = array("q")
+    size = len(buf)
+    if size == 0:
+        return starts
+    starts.append(0)
+    pos = buf.find(b"\n")
+    while pos != -1 and pos + 1 < size:
+        starts.append(pos + 1)
+        pos = buf.find(b"\n", pos + 1)
+    return starts
+
+
+def _line_starts(buf, key: tuple = None) -> array:
+    if key is None:
+        return _build_line_starts(buf)
+    with _line_indexes_lock:
+        starts = _line_indexes.get(key)
+        if starts is not None:
+            _line_indexes.move_to_end(key)
+            return starts
+    starts = _build_line_starts(buf)
+    with _line_indexes_lock:
+        _line_indexes[key] = starts
+        while len(_line_indexes) > LINE_INDEX_CACHE_SIZE:
+            _line_indexes.popitem(last=False)
+    return starts
+
+
+def _fenced_ranges(buf) -> list[tuple[int, int]]:
+    """Byte ranges of fenced code blocks (an unclosed fence runs to the end)."""
+    ranges, fence, fence_start = [], None, 0
+    for m in FENCE_RE.finditer(buf):
+        if fence is None:
+            fence, fence_start = m.group(1), m.start()
+        elif m.group(1) == fence:
+            ranges.append((fence_start, m.end()))
+            fence = None
+    if fence is not None:
+        ranges.append((fence_start, len(buf)))
+    return ranges
+
+
+def _find_section(buf, starts: array, heading: str) -> tuple[int, int, dict]:
+    """
+    Locate the lines of the section under the best-matching heading.
+
+    Returns:
+        (first line, end line (exclusive), matched heading dict)
+
+    Raises:
+        LookupError: If no heading matches
+    """
+    fenced = _fenced_ranges(buf)
+    fence_starts = [start for start, _ in fenced]
+    headings = []
+    for m in HEADING_RE.finditer(buf):
+        i = bisect_right(fence_starts, m.start()) - 1
+        if i >= 0 and m.start() < fenced[i][1]:
+            continue  # A "#" line inside a code block is not a heading
+        headings.append({
+            "title": m.group(2).decode("utf-8", errors="replace"),
+            "level": len(m.group(1)),
+            "line_num": bisect_right(starts, m.start()) - 1,
+        })
+
+    match = find_best_heading_match(heading, headings)
+    if match is None:
+        available = [h["title"] for h in headings[:30]]
+        raise LookupError(
+            f"Heading '{heading}' not found. Available headings: {', '.join(available) or 'none'}"
+        )
+
+    end = len(starts)
+    for h in headings[headings.index(match) + 1:]:
+        if h["level"] <= match["level"]:
+            end = h["line_num"]
+            break
+    return match["line_num"], end, match
+
+
+def _char_boundary(buf, pos: int, size: int) -> int:
+    """Move pos back to the start of the UTF-8 character it falls in."""
+    while 0 < pos < size and buf[pos] & 0xC0 == 0x80:
+        pos -= 1
+    return pos
+
+
+def read_range(
+    source,
+    offset: int = None,
+    limit: int = None,
+    unit: str = "lines",
+    heading: str = None,
+) -> dict:
+    """
+    Read part of a file (or of an in-memory document).
+
+    Offsets are 0-based and relative to the selected section when `heading`
+    is given (to the whole file otherwise), so `next_offset` can be passed
+    back as-is to continue reading.
+
+    Args:
+        source: Path of the file to memory-map, or the document as bytes
+        offset: First line/byte to return (default 0)
+        limit: Maximum number of lines/bytes to return (default: to the end)
+        unit: "lines" or "bytes"
+        heading: Only read the section under this heading (fuzzy match,
+            until the next heading of the same or a higher level)
+
+    Returns:
+        {
+            "content": "...",
+            "total_bytes": int, "total_lines": int,   # whole file
+            "range": {"unit": "lines", "start": 0, "end": 120, "total": 480},
+            "has_more": bool,
+            "next_offset": 120,                       # only if has_more
+            "heading": "...", "heading_line": int,    # only with heading
+        }
+
+    Raises:
+        ValueError: Invalid unit, offset or limit
+        LookupError: Heading not found
+    """
+    if unit not in UNITS:
+        raise ValueError(f"Invalid unit '{unit}'. Use one of: {', '.join(UNITS)}")
+    if offset is not None and offset < 0:
+        raise ValueError("offset must be >= 0")
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be >= 0")
+
+    if isinstance(source, (bytes, bytearray)):
+        return _read_buffer(source, None, offset or 0, limit, unit, heading)
+
+    path = Path(source)
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size == 0:
+            return _read_buffer(b"", None, offset or 0, limit, unit, heading)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            key = (str(path), st.st_size, st.st_mtime_ns)
+            return _read_buffer(mm, key, offset or 0, limit, unit, heading)
+
+
+def _read_buffer(buf, key, offset: int, limit: int, unit: str, heading: str) -> dict:
+    size = len(buf)
+    starts = _line_starts(buf, key)
+    total_lines = len(starts)
+
+    def line_to_byte(line: int) -> int:
+        return starts[line] if line < total_lines else size
+
+    first_line, end_line = 0, total_lines
+    result = {}
+    if heading is not None:
+        first_line, end_line, match = _find_section(buf, starts, heading)
+        result["heading"] = match["title"]
+        result["heading_line"] = first_line
+
+    if unit == "lines":
+        total = end_line - first_line
+        start = min(offset, total)
+        end = total if limit is None else min(total, start + limit)
+        byte_start = line_to_byte(first_line + start)
+        byte_end = line_to_byte(first_line + end)
+    else:
+        section_start = line_to_byte(first_line)
+        section_end = line_to_byte(end_line)
+        total = section_end - section_start
+        byte_start = _char_boundary(buf, section_start + min(offset, total), size)
+        byte_end = section_end if limit is None else min(section_end, byte_start + limit)
+        byte_end = _char_boundary(buf, byte_end, size)
+        if byte_end <= byte_start < section_end and limit:
+            # The limit is smaller than the character at the offset: return it whole
+            byte_end = byte_start + 1
+            while byte_end < section_end and buf[byte_end] & 0xC0 == 0x80:
+                byte_end += 1
+        start = byte_start - section_start
+        end = byte_end - section_start
+
+    result.update({
+        "content": bytes(buf[byte_start:byte_end]).decode("utf-8", errors="replace"),
+        "total_bytes": size,
+        "total_lines": total_lines,
+        "range": {"unit": unit, "start": start, "end": end, "total": total},
+        "has_more": end < total,
+    })
+    if end < total:
+        result["next_offset"] = end
+    return result
+
+
+def text_size(text: str) -> dict:
+    """total_bytes / total_lines of an in-memory document (as read_range counts them)."""
+    return {
+        "total_bytes": len(text.encode("utf-8")),
+        "total_lines": text.count("\n") + (1 if text and not text.endswith("\n") else 0),
+    }
@@ -0,0 +1,352 @@
+"""
+Trigram/token search index over blogs, used by infer_blog_id_tool.
+
+Each blog is indexed by three fields:
+- blog_id (e.g., "my-ai-journey-2" -> "ai", "journey", "2")
+- title: first H1 of draft.md / 1-outline.md / 2-draft_organized.md
+- headings: all ## headings of those files
+
+Documents are persisted in posts/.blogger/search_index.json and the inverted
+index (trigram -> blogs, token -> blogs) is rebuilt in memory once per process.
+The index subscribes to the WorkflowIndex, so only blogs whose step files
+changed are re-extracted before the next query.
+"""
+
+import heapq
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+from blogger.utils.layout import blog_dir
+from blogger.utils.section_journal import ORGANIZED_FILENAME, read_organized
+from blogger.utils.text_utils import extract_headings
+from blogger.utils.workflow_index import INDEX_DIRNAME, WorkflowIndex, get_workflow_index
+
+SEARCH_INDEX_FILENAME = "search_index.json"
+SEARCH_INDEX_VERSION = 1
+
+# Step files searched for titles/headings, in priority order for the title
+SOURCE_FILES = {
+    "draft": "draft.md",
+    "outline": "1-outline.md",
+    "organized": "2-draft_organized.md",
+}
+
+# How much a hit counts depending on where it was found
+FIELD_WEIGHTS = {
+    "blog_id": 1.0,
+    "title": 1.0,
+    "headings": 0.7,
+}
+
+# Words that carry no meaning in hints like "the blog about agents"
+STOP_WORDS = {
+    "a", "an", "the", "my", "our", "your", "this", "that", "of", "on", "in",
+    "to", "for", "and", "or", "with", "about", "post", "posts", "blog",
+    "article", "draft", "one",
+}
+
+# Candidates below this score are not reported
+MIN_SCORE = 0.3
+
+# Blend between fuzzy (trigram) and exact (token) matching
+TRIGRAM_WEIGHT = 0.6
+TOKEN_WEIGHT = 0.4
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase alphanumeric tokens, dropping stop words.
+
+    Example:
+        >>> tokenize("The blog about AI-Agents")
+        ['ai', 'agents']
+    """
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if t not in STOP_WORDS]
+
+
+def trigrams(token: str) -> set[str]:
+    """
+    Return the padded character trigrams of a token.
+
+    Example:
+        >>> sorted(trigrams("ai"))
+        ['$ai', 'ai$']
+    """
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def extract_document(blog_dir: Path) -> dict:
+    """
+    Read the searchable fields of one blog from its step files.
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+
+    Returns:
+        {"title": "...", "headings": [...]}
+    """
+    title = ""
+    headings = []
+    seen = set()
+
+    for filename in SOURCE_FILES.values():
+        try:
+            if filename == ORGANIZED_FILENAME:
+                # Include journaled sections, without caching every blog's draft
+                text = read_organized(blog_dir, remember=False)
+            else:
+                with open(blog_dir / filename, "r") as f:
+                    text = f.read()
+        except FileNotFoundError:
+            continue
+
+        if not title:
+            h1 = extract_headings(text, level=1)
+            if h1:
+                title = h1[0]["title"]
+
+        for heading in extract_headings(text, level=2):
+            key = heading["title"].lower()
+            if key not in seen:
+                seen.add(key)
+                headings.append(heading["title"])
+
+    return {"title": title, "headings": headings}
+
+
+def _source_signature(entry: dict) -> list:
+    """Mtimes of the source files, as recorded by the workflow index."""
+    return [entry["mtimes"].get(key) for key in SOURCE_FILES]
+
+
+def _document_terms(blog_id: str, doc: dict) -> tuple[dict, dict]:
+    """
+    Compute the weighted trigrams and tokens of a document.
+
+    Returns:
+        (grams, tokens): dicts mapping term -> best field weight
+    """
+    fields = {
+        "blog_id": blog_id,
+        "title": doc["title"],
+        "headings": " ".join(doc["headings"]),
+    }
+    grams = {}
+    tokens = {}
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            if tokens.get(token, 0) < weight:
+                tokens[token] = weight
+            for gram in trigrams(token):
+                if grams.get(gram, 0) < weight:
+                    grams[gram] = weight
+    return grams, tokens
+
+
+class SearchIndex:
+    """
+    Inverted trigram/token index for one posts/ directory.
+
+    Use get_search_index() instead of instantiating directly.
+    """
+
+    def __init__(self, posts_dir: Path, workflow_index: WorkflowIndex):
+        self.posts_dir = Path(posts_dir)
+        self.path = self.posts_dir / INDEX_DIRNAME / SEARCH_INDEX_FILENAME
+        self.workflow_index = workflow_index
+        self.docs: dict[str, dict] = {}
+        self._grams: dict[str, dict[str, float]] = defaultdict(dict)
+        self._tokens: dict[str, dict[str, float]] = defaultdict(dict)
+        self._dirty: set[str] | None = None  # None = full sync needed
+        self._loaded = False
+        self._lock = threading.RLock()
+        workflow_index.subscribe(self.mark_dirty)
+
+    def mark_dirty(self, blog_ids: set[str] | None) -> None:
+        """WorkflowIndex listener: remember which blogs need re-extraction."""
+        with self._lock:
+            if blog_ids is None or self._dirty is None:
+                self._dirty = None
+            else:
+                self._dirty |= blog_ids
+
+    # ------------------------------------------------------------------
+    # Persistence and postings
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != SEARCH_INDEX_VERSION:
+            data = {}
+
+        for blog_id, doc in data.get("docs", {}).items():
+            self._add(blog_id, doc)
+        self._loaded = True
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": SEARCH_INDEX_VERSION, "docs": self.docs}
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _add(self, blog_id: str, doc: dict) -> None:
+        self.docs[blog_id] = doc
+        grams, tokens = _document_terms(blog_id, doc)
+        for gram, weight in grams.items():
+            self._grams[gram][blog_id] = weight
+        for token, weight in tokens.items():
+            self._tokens[token][blog_id] = weight
+
+    def _remove(self, blog_id: str) -> None:
+        doc = self.docs.pop(blog_id, None)
+        if doc is None:
+            return
+        grams, tokens = _document_terms(blog_id, doc)
+        for gram in grams:
+            postings = self._grams[gram]
+            postings.pop(blog_id, None)
+            if not postings:
+                del self._grams[gram]
+        for token in tokens:
+            postings = self._tokens[token]
+            postings.pop(blog_id, None)
+            if not postings:
+                del self._tokens[token]
+
+    def _sync(self, entries: dict[str, dict]) -> None:
+        """Re-extract the blogs flagged by the workflow index."""
+        if not self._loaded:
+            self._load()
+
+        if self._dirty is None:
+            blog_ids = set(entries) | set(self.docs)
+        else:
+            blog_ids = self._dirty
+        self._dirty = set()
+
+        changed = False
+        for blog_id in blog_ids:
+            entry = entries.get(blog_id)
+            if entry is None:
+                if blog_id in self.docs:
+                    self._remove(blog_id)
+                    changed = True
+                continue
+
+            signature = _source_signature(entry)
+            doc = self.docs.get(blog_id)
+            if doc is not None and doc["sig"] == signature:
+                continue
+
+            try:
+                new_doc = extract_document(blog_dir(self.posts_dir, blog_id))
+            except OSError:
+                continue
+            new_doc["sig"] = signature
+            self._remove(blog_id)
+            self._add(blog_id, new_doc)
+            changed = True
+
+        if changed:
+            self._save()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 5) -> list[dict]:
+        """
+        Rank blogs against a free-text hint.
+
+        Score = 0.6 * weighted share of query trigrams found
+              + 0.4 * weighted share of query tokens found exactly
+
+        Args:
+            query: Hint from the user (e.g., "the agents post")
+            limit: Maximum number of candidates to return
+
+        Returns:
+            List of {"blog_id", "score", "title"} sorted by score (best first),
+            only candidates scoring at least MIN_SCORE
+        """
+        entries = self.workflow_index.refresh()
+
+        with self._lock:
+            self._sync(entries)
+
+            tokens = set(tokenize(query))
+            if not tokens:
+                return []
+            grams = set().union(*(trigrams(t) for t in tokens))
+
+            gram_hits = defaultdict(float)
+            for gram in grams:
+                for blog_id, weight in self._grams.get(gram, {}).items():
+                    gram_hits[blog_id] += weight
+
+            token_hits = defaultdict(float)
+            for token in tokens:
+                for blog_id, weight in self._tokens.get(token, {}).items():
+                    token_hits[blog_id] += weight
+
+            scores = (
+                (
+                    TRIGRAM_WEIGHT * hits / len(grams)
+                    + TOKEN_WEIGHT * token_hits.get(blog_id, 0.0) / len(tokens),
+                    blog_id,
+                )
+                for blog_id, hits in gram_hits.items()
+            )
+            top = heapq.nlargest(limit, (s for s in scores if s[0] >= MIN_SCORE))
+
+            return [
+                {
+                    "blog_id": blog_id,
+                    "score": round(score, 3),
+                    "title": self.docs[blog_id]["title"],
+                }
+                for score, blog_id in top
+            ]
+
+
+_indexes: dict[Path, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(posts_dir: Path) -> SearchIndex:
+    """
+    Return the shared SearchIndex for a posts directory.
+
+    Args:
+        posts_dir: Path to the posts/ directory
+
+    Returns:
+        The process-wide SearchIndex instance for that directory
+    """
+    workflow_index = get_workflow_index(posts_dir)
+    with _indexes_lock:
+        index = _indexes.get(workflow_index.posts_dir)
+        if index is None:
+            index = SearchIndex(workflow_index.posts_dir, workflow_index)
+            _indexes[workflow_index.posts_dir] = index
+        return index
@@ -0,0 +1,133 @@
+"""
+Incremental revalidation of the organized draft after a section save.
+
+validate_organization_tool re-reads and re-normalizes the whole organized
+draft; after the Writer saves one polished section, only that section can
+have drifted from the outline. For each blog we keep one print per
+section: its normalized "## " heading, a fingerprint of its normalized
+lines, and how many "## " headings it holds (outside code fences).
+
+    result = revalidate_section(blog_dir, outline, before, chunks, index, polished, after)
+
+The prints are built from the document once (or again after the draft
+changed behind our back, detected by content hash); after that a save
+replaces one print and checks only that section against the outline:
+
+- it must hold exactly one "## " heading (more would shift every later
+  section, fewer would merge it into the previous one);
+- its heading must be the outline's heading at the same position.
+
+The verdict for the other sections comes from their tracked prints, so
+the check costs O(section) plus O(number of sections).
+"""
+
+import threading
+from pathlib import Path
+
+from blogger.utils import fingerprints as fp
+from blogger.utils.markdown_model import parse_markdown
+from blogger.utils.validation_cache import content_hash
+
+# blog_dir -> (content hash of the document, outline hash, [section prints])
+_tracked: dict[Path, tuple] = {}
+_lock = threading.Lock()
+
+
+def section_print(section_text: str) -> tuple:
+    """
+    (normalized heading, fingerprint of the normalized lines, "## " heading count).
+
+    Example:
+        >>> section_print("## Setup\\n\\nInstall it.")[::2]
+        ('## setup', 1)
+    """
+    headings = parse_markdown(section_text).heading_lines(2)
+    lines = "\n".join(fp.iter_normalized(section_text))
+    return headings[0] if headings else "", fp.fingerprint(lines), len(headings)
+
+
+def _problem(index: int, heading: str, outline_headings: list[str]) -> str | None:
+    """Why section index doesn't conform to the outline (None if it does)."""
+    if index >= len(outline_headings):
+        return f"Section #{index + 1} ('{heading}') is not in the outline"
+    if heading != outline_headings[index]:
+        return f"Section #{index + 1} is '{heading}', the outline expects '{outline_headings[index]}'"
+    return None
+
+
+def revalidate_section(
+    blog_dir: Path,
+    outline_text: str,
+    before_text: str,
+    chunks: list[str],
+    index: int,
+    section_text: str,
+    after_text: str,
+) -> dict:
+    """
+    Check a just-saved section against the outline, reusing the other sections' prints.
+
+    Args:
+        blog_dir: Blog directory (key of the tracked prints)
+        outline_text: The outline
+        before_text: Organized draft before the save
+        chunks: Sections of before_text, "## " section i being chunks[i] (no preamble)
+        index: Index of the saved section
+        section_text: The saved section (including its heading)
+        after_text: Organized draft after the save
+
+    Returns:
+        {
+            "valid": bool,             # The whole draft still matches the outline
+            "section": index + 1,
+            "changed": bool,           # The section's normalized lines changed
+            "problems": ["...", ...]   # This section's problems, then the other sections'
+        }
+    """
+    blog_dir = Path(blog_dir)
+    outline_headings = parse_markdown(outline_text).heading_lines(2)
+    outline_hash = content_hash(outline_text)
+
+    with _lock:
+        tracked = _tracked.get(blog_dir)
+    if tracked is not None and tracked[:2] == (content_hash(before_text), outline_hash):
+        prints = list(tracked[2])
+    else:
+        prints = [section_print(chunk) for chunk in chunks]
+
+    old = prints[index]
+    new = section_print(section_text)
+    if new[2] != 1:
+        # The section list changed shape: rebuild from the document next time
+        with _lock:
+            _tracked.pop(blog_dir, None)
+        return {
+            "valid": False,
+            "section": index + 1,
+            "changed": True,
+            "problems": [
+                f"Section #{index + 1} holds {new[2]} '## ' headings instead of 1: the sections after it shifted"
+            ],
+        }
+
+    problem = _problem(index, new[0], outline_headings)
+    problems = [problem] if problem else []
+    prints[index] = new
+
+    others = [
+        issue
+        for i, (heading, _, _) in enumerate(prints)
+        if i != index and (issue := _problem(i, heading, outline_headings))
+    ]
+    if len(prints) < len(outline_headings):
+        others.append(f"{len(outline_headings) - len(prints)} outline sections are missing from the draft")
+
+    with _lock:
+        _tracked[blog_dir] = (content_hash(after_text), outline_hash, tuple(prints))
+
+    return {
+        "valid": not problems and not others,
+        "section": index + 1,
+        "changed": new[1] != old[1],
+        "problems": problems + others,
+    }
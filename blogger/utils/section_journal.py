@@ -0,0 +1,371 @@
+"""
+Append-only section journal for 2-draft_organized.md.
+
+The Writer polishes the organized draft one section at a time. Rewriting the
+whole file for every section is quadratic I/O over a long editing session and
+leaves a torn file behind if a write is interrupted. Instead, each saved
+section is appended as one JSON line to a hidden journal next to the draft:
+
+    posts/<blog_id>/.2-draft_organized.journal.jsonl
+
+    {"version": 1, "base": [size, mtime_ns]}          <- header
+    {"section": 2, "heading": "Setup", "content": "## Setup\\n..."}
+    {"section": 0, "heading": "Intro", "content": "## Intro\\n..."}
+
+The current draft is the base file with the records replayed in order (each
+replaces the N-th "## " section, exactly like an in-place save would). The
+replayed view is cached per process and extended incrementally as records
+are appended, so a save costs one small append. The cache is an LRU capped
+at VIEWS_MAX_CHARS (the drafts being polished); bulk readers such as the
+search index sync read with remember=False and leave it untouched.
+
+Until then 2-draft_organized.md on disk lags behind: read it through
+read_organized. Compaction folds the journal back into the file (atomic
+replace) and deletes it. It runs automatically once the journal outgrows the
+base file, and when the post is finalized (finalize_post_tool), which is
+the only way the draft leaves the workflow.
+
+The header pins the base file it applies to: if 2-draft_organized.md is
+replaced by anything else (a new Curator run, an external editor), the
+journal no longer applies. It is then set aside, not deleted:
+
+    posts/<blog_id>/.2-draft_organized.journal.stale.jsonl
+
+and the sections whose journaled edits are missing from the new file are
+reported (pop_discarded, and the "discarded_sections" of the tools), so the
+Writer can redo them. A truncated last line (interrupted append) is ignored
+and cut off on the next save.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from blogger.utils.text_utils import extract_headings, split_text_by_headings
+
+ORGANIZED_FILENAME = "2-draft_organized.md"
+JOURNAL_FILENAME = ".2-draft_organized.journal.jsonl"
+STALE_JOURNAL_FILENAME = ".2-draft_organized.journal.stale.jsonl"
+JOURNAL_VERSION = 1
+
+# Compact once the journal is larger than the base file (and at least this
+# big), which keeps the amortized cost of a save proportional to the section
+COMPACT_MIN_BYTES = 64 * 1024
+
+# Characters of materialized drafts kept in _views (least recently used evicted)
+VIEWS_MAX_CHARS = 8 * 1024 * 1024
+
+# blog_dir -> (base stamp, journal bytes replayed, materialized content)
+_views: OrderedDict[Path, tuple] = OrderedDict()
+# blog_dir -> [{"section", "heading"}] of journaled edits set aside, not yet reported
+_discarded: dict[Path, list] = {}
+_lock = threading.RLock()
+
+
+def replace_section(content: str, section_index: int, section_content: str) -> str:
+    """
+    Replace the section_index-th "## " section of a document.
+
+    Args:
+        content: Markdown document
+        section_index: Index of the section among the level-2 headings
+        section_content: New section text (including its heading)
+
+    Returns:
+        The updated document
+
+    Raises:
+        IndexError: If the document has no such section
+    """
+    headings = extract_headings(content, level=2)
+    if not 0 <= section_index < len(headings):
+        raise IndexError(f"Section {section_index} not found ({len(headings)} sections)")
+
+    positions = [h['line_num'] for h in headings]
+    chunks = split_text_by_headings(content, positions)
+    chunk_offset = 1 if positions[0] > 0 else 0
+    chunks[section_index + chunk_offset] = section_content.strip()
+    return '\n'.join(chunks)
+
+
+def _stamp(path: Path) -> list | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _replay(journal_path: Path, base_stamp: list, offset: int, content: str) -> tuple[int | None, str]:
+    """
+    Apply the journal records found after `offset` to `content`.
+
+    Returns:
+        (end offset of the last complete record, updated content). The offset
+        stays at 0 when the journal is missing, and is None when it belongs
+        to another base.
+    """
+    try:
+        with open(journal_path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return 0, content
+
+    pos = 0
+    while True:
+        end = data.find(b"\n", pos)
+        if end < 0:
+            break  # Missing or truncated last line
+        try:
+            record = json.loads(data[pos:end])
+        except ValueError:
+            break
+        if offset + pos == 0:
+            # Header: the journal only applies to the base it was written for
+            if record.get("version") != JOURNAL_VERSION or record.get("base") != base_stamp:
+                return None, content
+        else:
+            content = replace_section(content, record["section"], record["content"])
+        pos = end + 1
+    return offset + pos, content
+
+
+def _remember(blog_dir: Path, view: tuple) -> None:
+    """Cache a replayed view, evicting the least recently used ones past VIEWS_MAX_CHARS; caller holds _lock."""
+    _views[blog_dir] = view
+    _views.move_to_end(blog_dir)
+    total = sum(len(content) for _, _, content in _views.values())
+    while total > VIEWS_MAX_CHARS:
+        _, (_, _, content) = _views.popitem(last=False)
+        total -= len(content)
+
+
+def _materialize(blog_dir: Path, remember: bool = True) -> tuple[list | None, int, str]:
+    """Return (base stamp, valid journal bytes, current content); caller holds _lock."""
+    base_path = blog_dir / ORGANIZED_FILENAME
+    base_stamp = _stamp(base_path)
+    if base_stamp is None:
+        _views.pop(blog_dir, None)
+        raise FileNotFoundError(f"Organized draft not found: {base_path}")
+
+    journal_path = blog_dir / JOURNAL_FILENAME
+    journal_stamp = _stamp(journal_path)
+    journal_size = journal_stamp[0] if journal_stamp else 0
+
+    cached = _views.get(blog_dir)
+    if cached is not None and cached[0] == base_stamp and cached[1] <= journal_size:
+        offset, content = cached[1], cached[2]
+        if offset == journal_size:
+            _views.move_to_end(blog_dir)
+            return base_stamp, offset, content
+    else:
+        with open(base_path, "r") as f:
+            offset, content = 0, f.read()
+
+    offset, content = _replay(journal_path, base_stamp, offset, content)
+    if offset is None:
+        # The base was replaced behind our back
+        _discarded.setdefault(blog_dir, []).extend(_set_aside(blog_dir, content))
+        offset = 0
+    if remember or blog_dir in _views:
+        _remember(blog_dir, (base_stamp, offset, content))
+    return base_stamp, offset, content
+
+
+def _set_aside(blog_dir: Path, content: str) -> list[dict]:
+    """
+    Move a journal that no longer applies out of the way; caller holds _lock.
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+        content: The base file that replaced the journal's base
+
+    Returns:
+        [{"section": n, "heading": "..."}] of the journaled sections whose
+        last version is not in content. If there are any, the journal is kept
+        as STALE_JOURNAL_FILENAME (replacing an older one), else deleted.
+    """
+    journal_path = blog_dir / JOURNAL_FILENAME
+    try:
+        with open(journal_path, "rb") as f:
+            lines = f.read().split(b"\n")
+    except FileNotFoundError:
+        return []
+
+    latest = {}
+    for line in lines[1:]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # Torn last line
+        latest[record["section"]] = record
+    discarded = [
+        {"section": record["section"], "heading": record["heading"]}
+        for _, record in sorted(latest.items())
+        if record["content"] not in content
+    ]
+    if discarded:
+        os.replace(journal_path, blog_dir / STALE_JOURNAL_FILENAME)
+    else:
+        os.unlink(journal_path)
+    return discarded
+
+
+def pop_discarded(blog_dir: Path) -> list[dict]:
+    """
+    Journaled section edits set aside since the last call.
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+
+    Returns:
+        [{"section": n, "heading": "..."}]; the edits themselves are in
+        STALE_JOURNAL_FILENAME
+    """
+    with _lock:
+        return _discarded.pop(Path(blog_dir), [])
+
+
+def read_organized(blog_dir: Path, remember: bool = True) -> str:
+    """
+    Read the current organized draft (base file plus journaled sections).
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+        remember: Cache the replayed draft for later reads and saves (a
+            draft that is already cached is kept up to date either way)
+
+    Returns:
+        The organized draft as the Writer last saved it
+
+    Raises:
+        FileNotFoundError: If 2-draft_organized.md does not exist
+    """
+    blog_dir = Path(blog_dir)
+    with _lock:
+        return _materialize(blog_dir, remember)[2]
+
+
+def save_section(blog_dir: Path, section_index: int, heading: str, section_content: str) -> str:
+    """
+    Journal a new version of one section.
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+        section_index: Index of the section among the level-2 headings
+        heading: Title of the section being replaced (kept for reference)
+        section_content: New section text (including its heading)
+
+    Returns:
+        The updated organized draft
+
+    Raises:
+        FileNotFoundError: If 2-draft_organized.md does not exist
+        IndexError: If the draft has no such section
+    """
+    blog_dir = Path(blog_dir)
+    journal_path = blog_dir / JOURNAL_FILENAME
+    with _lock:
+        base_stamp, offset, content = _materialize(blog_dir)
+        content = replace_section(content, section_index, section_content)
+
+        record = json.dumps({
+            "section": section_index,
+            "heading": heading,
+            "content": section_content.strip(),
+        }) + "\n"
+
+        if offset == 0:
+            # New (or stale) journal: start over with a header for this base
+            header = json.dumps({"version": JOURNAL_VERSION, "base": base_stamp}) + "\n"
+            with open(journal_path, "w") as f:
+                f.write(header + record)
+            offset = len(header.encode("utf-8"))
+        else:
+            with open(journal_path, "r+b") as f:
+                f.truncate(offset)  # Drop a torn record left by an interrupted save
+                f.seek(offset)
+                f.write(record.encode("utf-8"))
+        offset += len(record.encode("utf-8"))
+        _remember(blog_dir, (base_stamp, offset, content))
+
+        if offset > max(COMPACT_MIN_BYTES, base_stamp[0]):
+            _compact(blog_dir, content)
+    return content
+
+
+def _compact(blog_dir: Path, content: str) -> None:
+    """Write `content` as the new base file and drop the journal; caller holds _lock."""
+    base_path = blog_dir / ORGANIZED_FILENAME
+    fd, tmp_path = tempfile.mkstemp(dir=blog_dir, prefix=".organized-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, base_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    # The new base no longer matches the journal header, so a crash right
+    # here is harmless: the stale journal's edits are all in the new base,
+    # so it is deleted (not reported) on the next read
+    try:
+        os.unlink(blog_dir / JOURNAL_FILENAME)
+    except FileNotFoundError:
+        pass
+    _remember(blog_dir, (_stamp(base_path), 0, content))
+
+
+def compact(blog_dir: Path) -> bool:
+    """
+    Fold journaled sections back into 2-draft_organized.md.
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+
+    Returns:
+        True if the base file was rewritten, False if there was nothing to fold
+
+    Raises:
+        FileNotFoundError: If 2-draft_organized.md does not exist
+    """
+    blog_dir = Path(blog_dir)
+    with _lock:
+        _, offset, content = _materialize(blog_dir)
+        if offset == 0:
+            # No journal (or one set aside), or a torn header: nothing to fold
+            try:
+                os.unlink(blog_dir / JOURNAL_FILENAME)
+            except FileNotFoundError:
+                pass
+            return False
+        _compact(blog_dir, content)
+        return True
+
+
+def discard_journal(blog_dir: Path) -> list[dict]:
+    """
+    Set the journal aside, e.g. after 2-draft_organized.md was replaced.
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+
+    Returns:
+        [{"section": n, "heading": "..."}] of the journaled edits missing
+        from the current 2-draft_organized.md, including those set aside
+        earlier and not reported yet
+    """
+    blog_dir = Path(blog_dir)
+    with _lock:
+        try:
+            with open(blog_dir / ORGANIZED_FILENAME, "r") as f:
+                content = f.read()
+        except FileNotFoundError:
+            content = ""
+        discarded = _discarded.pop(blog_dir, []) + _set_aside(blog_dir, content)
+        _views.pop(blog_dir, None)
+        return discarded
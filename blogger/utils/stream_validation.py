@@ -0,0 +1,169 @@
+"""
+Streaming integrity checks for drafts too large to load whole.
+
+check_content_integrity and check_reorganization_integrity take whole
+strings; even in fingerprint mode the caller must first load every
+document. The checks here take file paths or line iterators instead and
+read each input once, line by line:
+
+    check_content_integrity_stream("draft.md", "draft_ok.md", "draft_not_ok.md")
+    check_reorganization_integrity_stream(draft_ok_lines, "1-outline.md", organized_path)
+
+Each input is reduced to the sorted array of its distinct line
+fingerprints (fingerprints.sorted_distinct). Fingerprints are collected in
+runs of RUN_LINES distinct values, each sorted into an array, and the runs
+are merged as they pile up (runs of similar size are folded together) and
+at the end. Memory therefore grows with the number of distinct
+lines (~8 bytes each in the arrays, plus a set of at most RUN_LINES ints
+and the merge output), not with the size of the input: repeated lines and
+line lengths cost nothing. Verdicts, counts and messages match the
+in-memory checks.
+
+Samples in failure messages need a second read: they are given for path
+inputs (re-read only on failure) and omitted for iterators, which can only
+be consumed once.
+"""
+
+import os
+from array import array
+
+from blogger.utils import fingerprints as fp
+
+# Distinct fingerprints collected in a set before being sorted into a run
+RUN_LINES = fp.RUN_LINES
+
+
+def _is_path(source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def iter_source_lines(source):
+    """
+    Lines of a file path (read in binary, split on "\\n" only, like
+    str.split) or of an iterable of lines (items may end with "\\n").
+    """
+    if _is_path(source):
+        with open(source, "rb") as f:
+            for line in f:
+                yield line.decode("utf-8", "replace")
+    else:
+        for item in source:
+            yield from item.split("\n")
+
+
+def _iter_normalized(source, headings_only: bool = False):
+    for line in iter_source_lines(source):
+        line = line.strip()
+        if line and (not headings_only or line.startswith("#")):
+            yield line.lower()
+
+
+def stream_fingerprints(source, headings_only: bool = False) -> array:
+    """
+    Sorted distinct line fingerprints of a path or line iterator, in one pass.
+
+    Args:
+        source: File path or iterable of lines
+        headings_only: Only lines starting with "#" (outline headings)
+
+    Example:
+        >>> stream_fingerprints(["A", "a ", "", "B\\n"]) == fp.fingerprint_lines("A\\nB")
+        True
+    """
+    return fp.sorted_distinct(
+        (fp.fingerprint(line) for line in _iter_normalized(source, headings_only)), RUN_LINES
+    )
+
+
+def _samples(sources: list, fps: array, headings_only: tuple = ()) -> list[str]:
+    """First lines of the path sources whose fingerprint is in fps (at most 2)."""
+    found = []
+    for index, source in enumerate(sources):
+        if not _is_path(source):
+            continue
+        for line in _iter_normalized(source, index in headings_only):
+            if line not in found and fp.contains(fps, fp.fingerprint(line)):
+                found.append(line)
+                if len(found) == 2:
+                    return found
+    return found
+
+
+def _failure(kind: str, count: int, detail: str, sample: list) -> tuple[bool, str]:
+    message = f"{kind}: {count} paragraphs {detail}"
+    if sample:
+        message += " (e.g., " + ", ".join(
+            f"'{p[:50]}...'" if len(p) > 50 else f"'{p}'" for p in sample
+        ) + ")"
+    return False, message
+
+
+def check_content_integrity_stream(raw_draft, draft_ok, draft_not_ok) -> tuple[bool, str]:
+    """
+    check_content_integrity over paths or line iterators, in one pass per input.
+
+    Args:
+        raw_draft: Original draft (path or lines)
+        draft_ok: Content matching outline (path or lines)
+        draft_not_ok: Content not matching outline (path or lines)
+
+    Returns:
+        (is_valid, error_message), as check_content_integrity
+
+    Example:
+        >>> check_content_integrity_stream(["A", "B", "C"], ["A"], ["C"])
+        (False, 'Lost content: 1 paragraphs missing from split')
+    """
+    raw_fps = stream_fingerprints(raw_draft)
+    ok_fps = stream_fingerprints(draft_ok)
+    not_ok_fps = stream_fingerprints(draft_not_ok)
+    combined_fps = fp.union(ok_fps, not_ok_fps)
+
+    missing = fp.difference(raw_fps, combined_fps)
+    if missing:
+        return _failure(
+            "Lost content", len(missing), "missing from split", _samples([raw_draft], missing)
+        )
+    added = fp.difference(combined_fps, raw_fps)
+    if added:
+        return _failure(
+            "Added content", len(added), "not in original", _samples([draft_ok, draft_not_ok], added)
+        )
+    overlap = fp.intersection(ok_fps, not_ok_fps)
+    if overlap:
+        return _failure(
+            "Duplicate content", len(overlap), "in both files", _samples([draft_ok], overlap)
+        )
+    return True, ""
+
+
+def check_reorganization_integrity_stream(draft_ok, outline_text, reorganized_text) -> tuple[bool, str]:
+    """
+    check_reorganization_integrity over paths or line iterators, in one pass per input.
+
+    Args:
+        draft_ok: Content matching outline (path or lines)
+        outline_text: The outline (path or lines; only its "#" lines are used)
+        reorganized_text: The reorganized content (path or lines)
+
+    Returns:
+        (is_valid, error_message), as check_reorganization_integrity
+    """
+    expected_fps = fp.union(
+        stream_fingerprints(draft_ok), stream_fingerprints(outline_text, headings_only=True)
+    )
+    reorganized_fps = stream_fingerprints(reorganized_text)
+
+    missing = fp.difference(expected_fps, reorganized_fps)
+    if missing:
+        return _failure(
+            "Lost content", len(missing), "missing",
+            _samples([draft_ok, outline_text], missing, headings_only=(1,)),
+        )
+    added = fp.difference(reorganized_fps, expected_fps)
+    if added:
+        return _failure(
+            "Added content", len(added), "not in draft or outline",
+            _samples([reorganized_text], added),
+        )
+    return True, ""
@@ -4,8 +4,17 @@ Text processing utilities for blog content manipulation.
 Pure functions for splitting, normalizing, and matching text content.
 """
 
+import time
 from difflib import SequenceMatcher
 
+from blogger.utils import fingerprints as fp
+from blogger.utils.markdown_model import ParsedMarkdown, iter_heading_lines, parse_markdown
+from blogger.utils.minhash import match_edits
+from blogger.utils.validation_cache import cached_by_content, normalized_lines
+
+# Inputs at least this large (in total) are checked in fingerprint mode
+FINGERPRINT_MIN_CHARS = 1_000_000
+
 
 def normalize_text(text: str) -> str:
     """
@@ -24,6 +33,8 @@ def extract_headings(text: str, level: int = 2) -> list[dict]:
     """
     Extract markdown headings from text.
 
+    Lines inside fenced code blocks (``` or ~~~) are not headings.
+
     Args:
         text: Markdown text
         level: Heading level to extract (2 for ##, 1 for #)
@@ -39,8 +50,17 @@ def extract_headings(text: str, level: int = 2) -> list[dict]:
     """
     prefix = '#' * level + ' '
     headings = []
+    fence = None
 
     for line_num, line in enumerate(text.split('\n')):
+        stripped = line.strip()
+        if fence:
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        if stripped.startswith(('```', '~~~')):
+            fence = stripped[:3]
+            continue
         if line.startswith(prefix):
             title = line[len(prefix):].strip()
             headings.append({
@@ -172,8 +192,72 @@ def normalize_and_split(text: str) -> set[str]:
     return normalized
 
 
+def _line_set(text: str) -> frozenset:
+    """normalize_and_split(text), cached by content hash (see validation_cache)."""
+    return normalized_lines(text or "", normalize_and_split)
+
+
+def _text(text) -> str:
+    """Raw text of a string or ParsedMarkdown input."""
+    return text.text if isinstance(text, ParsedMarkdown) else (text or "")
+
+
+def _lines(text) -> frozenset:
+    """Normalized line set of a string or ParsedMarkdown input."""
+    return text.line_set if isinstance(text, ParsedMarkdown) else _line_set(text)
+
+
+def _fingerprints(text: str):
+    """Sorted line fingerprints of a text, cached by content hash (see fingerprints)."""
+    return cached_by_content("fingerprints", text or "", fp.fingerprint_lines)
+
+
+def _use_fingerprints(fingerprint: bool | None, *texts) -> bool:
+    if fingerprint is None:
+        return sum(len(_text(t)) for t in texts) >= FINGERPRINT_MIN_CHARS
+    return fingerprint
+
+
+def _format_sample(sample: list[str]) -> str:
+    return ", ".join(
+        [f"'{p[:50]}...'" if len(p) > 50 else f"'{p}'" for p in sample]
+    )
+
+
+def _tolerate_edits(missing, added, tolerance: float) -> tuple[list, list, list]:
+    """
+    Pair nearly identical missing/added lines (tolerant mode, see minhash).
+
+    Returns:
+        (edits [(old, new, similarity)], missing lines left, added lines left)
+    """
+    missing, added = sorted(missing), sorted(added)
+    pairs = match_edits(missing, added, tolerance)
+    paired_missing = {i for i, _, _ in pairs}
+    paired_added = {j for _, j, _ in pairs}
+    return (
+        [(missing[i], added[j], similarity) for i, j, similarity in pairs],
+        [line for i, line in enumerate(missing) if i not in paired_missing],
+        [line for j, line in enumerate(added) if j not in paired_added],
+    )
+
+
+def _edits_note(edits: list) -> str:
+    """Message of a check that passed only thanks to edited lines ("" if none)."""
+    if not edits:
+        return ""
+    sample = ", ".join(
+        f"{_format_sample([old])} -> {_format_sample([new])}" for old, new, _ in edits[:2]
+    )
+    return f"Edited content: {len(edits)} paragraphs slightly changed (e.g., {sample})"
+
+
 def check_content_integrity(
-    raw_draft: str, draft_ok: str, draft_not_ok: str
+    raw_draft: str,
+    draft_ok: str,
+    draft_not_ok: str,
+    fingerprint: bool = None,
+    tolerance: float = None,
 ) -> tuple[bool, str]:
     """
     Check that content was redistributed, not rewritten or lost.
@@ -187,11 +271,17 @@ def check_content_integrity(
         raw_draft: Original draft content
         draft_ok: Content matching outline
         draft_not_ok: Content not matching outline
+        fingerprint: Compare 64-bit line fingerprints instead of the lines
+            themselves (bounded memory for huge drafts); None chooses
+            automatically from the input size (FINGERPRINT_MIN_CHARS)
+        tolerance: Tolerant mode: a lost and an added paragraph at least this
+            similar (0-1, e.g. 0.8) count as the same paragraph, edited
 
     Returns:
         (is_valid, error_message) tuple
         - is_valid: True if all checks pass
         - error_message: Empty string if valid, descriptive error if invalid
+          (in tolerant mode, a valid split with edits lists them instead)
 
     Examples:
         >>> # Valid split
@@ -210,14 +300,39 @@ def check_content_integrity(
         >>> check_content_integrity("A\\n\\nB\\n\\nC", "A\\n\\nB", "B\\n\\nC")
         (False, "Duplicate content: 1 paragraphs in both files (e.g., 'b')")
     """
-    # Normalize and split all texts
-    raw_paragraphs = normalize_and_split(raw_draft)
-    ok_paragraphs = normalize_and_split(draft_ok)
-    not_ok_paragraphs = normalize_and_split(draft_not_ok)
+    if _use_fingerprints(fingerprint, raw_draft, draft_ok, draft_not_ok):
+        return _check_content_integrity_fingerprints(raw_draft, draft_ok, draft_not_ok, tolerance)
+
+    # Normalize and split all texts (cached per text: retries re-send the same original)
+    return check_content_integrity_sets(
+        _line_set(raw_draft), _line_set(draft_ok), _line_set(draft_not_ok), tolerance
+    )
+
+
+def check_content_integrity_sets(
+    raw_paragraphs: frozenset,
+    ok_paragraphs: frozenset,
+    not_ok_paragraphs: frozenset,
+    tolerance: float = None,
+) -> tuple[bool, str]:
+    """
+    check_content_integrity on already normalized line sets (normalize_and_split).
+
+    For callers that normalize a document once and check it against many
+    others (see batch_validation).
+    """
     combined_paragraphs = ok_paragraphs | not_ok_paragraphs  # Union
 
-    # Check 1: All raw content exists in split (no lost content)
     missing_from_split = raw_paragraphs - combined_paragraphs
+    added_to_split = combined_paragraphs - raw_paragraphs
+    edits = []
+    if tolerance and missing_from_split and added_to_split:
+        # Tolerant mode: pair lost and added paragraphs that were only edited
+        edits, missing_from_split, added_to_split = _tolerate_edits(
+            missing_from_split, added_to_split, tolerance
+        )
+
+    # Check 1: All raw content exists in split (no lost content)
     if missing_from_split:
         # Show first few missing paragraphs (truncated)
         sample = list(missing_from_split)[:2]
@@ -230,7 +345,6 @@ def check_content_integrity(
         )
 
     # Check 2: All split content exists in raw (no added content)
-    added_to_split = combined_paragraphs - raw_paragraphs
     if added_to_split:
         # Show first few added paragraphs (truncated)
         sample = list(added_to_split)[:2]
@@ -254,10 +368,72 @@ def check_content_integrity(
             f"Duplicate content: {len(overlap)} paragraphs in both files (e.g., {sample_text})",
         )
 
-    return True, ""
+    return True, _edits_note(edits)
+
 
+def _fingerprint_differences(
+    source_texts: list, missing, result_texts: list, added, tolerance: float
+) -> tuple[int, list, int, list, list]:
+    """
+    Counts and sample lines of missing/added fingerprints, pairing edited
+    lines first in tolerant mode (their texts are recovered by rescanning).
 
-def check_outline_structure(outline_text: str) -> tuple[bool, list[str]]:
+    Returns:
+        (missing count, missing sample, added count, added sample, edits)
+    """
+    if tolerance and missing and added:
+        edits, missing_lines, added_lines = _tolerate_edits(
+            fp.sample_lines(source_texts, missing, limit=len(missing)),
+            fp.sample_lines(result_texts, added, limit=len(added)),
+            tolerance,
+        )
+        return len(missing_lines), missing_lines[:2], len(added_lines), added_lines[:2], edits
+    return (
+        len(missing),
+        fp.sample_lines(source_texts, missing) if missing else [],
+        len(added),
+        fp.sample_lines(result_texts, added) if added else [],
+        [],
+    )
+
+
+def _check_content_integrity_fingerprints(
+    raw_draft: str, draft_ok: str, draft_not_ok: str, tolerance: float = None
+) -> tuple[bool, str]:
+    """check_content_integrity on line fingerprints (same checks and messages)."""
+    raw_fps = _fingerprints(raw_draft)
+    ok_fps = _fingerprints(draft_ok)
+    not_ok_fps = _fingerprints(draft_not_ok)
+    combined_fps = fp.union(ok_fps, not_ok_fps)
+
+    missing_count, missing_sample, added_count, added_sample, edits = _fingerprint_differences(
+        [raw_draft], fp.difference(raw_fps, combined_fps),
+        [draft_ok, draft_not_ok], fp.difference(combined_fps, raw_fps),
+        tolerance,
+    )
+    if missing_count:
+        return (
+            False,
+            f"Lost content: {missing_count} paragraphs missing from split (e.g., {_format_sample(missing_sample)})",
+        )
+    if added_count:
+        return (
+            False,
+            f"Added content: {added_count} paragraphs not in original (e.g., {_format_sample(added_sample)})",
+        )
+
+    overlap = fp.intersection(ok_fps, not_ok_fps)
+    if overlap:
+        sample_text = _format_sample(fp.sample_lines([draft_ok], overlap))
+        return (
+            False,
+            f"Duplicate content: {len(overlap)} paragraphs in both files (e.g., {sample_text})",
+        )
+
+    return True, _edits_note(edits)
+
+
+def check_outline_structure(outline_text: str | ParsedMarkdown) -> tuple[bool, list[str]]:
     """
     Check if outline has required structure and sections.
 
@@ -268,7 +444,7 @@ def check_outline_structure(outline_text: str) -> tuple[bool, list[str]]:
     - Contains "Conclusion" section
 
     Args:
-        outline_text: The outline markdown text
+        outline_text: The outline markdown text (or its ParsedMarkdown)
 
     Returns:
         (is_valid, reasons) tuple
@@ -290,12 +466,13 @@ def check_outline_structure(outline_text: str) -> tuple[bool, list[str]]:
     reasons = []
 
     # Check 1: Not empty
-    if not outline_text:
+    outline = parse_markdown(outline_text)
+    if not outline.text:
         reasons.append("outline is empty")
         return False, reasons
 
-    # Check 2: Extract sections (lines starting with "## ")
-    sections = [line for line in outline_text.split("\n") if line.startswith("## ")]
+    # Check 2: Extract sections ("## " headings)
+    sections = outline.heading_lines(2)
     num_sections = len(sections)
 
     # Check 3: At least 3 sections
@@ -320,7 +497,11 @@ def check_outline_structure(outline_text: str) -> tuple[bool, list[str]]:
 
 
 def check_reorganization_integrity(
-    draft_ok: str, outline_text: str, reorganized_text: str
+    draft_ok: str | ParsedMarkdown,
+    outline_text: str | ParsedMarkdown,
+    reorganized_text: str | ParsedMarkdown,
+    fingerprint: bool = None,
+    tolerance: float = None,
 ) -> tuple[bool, str]:
     """
     Check that reorganized content preserves draft content and only adds outline headings.
@@ -333,11 +514,18 @@ def check_reorganization_integrity(
         draft_ok: Content matching outline (source)
         outline_text: The outline containing allowed headings
         reorganized_text: The reorganized content
+            (each text may also be given as its ParsedMarkdown)
+        fingerprint: Compare 64-bit line fingerprints instead of the lines
+            themselves (bounded memory for huge drafts); None chooses
+            automatically from the input size (FINGERPRINT_MIN_CHARS)
+        tolerance: Tolerant mode: a lost and an added paragraph at least this
+            similar (0-1, e.g. 0.8) count as the same paragraph, edited
 
     Returns:
         (is_valid, error_message) tuple
         - is_valid: True if all checks pass
         - error_message: Empty string if valid, descriptive error if invalid
+          (in tolerant mode, a valid result with edits lists them instead)
 
     Examples:
         >>> # Valid: reorganized contains draft + outline heading
@@ -352,25 +540,44 @@ def check_reorganization_integrity(
         >>> check_reorganization_integrity("Content", "# Title", "# Title\\n\\nContent\\n\\nNew stuff")
         (False, "Added content: 1 paragraphs not in draft or outline (e.g., 'new stuff')")
     """
+    if _use_fingerprints(fingerprint, draft_ok, outline_text, reorganized_text):
+        return _check_reorganization_integrity_fingerprints(
+            _text(draft_ok), _text(outline_text), _text(reorganized_text), tolerance
+        )
+
     # 1. Normalize and split all texts
-    draft_paragraphs = normalize_and_split(draft_ok)
+    draft_paragraphs = _lines(draft_ok)
 
     # Only consider HEADINGS from the outline as authorized/expected content.
     # Ignore descriptions/body text within the outline.
-    outline_lines = outline_text.split('\n')
-    outline_paragraphs = {
-        line.strip().lower()
-        for line in outline_lines
-        if line.strip().startswith('#')
-    }
+    outline_paragraphs = parse_markdown(outline_text).hash_lines
 
-    reorganized_paragraphs = normalize_and_split(reorganized_text)
+    reorganized_paragraphs = _lines(reorganized_text)
 
     # 2. Define Expected Content: Union of draft content and outline headings
-    expected_paragraphs = draft_paragraphs | outline_paragraphs
+    return check_reorganization_integrity_sets(
+        draft_paragraphs | outline_paragraphs, reorganized_paragraphs, tolerance
+    )
+
+
+def check_reorganization_integrity_sets(
+    expected_paragraphs: frozenset, reorganized_paragraphs: frozenset, tolerance: float = None
+) -> tuple[bool, str]:
+    """
+    check_reorganization_integrity on already normalized line sets: the
+    draft's lines plus the outline's "#" lines, and the reorganized lines.
+    """
 
-    # 3. Check for Lost Content: Ensure all expected paragraphs exist in reorganized
     missing_content = expected_paragraphs - reorganized_paragraphs
+    added_content = reorganized_paragraphs - expected_paragraphs
+    edits = []
+    if tolerance and missing_content and added_content:
+        # Tolerant mode: pair lost and added paragraphs that were only edited
+        edits, missing_content, added_content = _tolerate_edits(
+            missing_content, added_content, tolerance
+        )
+
+    # 3. Check for Lost Content: Ensure all expected paragraphs exist in reorganized
     if missing_content:
         sample = list(missing_content)[:2]
         sample_text = ", ".join(
@@ -382,7 +589,6 @@ def check_reorganization_integrity(
         )
 
     # 4. Check for Unauthorized Additions: Identify paragraphs in reorganized not in expected
-    added_content = reorganized_paragraphs - expected_paragraphs
     if added_content:
         sample = list(added_content)[:2]
         sample_text = ", ".join(
@@ -393,30 +599,75 @@ def check_reorganization_integrity(
             f"Added content: {len(added_content)} paragraphs not in draft or outline (e.g., {sample_text})",
         )
 
-    return True, ""
+    return True, _edits_note(edits)
+
+
+def _check_reorganization_integrity_fingerprints(
+    draft_ok: str, outline_text: str, reorganized_text: str, tolerance: float = None
+) -> tuple[bool, str]:
+    """check_reorganization_integrity on line fingerprints (same checks and messages)."""
+    draft_fps = _fingerprints(draft_ok)
+    outline_headings = "\n".join(
+        line for line in fp.iter_lines(outline_text) if line.strip().startswith('#')
+    )
+    expected_fps = fp.union(draft_fps, fp.fingerprint_lines(outline_headings))
+    reorganized_fps = _fingerprints(reorganized_text)
+
+    missing_count, missing_sample, added_count, added_sample, edits = _fingerprint_differences(
+        [draft_ok, outline_headings], fp.difference(expected_fps, reorganized_fps),
+        [reorganized_text], fp.difference(reorganized_fps, expected_fps),
+        tolerance,
+    )
+    if missing_count:
+        return (
+            False,
+            f"Lost content: {missing_count} paragraphs missing (e.g., {_format_sample(missing_sample)})",
+        )
+    if added_count:
+        return (
+            False,
+            f"Added content: {added_count} paragraphs not in draft or outline (e.g., {_format_sample(added_sample)})",
+        )
 
+    return True, _edits_note(edits)
 
-def check_heading_order(outline_text: str, reorganized_text: str) -> tuple[bool, str]:
+
+def check_heading_order(
+    outline_text: str | ParsedMarkdown, reorganized_text: str | ParsedMarkdown
+) -> tuple[bool, str]:
     """
     Check if Level 2 headings (##) in reorganized text match the order in the outline.
 
+    Lines inside fenced code blocks are not headings.
+
     Args:
-        outline_text: The source outline
-        reorganized_text: The reorganized content
+        outline_text: The source outline (or its ParsedMarkdown)
+        reorganized_text: The reorganized content (or its ParsedMarkdown)
 
     Returns:
         (is_valid, error_message)
     """
-    def extract_headings(text: str) -> list[str]:
-        return [
-            line.strip().lower()
-            for line in text.split("\n")
-            if line.strip().startswith("## ")
-        ]
+    return check_heading_lists(
+        parse_markdown(outline_text).heading_lines(2),
+        parse_markdown(reorganized_text).heading_lines(2),
+    )
+
+
+def check_heading_lists(outline_headings: list[str], reorg_headings: list[str]) -> tuple[bool, str]:
+    """
+    check_heading_order over already extracted heading lines (no parsing, no cache).
+
+    Args:
+        outline_headings: Normalized "## " lines of the outline, in order
+        reorg_headings: Normalized "## " lines of the reorganized content, in order
 
-    outline_headings = extract_headings(outline_text)
-    reorg_headings = extract_headings(reorganized_text)
+    Returns:
+        (is_valid, error_message)
 
+    Example:
+        >>> check_heading_lists(["## a", "## b"], ["## b", "## a"])
+        (False, "Heading order mismatch at #1: expected '## a', found '## b'")
+    """
     # 1. Check for exact match first
     if outline_headings == reorg_headings:
         return True, ""
@@ -443,3 +694,78 @@ def check_heading_order(outline_text: str, reorganized_text: str) -> tuple[bool,
             return False, f"Heading order mismatch at #{i+1}: expected '{out_h}', found '{reorg_h}'"
 
     return True, ""
+
+
+def check_organization(
+    draft_ok: str,
+    outline_text: str,
+    reorganized_text: str,
+    tolerance: float = None,
+) -> dict:
+    """
+    Run every organization check over one shared parse of each input.
+
+    The outline and the reorganized text are parsed once (parse_markdown)
+    and the parsed models are handed to check_reorganization_integrity,
+    check_heading_order and check_outline_structure.
+
+    Above FINGERPRINT_MIN_CHARS the reorganized text is not parsed (a
+    cached model would hold several times its size): the integrity check
+    runs on fingerprints and the heading order on the "## " lines streamed
+    out of it (iter_heading_lines).
+
+    Args:
+        draft_ok: Content matching outline (source)
+        outline_text: The outline
+        reorganized_text: The reorganized content
+        tolerance: Tolerant mode of the integrity check (see check_reorganization_integrity)
+
+    Returns:
+        {
+            "integrity": (is_valid, message),
+            "heading_order": (is_valid, message),
+            "outline_structure": (is_valid, reasons),
+            "timings_ms": {"parse": ms, "integrity": ms, "heading_order": ms, "outline_structure": ms}
+        }
+
+    Example:
+        >>> report = check_organization("Text", "## Intro", "## Intro\\nText")
+        >>> report["integrity"], report["heading_order"]
+        ((True, ''), (True, ''))
+    """
+    timings = {}
+
+    def timed(name: str, check, *args, **kwargs):
+        started = time.perf_counter()
+        result = check(*args, **kwargs)
+        timings[name] = round((time.perf_counter() - started) * 1000, 3)
+        return result
+
+    if _use_fingerprints(None, draft_ok, outline_text, reorganized_text):
+        outline, headings = timed(
+            "parse", lambda: (parse_markdown(outline_text), list(iter_heading_lines(reorganized_text, 2)))
+        )
+        return {
+            "integrity": timed(
+                "integrity", check_reorganization_integrity,
+                draft_ok, outline, reorganized_text, fingerprint=True, tolerance=tolerance,
+            ),
+            "heading_order": timed(
+                "heading_order", check_heading_lists, outline.heading_lines(2), headings
+            ),
+            "outline_structure": timed("outline_structure", check_outline_structure, outline),
+            "timings_ms": timings,
+        }
+
+    outline, reorganized = timed(
+        "parse", lambda: (parse_markdown(outline_text), parse_markdown(reorganized_text))
+    )
+    return {
+        "integrity": timed(
+            "integrity", check_reorganization_integrity,
+            draft_ok, outline, reorganized, tolerance=tolerance,
+        ),
+        "heading_order": timed("heading_order", check_heading_order, outline, reorganized),
+        "outline_structure": timed("outline_structure", check_outline_structure, outline),
+        "timings_ms": timings,
+    }
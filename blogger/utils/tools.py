@@ -1,7 +1,10 @@
+import heapq
 import re
 import shutil
+import time
 import urllib.request
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from urllib.error import HTTPError, URLError
@@ -10,17 +13,209 @@ from google import genai
 
 from blogger.utils.text_utils import (
     check_content_integrity,
-    check_heading_order,
-    check_reorganization_integrity,
+    check_organization,
     extract_headings,
     find_best_heading_match,
     split_text_by_headings,
 )
+from blogger.utils.batch_validation import BATCH_MAX_CANDIDATES, validate_candidates
+from blogger.utils.blob_store import SECTION_REF_PREFIX, get_blob_store
+from blogger.utils.doc_cache import get_document_cache
+from blogger.utils.html_text import stream_article, stream_text
+from blogger.utils.http_cache import HttpCache
+from blogger.utils.http_pool import DeadlineExceeded, get_connection_pool
+from blogger.utils.layout import blog_dir
+from blogger.utils.line_diff import diagnose_content_split, diagnose_reorganization
+from blogger.utils.markdown_model import ParsedMarkdown
+from blogger.utils.ranged_read import read_range, text_size
+from blogger.utils.search_index import get_search_index
+from blogger.utils.section_check import revalidate_section
+from blogger.utils.validation_cache import cached_verdict, content_hash, stage_text, staged_text
+from blogger.utils.section_journal import (
+    JOURNAL_FILENAME,
+    ORGANIZED_FILENAME,
+    STALE_JOURNAL_FILENAME,
+    compact,
+    discard_journal,
+    pop_discarded,
+    read_organized,
+    save_section,
+)
+from blogger.utils.watcher import get_posts_watcher
+from blogger.utils.workflow_index import (
+    WORKFLOW_STATES,
+    format_entry,
+    get_workflow_index,
+    workflow_state,
+)
 
 CURRENT_DIR = Path(__file__).parent.parent.parent
 POSTS_DIR = CURRENT_DIR / "posts"
+HTTP_CACHE_DIR = CURRENT_DIR / ".cache" / "http"
 draft_filename = "draft.md"
 
+# infer_blog_id_tool picks a hint match on its own only when it scores at
+# least this much and leads the runner-up by the margin
+CONFIDENT_MATCH_SCORE = 0.5
+CONFIDENT_MATCH_MARGIN = 0.15
+
+
+def _blog_dir(blog_id: str) -> Path:
+    """Directory of a blog under the configured posts/ layout (flat or sharded)."""
+    return blog_dir(POSTS_DIR, blog_id)
+
+
+def _blog_changed(blog_id: str) -> None:
+    """Record a freshly written step file in the caches and the workflow index (best effort)."""
+    get_document_cache().invalidate(_blog_dir(blog_id))
+    watcher = get_posts_watcher(POSTS_DIR)
+    if watcher is not None:
+        # Don't wait for the (asynchronous) change notification
+        watcher.notify_changed(blog_id)
+    try:
+        get_workflow_index(POSTS_DIR).update_blog(blog_id)
+    except OSError:
+        # The index is a cache: a failed update is caught by the next
+        # directory-mtime revalidation and must never fail the save itself.
+        pass
+
+
+def _record_version(blog_id: str, ref: str, content: str) -> dict | None:
+    """Keep the saved content as a version of `ref` in the blob store (best effort)."""
+    try:
+        return get_blob_store(POSTS_DIR).record(blog_id, ref, content)
+    except OSError:
+        # Version history is a convenience: never fail the save itself
+        return None
+
+
+def _read_text(path: Path) -> str:
+    """Read a text file through the watcher (if running) or the document cache."""
+    watcher = get_posts_watcher(POSTS_DIR)
+    if watcher is not None:
+        return watcher.read_text(path)
+    return get_document_cache().get(path).text
+
+
+def _organized_document(directory: Path):
+    """The organized draft of a blog directory (with journaled sections) as a cached Document."""
+    return get_document_cache().get(
+        directory / ORGANIZED_FILENAME,
+        loader=lambda: read_organized(directory),
+        watch=(directory / ORGANIZED_FILENAME, directory / JOURNAL_FILENAME),
+    )
+
+
+def _discarded_sections(discarded: list[dict]) -> dict:
+    """Result fields reporting journaled section edits lost to a replaced organized draft."""
+    if not discarded:
+        return {}
+    headings = ", ".join(f"'{entry['heading']}'" for entry in discarded)
+    return {
+        "discarded_sections": discarded,
+        "warning": (
+            f"2-draft_organized.md was replaced: the saved edits of {headings} are not in it "
+            f"(kept in {STALE_JOURNAL_FILENAME}). Polish these sections again."
+        ),
+    }
+
+
+def _step_text(blog_id: str, step: str) -> str:
+    """
+    Text of a saved step of a blog ("draft", "1-outline", "draft_ok", ...).
+
+    The organized draft includes its journaled section edits.
+
+    Raises:
+        FileNotFoundError: If the step was never saved
+    """
+    directory = _blog_dir(blog_id)
+    step = step.removesuffix(".md")
+    path = directory / f"{step}.md"
+    if not _path_exists(path):
+        raise FileNotFoundError(f"Step '{step}' not found for blog '{blog_id}' ({path})")
+    if path.name == ORGANIZED_FILENAME:
+        return _organized_document(directory).text
+    return _read_text(path)
+
+
+def _resolve_texts(blog_id: str | None, inputs: dict) -> tuple[dict, dict]:
+    """
+    Fill in the validation inputs that were passed as step references.
+
+    Args:
+        blog_id: Blog to read referenced steps from (None: every text must be given)
+        inputs: {name: (text or None, step or None, default step)}
+
+    Returns:
+        ({name: text}, {name: content_ref}) where content refs are only
+        given for texts passed inline
+
+    Raises:
+        ValueError: A text is missing and can't be read from a step
+        FileNotFoundError: A referenced step doesn't exist
+    """
+    texts, refs = {}, {}
+    for name, (text, step, default_step) in inputs.items():
+        if text is not None and step is None:
+            texts[name] = text
+            refs[name] = stage_text(text)
+        elif blog_id is None:
+            raise ValueError(f"Missing {name}: pass the text, or blog_id to read it from a saved step")
+        else:
+            texts[name] = _step_text(blog_id, step or default_step)
+    return texts, refs
+
+
+def _parse_sections(text: str) -> dict:
+    """
+    Split a document into its "## " sections.
+
+    Returns:
+        {"headings": [...], "chunks": [...], "chunk_offset": int} where the
+        section of headings[i] is chunks[i + chunk_offset]
+    """
+    headings = extract_headings(text, level=2)
+    if not headings:
+        return {"headings": [], "chunks": [text], "chunk_offset": 0}
+    positions = [h['line_num'] for h in headings]
+    return {
+        "headings": headings,
+        "chunks": split_text_by_headings(text, positions),
+        "chunk_offset": 1 if positions[0] > 0 else 0,
+    }
+
+
+def _read_content(path: Path, offset: int, limit: int, unit: str, heading: str) -> dict:
+    """
+    Read a whole file, or only a range of it when offset/limit/heading is given.
+
+    Returns:
+        {"content": "...", "total_bytes": int, "total_lines": int, ...} plus
+        the range fields of read_range() for ranged reads
+
+    Raises:
+        ValueError / LookupError: Invalid range or heading not found
+    """
+    ranged = offset is not None or limit is not None or heading is not None
+    if path.name == ORGANIZED_FILENAME:
+        content = _organized_document(path.parent).text  # Include journaled sections
+        if ranged:
+            return read_range(content.encode("utf-8"), offset, limit, unit, heading)
+    elif ranged:
+        return read_range(path, offset, limit, unit, heading)
+    else:
+        content = _read_text(path)
+    return {"content": content, **text_size(content)}
+
+
+def _path_exists(path: Path) -> bool:
+    """Path.exists(), answered from memory when a posts/ watcher is running."""
+    watcher = get_posts_watcher(POSTS_DIR)
+    if watcher is not None:
+        return watcher.exists(path)
+    return path.exists()
+
 
 # ============================================================================
 # Workflow Discovery Tools: Agent autonomy and context inference
@@ -30,20 +225,31 @@ draft_filename = "draft.md"
 # without requiring users to specify blog_id in every message.
 # ============================================================================
 
-def get_workflow_status_tool() -> dict:
+def get_workflow_status_tool(
+    limit: int = 20,
+    since: str = None,
+    step: int = None,
+    status: str = None,
+) -> dict:
     """
-    Discover all blogs and their workflow progress.
+    Discover blogs and their workflow progress.
 
     Use this when:
     - User says "continue" or "next step" without specifying blog_id
     - Starting a session and need to find what to work on
     - User asks "where did we leave off?"
 
-    Returns workflow state for all blogs in posts/ directory:
+    Returns workflow state for the most recently modified blogs in posts/:
     - Which steps are complete (has 1-outline.md, 2-draft_organized.md, etc.)
     - Last modified timestamps
     - Recommended next action
 
+    Args:
+        limit: Maximum number of blogs to return, most recent first (0 = all)
+        since: Only blogs modified on/after this ISO date (e.g., "2025-12-01")
+        step: Only blogs whose current_step equals this value (0-3)
+        status: Only blogs in this state: "not_started", "in_progress" or "complete"
+
     Returns:
         Success: {
             "status": "success",
@@ -57,16 +263,20 @@ def get_workflow_status_tool() -> dict:
                     "files": {...}
                 }
             ],
-            "recommended": "my-post"  # Most recently modified
+            "recommended": "my-post",  # Most recently modified match
+            "total_blogs": 42,  # All blogs in posts/
+            "matched_blogs": 3  # Blogs passing the filters (before limit)
         }
         Error: {"status": "error", "message": "..."}
 
     Example:
-        >>> get_workflow_status_tool()
+        >>> get_workflow_status_tool(limit=5, status="in_progress")
         {
             "status": "success",
             "blogs": [{"blog_id": "my-ai-journey-2", "current_step": 2, ...}],
-            "recommended": "my-ai-journey-2"
+            "recommended": "my-ai-journey-2",
+            "total_blogs": 2,
+            "matched_blogs": 1
         }
     """
     try:
@@ -76,67 +286,43 @@ def get_workflow_status_tool() -> dict:
                 "message": f"Posts directory not found: {POSTS_DIR}"
             }
 
-        blogs = []
-        for blog_dir in POSTS_DIR.iterdir():
-            if not blog_dir.is_dir():
-                continue
-
-            blog_id = blog_dir.name
-            files = {
-                "draft": (blog_dir / "draft.md").exists(),
-                "outline": (blog_dir / "1-outline.md").exists(),
-                "organized": (blog_dir / "2-draft_organized.md").exists(),
-                "final": (blog_dir / "3-final.md").exists(),
+        if status is not None and status not in WORKFLOW_STATES:
+            return {
+                "status": "error",
+                "message": f"Invalid status filter '{status}'. Use one of: {', '.join(WORKFLOW_STATES)}"
             }
 
-            # Determine current step based on completed files
-            if files["final"]:
-                current_step = 3
-                next_action = "Complete!"
-            elif files["organized"]:
-                current_step = 3
-                next_action = "Run Writer (Step 3)"
-            elif files["outline"]:
-                current_step = 2
-                next_action = "Run Curator (Step 2)"
-            elif files["draft"]:
-                current_step = 1
-                next_action = "Run Architect (Step 1)"
-            else:
-                current_step = 0
-                next_action = "Create draft.md"
-
-            completed_steps = []
-            if files["outline"]:
-                completed_steps.append(1)
-            if files["organized"]:
-                completed_steps.append(2)
-            if files["final"]:
-                completed_steps.append(3)
-
-            # Get last modified time (check all step files)
-            timestamps = []
-            for filename in ["draft.md", "1-outline.md", "2-draft_organized.md", "3-final.md"]:
-                filepath = blog_dir / filename
-                if filepath.exists():
-                    timestamps.append(filepath.stat().st_mtime)
-
-            last_modified = max(timestamps) if timestamps else 0
-
-            blogs.append({
-                "blog_id": blog_id,
-                "current_step": current_step,
-                "completed_steps": completed_steps,
-                "next_action": next_action,
-                "last_modified": last_modified,
-                "last_modified_human":
-                    __import__("datetime").datetime.fromtimestamp(last_modified).isoformat()
-                    if last_modified else "never",
-                "files": files,
-            })
+        since_ts = None
+        if since:
+            try:
+                since_ts = datetime.fromisoformat(since).timestamp()
+            except ValueError:
+                return {
+                    "status": "error",
+                    "message": f"Invalid 'since' date '{since}'. Use ISO format, e.g. 2025-12-18 or 2025-12-18T14:30:00"
+                }
+
+        # Served from the persisted index: only blogs whose directory changed
+        # since the last query are re-read from disk.
+        entries = get_workflow_index(POSTS_DIR).refresh()
+
+        # Filter on the raw entries and keep only sort keys, so the output
+        # dicts are built for the returned blogs only.
+        matches = [
+            (entry["last_modified"], blog_id)
+            for blog_id, entry in entries.items()
+            if (since_ts is None or entry["last_modified"] >= since_ts)
+            and (step is None or entry["current_step"] == step)
+            and (status is None or workflow_state(entry) == status)
+        ]
+
+        # Most recent first: heap-based top-k instead of sorting every match
+        if limit and limit > 0:
+            top = heapq.nlargest(limit, matches)
+        else:
+            top = sorted(matches, reverse=True)
 
-        # Sort by last modified (most recent first)
-        blogs.sort(key=lambda b: b["last_modified"], reverse=True)
+        blogs = [format_entry(blog_id, entries[blog_id]) for _, blog_id in top]
 
         # Recommend most recently modified blog
         recommended = blogs[0]["blog_id"] if blogs else None
@@ -145,7 +331,8 @@ def get_workflow_status_tool() -> dict:
             "status": "success",
             "blogs": blogs,
             "recommended": recommended,
-            "total_blogs": len(blogs),
+            "total_blogs": len(entries),
+            "matched_blogs": len(matches),
         }
     except Exception as e:
         return {
@@ -166,6 +353,10 @@ def infer_blog_id_tool(hint: str = None) -> dict:
     Args:
         hint: Optional text hint from user (e.g., "AI journey", "my post")
 
+    Hints are matched against blog_ids, draft titles (# H1) and section
+    headings (##) through a trigram index, so "the agents post" finds a blog
+    with a "## Working with AI agents" section.
+
     Returns:
         Success: {
             "status": "success",
@@ -175,7 +366,7 @@ def infer_blog_id_tool(hint: str = None) -> dict:
         }
         Multiple matches: {
             "status": "success",
-            "candidates": ["blog1", "blog2"],
+            "candidates": [{"blog_id": "blog1", "score": 0.92, "title": "..."}, ...],
             "message": "Found multiple matches..."
         }
         Error: {"status": "error", "message": "..."}
@@ -185,61 +376,67 @@ def infer_blog_id_tool(hint: str = None) -> dict:
         {"status": "success", "blog_id": "my-ai-journey-2", "confidence": "high"}
     """
     try:
-        # Get all blogs
-        status = get_workflow_status_tool()
-        if status["status"] == "error":
-            return status
+        if not POSTS_DIR.exists():
+            return {
+                "status": "error",
+                "message": f"Posts directory not found: {POSTS_DIR}"
+            }
 
-        blogs = status["blogs"]
-        if not blogs:
+        # Get all blogs
+        entries = get_workflow_index(POSTS_DIR).refresh()
+        if not entries:
             return {
                 "status": "error",
                 "message": "No blogs found in posts/ directory. Create a draft.md first."
             }
 
         # Case 1: Only one blog exists
-        if len(blogs) == 1:
+        if len(entries) == 1:
+            blog_id, entry = next(iter(entries.items()))
             return {
                 "status": "success",
-                "blog_id": blogs[0]["blog_id"],
+                "blog_id": blog_id,
                 "confidence": "high",
                 "reason": "Only one blog found",
-                "blog_info": blogs[0],
+                "blog_info": format_entry(blog_id, entry),
             }
 
-        # Case 2: Hint provided - fuzzy match blog_id
+        # Case 2: Hint provided - ranked match on ids, titles and headings
         if hint:
-            hint_lower = hint.lower()
-            matches = [
-                b for b in blogs
-                if hint_lower in b["blog_id"].lower()
-            ]
+            matches = get_search_index(POSTS_DIR).search(hint, limit=5)
 
-            if len(matches) == 1:
+            best = matches[0] if matches else None
+            runner_up = matches[1]["score"] if len(matches) > 1 else 0.0
+            if (best and best["score"] >= CONFIDENT_MATCH_SCORE
+                    and best["score"] - runner_up >= CONFIDENT_MATCH_MARGIN):
                 return {
                     "status": "success",
-                    "blog_id": matches[0]["blog_id"],
+                    "blog_id": best["blog_id"],
                     "confidence": "high",
-                    "reason": f"Matched hint '{hint}' to blog_id",
-                    "blog_info": matches[0],
+                    "score": best["score"],
+                    "reason": f"Matched hint '{hint}' to blog '{best['blog_id']}'",
+                    "blog_info": format_entry(best["blog_id"], entries[best["blog_id"]]),
                 }
-            elif len(matches) > 1:
+            elif matches:
                 return {
                     "status": "success",
-                    "candidates": [m["blog_id"] for m in matches],
+                    "candidates": matches,
                     "confidence": "low",
                     "message": f"Found {len(matches)} blogs matching '{hint}': {', '.join([m['blog_id'] for m in matches])}. Please specify."
                 }
 
         # Case 3: Multiple blogs, no hint - recommend most recent
-        most_recent = blogs[0]
+        recent = heapq.nlargest(
+            3, entries.items(), key=lambda item: item[1]["last_modified"]
+        )
+        most_recent_id, most_recent = recent[0]
         return {
             "status": "success",
-            "blog_id": most_recent["blog_id"],
+            "blog_id": most_recent_id,
             "confidence": "medium",
             "reason": "Most recently modified blog",
-            "blog_info": most_recent,
-            "alternatives": [b["blog_id"] for b in blogs[1:3]],  # Show top 3
+            "blog_info": format_entry(most_recent_id, most_recent),
+            "alternatives": [blog_id for blog_id, _ in recent[1:]],  # Show top 3
         }
 
     except Exception as e:
@@ -249,35 +446,49 @@ def infer_blog_id_tool(hint: str = None) -> dict:
         }
 
 
-def read_draft_tool(blog_id: str) -> dict:
+def read_draft_tool(
+    blog_id: str,
+    offset: int = None,
+    limit: int = None,
+    unit: str = "lines",
+    heading: str = None,
+) -> dict:
     """
     Retrieves the raw draft content for a blog post.
 
     Use this to load the initial draft markdown file that needs to be processed
-    through the blog writing pipeline.
+    through the blog writing pipeline. For very long drafts, read it in pages
+    (offset/limit) or one section at a time (heading).
 
     Args:
         blog_id: Unique identifier for the blog (e.g., "my-ai-journey-2")
+        offset: Optional first line (or byte) to read, 0-based; use next_offset to continue
+        limit: Optional maximum number of lines (or bytes) to return
+        unit: "lines" (default) or "bytes" for offset/limit
+        heading: Optional heading to read only that section (offset/limit then page within it)
 
     Returns:
-        Success: {"status": "success", "content": "...", "blog_id": "...", "path": "..."}
+        Success: {"status": "success", "content": "...", "blog_id": "...", "path": "...", "total_bytes": 1234, "total_lines": 56}
         Error: {"status": "error", "message": "Actionable error description"}
+
+        total_bytes/total_lines give the full file size. Ranged reads also return
+        "range" ({"unit", "start", "end", "total"}), "has_more" and "next_offset".
     """
-    draft_path = POSTS_DIR / blog_id / draft_filename
-    if not draft_path.exists():
+    draft_path = _blog_dir(blog_id) / draft_filename
+    if not _path_exists(draft_path):
         return {
             "status": "error",
             "message": f"Draft file not found for blog_id '{blog_id}'. Check the blog_id and ensure draft.md exists in posts/{blog_id}/",
         }
     try:
-        with open(draft_path, "r") as f:
-            content = f.read()
         return {
             "status": "success",
             "blog_id": blog_id,
             "path": str(draft_path),
-            "content": content,
+            **_read_content(draft_path, offset, limit, unit, heading),
         }
+    except (ValueError, LookupError) as e:
+        return {"status": "error", "message": str(e)}
     except Exception as e:
         return {
             "status": "error",
@@ -285,34 +496,73 @@ def read_draft_tool(blog_id: str) -> dict:
         }
 
 
-def save_step_tool(blog_id: str, step_name: str, content: str) -> dict:
+def save_step_tool(
+    blog_id: str,
+    step_name: str,
+    content: str = None,
+    content_ref: str = None,
+    source_step: str = None,
+) -> dict:
     """
     Saves content from a pipeline step to a markdown file.
 
     Use this to persist the output of any pipeline step (e.g., outlines,
     organized draft, polished content) for the given blog.
 
+    Instead of sending the content again, you can pass:
+    - content_ref: the reference a validation tool returned for a text it
+      checked (in "content_refs"), to save exactly that text
+    - source_step: another saved step of this blog to copy (e.g. save
+      "outline_v5" as "1-outline")
+
     Args:
         blog_id: Unique identifier for the blog (e.g., "my-ai-journey-2")
         step_name: Name of the step (e.g., "draft_ok")
         content: Content to save for the step
+        content_ref: Reference of a validated text to save instead of content
+        source_step: Name of a saved step to copy instead of content
 
     Returns:
         Success: {"status": "success", "blog_id": "...", "path": "...", "step_name": "..."}
         Error: {"status": "error", "message": "Actionable error description"}
     """
     try:
-        output_path = POSTS_DIR / blog_id / f"{step_name}.md"
+        sources = [x for x in (content, content_ref, source_step) if x is not None]
+        if len(sources) != 1:
+            return {
+                "status": "error",
+                "message": "Pass exactly one of content, content_ref or source_step",
+            }
+        if content_ref is not None:
+            content = staged_text(content_ref)
+            if content is None:
+                return {
+                    "status": "error",
+                    "message": f"Unknown or expired content_ref '{content_ref}'. Pass the content itself.",
+                }
+        elif source_step is not None:
+            content = _step_text(blog_id, source_step)
+
+        output_path = _blog_dir(blog_id) / f"{step_name}.md"
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w") as f:
             f.write(content)
 
+        discarded = []
+        if output_path.name == ORGANIZED_FILENAME:
+            # A new organized draft supersedes any journaled section edits
+            discarded = discard_journal(output_path.parent)
+
+        _blog_changed(blog_id)
+        _record_version(blog_id, step_name, content)
+
         return {
             "status": "success",
             "blog_id": blog_id,
             "path": str(output_path),
             "step_name": step_name,
+            **_discarded_sections(discarded),
         }
     except Exception as e:
         return {
@@ -321,7 +571,13 @@ def save_step_tool(blog_id: str, step_name: str, content: str) -> dict:
         }
 
 
-def read_previous_content_tool(blog_id: str) -> dict:
+def read_previous_content_tool(
+    blog_id: str,
+    offset: int = None,
+    limit: int = None,
+    unit: str = "lines",
+    heading: str = None,
+) -> dict:
     """
     Retrieves the content of a previous blog post.
 
@@ -330,18 +586,25 @@ def read_previous_content_tool(blog_id: str) -> dict:
 
     Args:
         blog_id: Unique identifier for the previous blog (e.g., "my-ai-journey-1")
+        offset: Optional first line (or byte) to read, 0-based; use next_offset to continue
+        limit: Optional maximum number of lines (or bytes) to return
+        unit: "lines" (default) or "bytes" for offset/limit
+        heading: Optional heading to read only that section (offset/limit then page within it)
 
     Returns:
-        Success: {"status": "success", "content": "...", "blog_id": "...", "path": "..."}
+        Success: {"status": "success", "content": "...", "blog_id": "...", "path": "...", "total_bytes": 1234, "total_lines": 56}
         Error: {"status": "error", "message": "Actionable error description"}
+
+        total_bytes/total_lines give the full file size. Ranged reads also return
+        "range" ({"unit", "start", "end", "total"}), "has_more" and "next_offset".
     """
     # Try multiple possible filenames
     possible_files = ["content.md", "index.md", "final.md", "draft.md"]
     content_path = None
 
     for filename in possible_files:
-        path = POSTS_DIR / blog_id / filename
-        if path.exists():
+        path = _blog_dir(blog_id) / filename
+        if _path_exists(path):
             content_path = path
             break
 
@@ -351,14 +614,14 @@ def read_previous_content_tool(blog_id: str) -> dict:
             "message": f"Content file not found for blog_id '{blog_id}'. Checked: {', '.join(possible_files)} in posts/{blog_id}/",
         }
     try:
-        with open(content_path, "r") as f:
-            content = f.read()
         return {
             "status": "success",
             "blog_id": blog_id,
             "path": str(content_path),
-            "content": content,
+            **_read_content(content_path, offset, limit, unit, heading),
         }
+    except (ValueError, LookupError) as e:
+        return {"status": "error", "message": str(e)}
     except Exception as e:
         return {
             "status": "error",
@@ -366,7 +629,13 @@ def read_previous_content_tool(blog_id: str) -> dict:
         }
 
 
-def read_file_tool(file_path: str) -> dict:
+def read_file_tool(
+    file_path: str,
+    offset: int = None,
+    limit: int = None,
+    unit: str = "lines",
+    heading: str = None,
+) -> dict:
     """
     Reads any markdown file from the project.
 
@@ -375,18 +644,29 @@ def read_file_tool(file_path: str) -> dict:
 
     Args:
         file_path: Path to the file (e.g., "posts/my-ai-journey-2/outline_v1.md")
+        offset: Optional first line (or byte) to read, 0-based; use next_offset to continue
+        limit: Optional maximum number of lines (or bytes) to return
+        unit: "lines" (default) or "bytes" for offset/limit
+        heading: Optional heading to read only that section (offset/limit then page within it)
 
     Returns:
-        Success: {"status": "success", "content": "...", "path": "..."}
+        Success: {"status": "success", "content": "...", "path": "...", "total_bytes": 1234, "total_lines": 56}
         Error: {"status": "error", "message": "..."}
+
+        total_bytes/total_lines give the full file size. Ranged reads also return
+        "range" ({"unit", "start", "end", "total"}), "has_more" and "next_offset".
     """
     try:
         path = Path(file_path)
         # If relative path, resolve from project root
         if not path.is_absolute():
             path = CURRENT_DIR / file_path
+            # "posts/<blog_id>/<file>" may live in a shard directory
+            parts = Path(file_path).parts
+            if len(parts) == 3 and parts[0] == "posts" and not _path_exists(path):
+                path = _blog_dir(parts[1]) / parts[2]
 
-        if not path.exists():
+        if not _path_exists(path):
             return {
                 "status": "error",
                 "message": f"File not found: {file_path}. Make sure the path is correct.",
@@ -398,62 +678,377 @@ def read_file_tool(file_path: str) -> dict:
                 "message": "Can only read markdown (.md) files for safety.",
             }
 
-        with open(path, "r") as f:
-            content = f.read()
-
         return {
             "status": "success",
             "path": str(path),
-            "content": content,
+            **_read_content(path, offset, limit, unit, heading),
         }
+    except (ValueError, LookupError) as e:
+        return {"status": "error", "message": str(e)}
     except Exception as e:
         return {"status": "error", "message": f"Failed to read file: {str(e)}"}
 
 
-def fetch_webpage_tool(url: str) -> dict:
+# Artifacts returned by get_blog_context_tool (in this order)
+CONTEXT_ARTIFACTS = ("status", "draft", "outline", "analysis", "organized", "sections")
+
+# Default per-artifact cap for get_blog_context_tool, in characters
+CONTEXT_MAX_CHARS = 20000
+
+
+def _capped_text(text: str, max_chars: int) -> dict:
+    """
+    Return text as a context artifact, cut at a line boundary if over max_chars.
+
+    Truncated artifacts report "shown_lines" so the rest can be read with a
+    read tool (offset=shown_lines).
+    """
+    artifact = {"available": True, **text_size(text), "truncated": False}
+    if max_chars <= 0 or len(text) <= max_chars:
+        artifact["content"] = text
+        return artifact
+
+    cut = text.rfind("\n", 0, max_chars) + 1 or max_chars
+    artifact["content"] = text[:cut]
+    artifact["truncated"] = True
+    artifact["shown_lines"] = text.count("\n", 0, cut)
+    return artifact
+
+
+def get_blog_context_tool(
+    blog_id: str = None,
+    artifacts: list[str] = None,
+    max_chars: int = CONTEXT_MAX_CHARS,
+) -> dict:
+    """
+    Load everything about a blog in one call: status, draft, outline, analysis
+    header, organized draft and section list.
+
+    Use this at the start of a step instead of calling get_workflow_status_tool,
+    read_draft_tool, read_analysis_tool and read_file_tool one after another.
+
+    Args:
+        blog_id: Unique identifier for the blog (default: the most recently modified blog)
+        artifacts: Optional subset of "status", "draft", "outline", "analysis",
+            "organized", "sections" (default: all)
+        max_chars: Maximum characters per text artifact (default 20000, 0 = no cap).
+            Longer artifacts are cut at a line boundary and marked "truncated";
+            read the rest with read_draft_tool/read_file_tool(offset=shown_lines)
+
+    Returns:
+        Success: {
+            "status": "success",
+            "blog_id": "...",
+            "artifacts": {
+                "status": {"current_step": 2, "next_action": "...", ...},
+                "draft": {"available": True, "content": "...", "total_lines": 120, "truncated": False, ...},
+                "outline": {...},
+                "analysis": {"available": True, "data": {...}, "chunk_count": 12},
+                "organized": {...},
+                "sections": {"available": True, "source": "2-draft_organized.md", "sections": [{"title": "...", "chars": 1200}]}
+            },
+            "missing": ["organized", ...]
+        }
+        Error: {"status": "error", "message": "..."}
+    """
+    try:
+        requested = list(artifacts) if artifacts else list(CONTEXT_ARTIFACTS)
+        unknown = [a for a in requested if a not in CONTEXT_ARTIFACTS]
+        if unknown:
+            return {
+                "status": "error",
+                "message": f"Unknown artifacts: {', '.join(unknown)}. Use any of: {', '.join(CONTEXT_ARTIFACTS)}"
+            }
+
+        inferred = blog_id is None
+        if inferred:
+            guess = infer_blog_id_tool()
+            if guess["status"] != "success":
+                return guess
+            blog_id = guess["blog_id"]
+
+        directory = _blog_dir(blog_id)
+        if not _path_exists(directory):
+            return {"status": "error", "message": f"Blog '{blog_id}' not found in posts/."}
+
+        paths = {
+            "draft": directory / draft_filename,
+            "outline": directory / "1-outline.md",
+            "analysis": directory / "0-analysis.md",
+            "organized": directory / ORGANIZED_FILENAME,
+        }
+        result = {}
+        missing = []
+
+        for name in CONTEXT_ARTIFACTS:
+            if name not in requested:
+                continue
+
+            if name == "status":
+                entry = get_workflow_index(POSTS_DIR).refresh().get(blog_id)
+                if entry is None:
+                    missing.append(name)
+                else:
+                    result[name] = format_entry(blog_id, entry)
+                continue
+
+            if name == "sections":
+                # Sections of the organized draft, or of the outline before Step 2
+                source = next(
+                    (key for key in ("organized", "outline") if _path_exists(paths[key])), None
+                )
+                if source is None:
+                    missing.append(name)
+                    continue
+                if source == "organized":
+                    sections = _organized_document(directory).parsed("sections", _parse_sections)
+                else:
+                    sections = get_document_cache().get(paths[source]).parsed("sections", _parse_sections)
+                result[name] = {
+                    "available": True,
+                    "source": paths[source].name,
+                    "sections": [
+                        {
+                            "title": h["title"],
+                            "chars": len(sections["chunks"][i + sections["chunk_offset"]]),
+                        }
+                        for i, h in enumerate(sections["headings"])
+                    ],
+                }
+                continue
+
+            if not _path_exists(paths[name]):
+                missing.append(name)
+                continue
+
+            if name == "analysis":
+                # Header only: the full summary is available from read_analysis_tool
+                try:
+                    analysis = get_document_cache().get(paths[name]).parsed("analysis", _parse_analysis)
+                except ValueError as e:
+                    result[name] = {"available": False, "error": str(e)}
+                    continue
+                result[name] = {
+                    "available": True,
+                    "data": dict(analysis["data"]),
+                    "chunk_count": len(analysis["chunks"]),
+                }
+            elif name == "organized":
+                result[name] = _capped_text(_organized_document(directory).text, max_chars)
+            else:
+                result[name] = _capped_text(_read_text(paths[name]), max_chars)
+
+        response = {
+            "status": "success",
+            "blog_id": blog_id,
+            "artifacts": result,
+            "missing": missing,
+        }
+        if inferred:
+            response["inferred"] = True
+        return response
+    except Exception as e:
+        return {"status": "error", "message": f"Failed to load blog context: {str(e)}"}
+
+
+FETCH_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+FETCH_TIMEOUT = 10  # Seconds
+FETCH_MAX_CHARS = 50000  # Limit on the text returned per page
+
+
+FETCH_MODES = ("text", "article")
+
+
+def fetch_webpage_tool(url: str, mode: str = None) -> dict:
     """
     Fetches the text content from a URL.
 
     Use this to read previous blog posts or other reference material from the web.
+    Pages are cached on disk: repeated fetches of the same URL are answered
+    from the cache (revalidated with the server when the copy is stale).
+
+    Use mode="article" to get only the main content of the page (navigation,
+    sidebars, footers and banners removed), with its title and headings;
+    this is usually a fraction of the size of the full text.
 
     Args:
         url: The URL to fetch (must start with http:// or https://)
+        mode: "text" (default, all visible text) or "article" (main content only)
 
     Returns:
-        Success: {"status": "success", "content": "...", "url": "..."}
+        Success: {"status": "success", "content": "...", "url": "...", "cached": bool}
+            ("article" mode adds "title" and "headings": [{"title", "level"}])
         Error: {"status": "error", "message": "..."}
     """
+    return _fetch_page(url, _urlopen, mode)
+
+
+def _urlopen(url: str, headers: dict):
+    req = urllib.request.Request(url, headers=headers)
+    return urllib.request.urlopen(req, timeout=FETCH_TIMEOUT)
+
+
+def _page_result(url: str, entry: dict, cached: bool) -> dict:
+    result = {"status": "success", "url": url, "content": entry["content"], "cached": cached}
+    if entry.get("variant") == "article":
+        result["title"] = entry.get("title", "")
+        result["headings"] = entry.get("headings", [])
+    return result
+
+
+def _fetch_page(url: str, open_url, mode: str = None) -> dict:
+    """
+    Fetch one page through the HTTP cache.
+
+    Args:
+        url: The URL to fetch
+        open_url: Function (url, headers) -> response context manager, raising
+            HTTPError for error statuses (urlopen-like)
+        mode: Extraction mode (see FETCH_MODES)
+    """
     if not url.startswith(("http://", "https://")):
         return {"status": "error", "message": "URL must start with http:// or https://"}
+    mode = mode or "text"
+    if mode not in FETCH_MODES:
+        return {"status": "error", "message": f"Invalid mode '{mode}'. Use one of: {', '.join(FETCH_MODES)}"}
+    variant = None if mode == "text" else mode
+
+    cache = HttpCache(HTTP_CACHE_DIR)
+    entry = cache.get(url, variant)
+    if entry is not None and cache.is_fresh(entry):
+        return _page_result(url, entry, cached=True)
 
     try:
         # Set a user agent to avoid 403s from some sites
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        req = urllib.request.Request(url, headers=headers)
+        headers = {"User-Agent": FETCH_USER_AGENT}
+        if entry is not None:
+            headers.update(cache.conditional_headers(entry))
+
+        with open_url(url, headers) as response:
+            if mode == "article":
+                article = stream_article(response, FETCH_MAX_CHARS)
+                page = {
+                    "variant": variant,
+                    "content": article["text"],
+                    "title": article["title"],
+                    "headings": article["headings"],
+                }
+                cache.store(
+                    url, page["content"], response.headers, variant,
+                    title=page["title"], headings=page["headings"],
+                )
+            else:
+                # Extract text while downloading; stop once the size limit is reached
+                page = {"content": stream_text(response, FETCH_MAX_CHARS)["text"]}
+                cache.store(url, page["content"], response.headers)
+            return _page_result(url, page, cached=False)
+    except HTTPError as e:
+        if e.code == 304 and entry is not None:
+            # Not Modified: our copy is still current
+            entry = cache.renew(url, entry, e.headers)
+            return _page_result(url, entry, cached=True)
+        if e.code >= 500 and entry is not None:
+            return _stale_page(url, entry, e)
+        return {"status": "error", "message": f"Failed to fetch URL: {str(e)}"}
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        if entry is not None:
+            return _stale_page(url, entry, e)
+        return {"status": "error", "message": f"Failed to fetch URL: {str(e)}"}
 
-        with urllib.request.urlopen(req, timeout=10) as response:
-            # Read and decode
-            html_content = response.read().decode("utf-8", errors="ignore")
 
-            # Basic HTML cleanup (remove scripts, styles, tags)
-            # 1. Remove script and style elements
-            clean_text = re.sub(
-                r"<(script|style)[^>]*>.*?</\1>", "", html_content, flags=re.DOTALL
-            )
-            # 2. Remove HTML tags
-            clean_text = re.sub(r"<[^>]+>", " ", clean_text)
-            # 3. Collapse whitespace
-            clean_text = re.sub(r"\s+", " ", clean_text).strip()
+def _stale_page(url: str, entry: dict, error: Exception) -> dict:
+    """Serve an outdated cached copy when the server can't be reached."""
+    fetched = datetime.fromtimestamp(entry["fetched_at"]).strftime("%Y-%m-%d %H:%M")
+    return {
+        **_page_result(url, entry, cached=True),
+        "stale": True,
+        "warning": f"Could not refresh the page ({error}); showing the copy fetched on {fetched}.",
+    }
+
+
+FETCH_BATCH_MAX_URLS = 20
+FETCH_BATCH_WORKERS = 8
+FETCH_BATCH_DEADLINE = 30  # Seconds
 
+
+def fetch_webpages_tool(urls: list[str], deadline: int = None, mode: str = None) -> dict:
+    """
+    Fetches the text content of several URLs concurrently.
+
+    Prefer this over repeated fetch_webpage calls when researching several
+    references. Connections are reused per site and at most a few requests
+    run against the same site at once. Whatever has not finished when the
+    deadline passes is reported as timed out; the other pages are still
+    returned.
+
+    Args:
+        urls: URLs to fetch (http:// or https://, at most 20)
+        deadline: Overall time limit in seconds (default: 30)
+        mode: "text" (default) or "article" (main content only), as in fetch_webpage
+
+    Returns:
+        Success: {
+            "status": "success",
+            "results": [{"url": "...", "status": "success", "content": "...", "cached": bool}
+                        or {"url": "...", "status": "error", "message": "..."}, ...],
+            "fetched": int, "failed": int,
+            "timed_out": ["url", ...],
+            "elapsed": float
+        }
+        Error: {"status": "error", "message": "..."}
+    """
+    try:
+        urls = list(dict.fromkeys(urls or []))  # Drop duplicates, keep order
+        if not urls:
+            return {"status": "error", "message": "No URLs given"}
+        if len(urls) > FETCH_BATCH_MAX_URLS:
             return {
-                "status": "success",
-                "url": url,
-                "content": clean_text[:50000],  # Limit size
+                "status": "error",
+                "message": f"Too many URLs ({len(urls)}); fetch at most {FETCH_BATCH_MAX_URLS} at a time",
             }
+
+        seconds = deadline if deadline and deadline > 0 else FETCH_BATCH_DEADLINE
+        started = time.monotonic()
+        stop_at = started + seconds
+        pool = get_connection_pool()
+
+        def open_url(url: str, headers: dict):
+            return pool.open(url, headers, timeout=FETCH_TIMEOUT, deadline=stop_at)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(urls), FETCH_BATCH_WORKERS),
+            thread_name_prefix="blogger-fetch",
+        )
+        futures = {executor.submit(_fetch_page, url, open_url, mode): url for url in urls}
+        wait(futures, timeout=seconds)
+        # Don't wait for stragglers: they give up on their own at the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        results, timed_out = [], []
+        for future, url in futures.items():
+            error = future.exception() if future.done() and not future.cancelled() else None
+            if not future.done() or future.cancelled() or isinstance(error, DeadlineExceeded):
+                timed_out.append(url)
+                results.append({"url": url, "status": "error", "message": f"Not finished within {seconds}s"})
+            elif error is not None:
+                # e.g. the page cache directory can't be read
+                results.append({"url": url, "status": "error", "message": f"Failed to fetch URL: {error}"})
+            else:
+                results.append({"url": url, **future.result()})
+
+        fetched = sum(1 for r in results if r["status"] == "success")
+        return {
+            "status": "success",
+            "results": results,
+            "fetched": fetched,
+            "failed": len(results) - fetched,
+            "timed_out": timed_out,
+            "elapsed": round(time.monotonic() - started, 2),
+        }
     except Exception as e:
-        return {"status": "error", "message": f"Failed to fetch URL: {str(e)}"}
+        return {"status": "error", "message": f"Failed to fetch URLs: {str(e)}"}
 
 
 # ============================================================================
@@ -470,9 +1065,15 @@ def fetch_webpage_tool(url: str) -> dict:
 # ============================================================================
 
 def validate_content_split_tool(
-    original_content: str,
-    split_part1: str,
-    split_part2: str
+    original_content: str = None,
+    split_part1: str = None,
+    split_part2: str = None,
+    blog_id: str = None,
+    original_step: str = None,
+    part1_step: str = None,
+    part2_step: str = None,
+    diagnose: bool = False,
+    tolerance: float = None,
 ) -> dict:
     """
     Validate that content was split correctly without loss or addition.
@@ -480,45 +1081,104 @@ def validate_content_split_tool(
     Use this tool to verify that content filtering preserved all original content
     and didn't add hallucinated text. This is a pure validation function.
 
+    Texts that are already saved don't need to be sent: pass blog_id and
+    leave them out. Missing texts are read from the blog's saved steps
+    (original: "draft", part 1: "draft_ok", part 2: "draft_not_ok"), or
+    from the steps named in original_step/part1_step/part2_step.
+
     Args:
         original_content: The original full content
         split_part1: First part of the split (e.g., draft_ok)
         split_part2: Second part of the split (e.g., draft_not_ok)
+        blog_id: Blog to read omitted texts from
+        original_step: Saved step to use as the original (default "draft")
+        part1_step: Saved step to use as part 1 (default "draft_ok")
+        part2_step: Saved step to use as part 2 (default "draft_not_ok")
+        diagnose: On failure, also return "diagnostics" listing every lost,
+            added and duplicated line with its line numbers (see Returns)
+        tolerance: Tolerant mode: a lost and an added paragraph at least this
+            similar (0-1, e.g. 0.8) are accepted as one edited paragraph
 
     Returns:
         Success: {
             "status": "success",
             "valid": True,
-            "message": "Content split is valid"
+            "message": "Content split is valid",
+            "content_refs": {"split_part1": "...", ...},
+            "edited": "..."  # Tolerant mode only, when paragraphs were edited
         }
         Error: {
             "status": "error",
             "valid": False,
             "message": "Specific error (lost content, added content, duplicates)"
         }
+
+        content_refs holds a reference for each text passed inline; give it
+        to save_step_tool(content_ref=...) to save that text without resending it.
+
+        With diagnose=True, a failed check adds:
+        "diagnostics": {
+            "lost": [{"line", "text", "part1_after_line", "part2_after_line"}],
+            "added": [{"part", "line", "text", "after_original_line"}],
+            "duplicated": [{"text", "original_line", "part1_line", "part2_line"}],
+            "counts": {...}
+        }
+        (line numbers are 1-based in the respective texts; "*_after_line" is
+        where a lost line belongs, 0 = at the start)
     """
-    is_valid, error_msg = check_content_integrity(
-        original_content, split_part1, split_part2
+    try:
+        texts, refs = _resolve_texts(blog_id, {
+            "original_content": (original_content, original_step, "draft"),
+            "split_part1": (split_part1, part1_step, "draft_ok"),
+            "split_part2": (split_part2, part2_step, "draft_not_ok"),
+        })
+    except (ValueError, OSError) as e:
+        return {"status": "error", "valid": False, "message": str(e)}
+    original_content = texts["original_content"]
+    split_part1 = texts["split_part1"]
+    split_part2 = texts["split_part2"]
+
+    # Retries often re-check identical texts: reuse the verdict
+    is_valid, error_msg = cached_verdict(
+        f"content_split:{tolerance}" if tolerance else "content_split",
+        (original_content, split_part1, split_part2),
+        lambda: check_content_integrity(
+            original_content, split_part1, split_part2, tolerance=tolerance
+        ),
     )
 
     if is_valid:
-        return {
+        result = {
             "status": "success",
             "valid": True,
-            "message": "Content split is valid - all content preserved, no additions or duplicates"
+            "message": "Content split is valid - all content preserved, no additions or duplicates",
+            "content_refs": refs,
         }
+        if error_msg:
+            result["edited"] = error_msg
+        return result
     else:
-        return {
+        result = {
             "status": "error",
             "valid": False,
-            "message": error_msg
+            "message": error_msg,
+            "content_refs": refs,
         }
+        if diagnose:
+            result["diagnostics"] = diagnose_content_split(original_content, split_part1, split_part2)
+        return result
 
 
 def validate_organization_tool(
-    draft_ok: str,
-    outline: str,
-    organized_content: str
+    draft_ok: str = None,
+    outline: str = None,
+    organized_content: str = None,
+    blog_id: str = None,
+    draft_ok_step: str = None,
+    outline_step: str = None,
+    organized_step: str = None,
+    diagnose: bool = False,
+    tolerance: float = None,
 ) -> dict:
     """
     Validate that organized content matches outline structure and preserves content.
@@ -526,13 +1186,30 @@ def validate_organization_tool(
     Runs multiple validation checks:
     1. Content integrity: All draft_ok content exists in organized (no loss)
     2. Heading order: Section headings match outline order
+    3. Outline structure: The outline has 3+ sections, an introduction and
+       a conclusion (reported as warnings, it doesn't invalidate the organization)
+
+    The outline and organized content are parsed once and shared by all checks.
 
     Use this tool after reorganizing content to verify correctness before saving.
 
+    Texts that are already saved don't need to be sent: pass blog_id and
+    only the organized content. Missing texts are read from the blog's saved
+    steps (draft_ok: "draft_ok", outline: "1-outline", organized:
+    "2-draft_organized"), or from the steps named in the *_step arguments.
+
     Args:
         draft_ok: The original in-scope content
         outline: The approved outline structure
         organized_content: The reorganized content to validate
+        blog_id: Blog to read omitted texts from
+        draft_ok_step: Saved step to use as draft_ok (default "draft_ok")
+        outline_step: Saved step to use as the outline (default "1-outline")
+        organized_step: Saved step to use as the organized content (default "2-draft_organized")
+        diagnose: On failure, also return "diagnostics" listing every lost and
+            added line and missing heading with its line numbers (see Returns)
+        tolerance: Tolerant mode: a lost and an added paragraph at least this
+            similar (0-1, e.g. 0.8) are accepted as one edited paragraph
 
     Returns:
         Success: {
@@ -540,53 +1217,195 @@ def validate_organization_tool(
             "valid": True,
             "checks": {
                 "integrity": True,
-                "heading_order": True
+                "heading_order": True,
+                "outline_structure": True
             },
-            "message": "Organization is valid"
+            "message": "Organization is valid",
+            "timings_ms": {"parse": ..., "integrity": ..., "heading_order": ..., "outline_structure": ...}
         }
         Error: {
             "status": "error",
             "valid": False,
             "checks": {
                 "integrity": True/False,
-                "heading_order": True/False
+                "heading_order": True/False,
+                "outline_structure": True/False
             },
             "errors": [...list of specific errors...]
         }
+
+        When the outline structure check fails, both add "warnings" (its reasons).
+        timings_ms are those of the run that computed the (cached) verdict.
+
+        In tolerant mode, a success with edited paragraphs adds "edited"
+        (their count and examples).
+
+        Both also return "content_refs" for the texts passed inline; give
+        content_refs["organized_content"] to save_step_tool(content_ref=...)
+        to save the validated organization without resending it.
+
+        With diagnose=True, a failed check adds:
+        "diagnostics": {
+            "lost": [{"line", "text", "reorganized_after_line"}],
+            "added": [{"line", "text", "after_draft_line"}],
+            "missing_headings": [{"outline_line", "text"}],
+            "moved": int, "counts": {...}
+        }
+        (line numbers are 1-based in the respective texts)
     """
+    try:
+        texts, refs = _resolve_texts(blog_id, {
+            "draft_ok": (draft_ok, draft_ok_step, "draft_ok"),
+            "outline": (outline, outline_step, "1-outline"),
+            "organized_content": (organized_content, organized_step, ORGANIZED_FILENAME),
+        })
+    except (ValueError, OSError) as e:
+        return {"status": "error", "valid": False, "message": str(e)}
+    draft_ok = texts["draft_ok"]
+    outline = texts["outline"]
+    organized_content = texts["organized_content"]
+
     errors = []
     checks = {}
 
-    # Check 1: Content integrity
-    integrity_valid, integrity_msg = check_reorganization_integrity(
-        draft_ok, outline, organized_content
+    # Retries often re-check identical texts: reuse the verdicts
+    report = cached_verdict(
+        f"organization:{tolerance}" if tolerance else "organization",
+        (draft_ok, outline, organized_content),
+        lambda: check_organization(draft_ok, outline, organized_content, tolerance=tolerance),
     )
+    integrity_valid, integrity_msg = report["integrity"]
+    heading_valid, heading_msg = report["heading_order"]
+    outline_valid, outline_reasons = report["outline_structure"]
+
+    # Check 1: Content integrity
     checks["integrity"] = integrity_valid
     if not integrity_valid:
         errors.append(f"Integrity: {integrity_msg}")
 
     # Check 2: Heading order
-    heading_valid, heading_msg = check_heading_order(outline, organized_content)
     checks["heading_order"] = heading_valid
     if not heading_valid:
         errors.append(f"Heading order: {heading_msg}")
 
+    # Check 3: Outline structure (informational)
+    checks["outline_structure"] = outline_valid
+
     # Return result
     if integrity_valid and heading_valid:
-        return {
+        result = {
             "status": "success",
             "valid": True,
             "checks": checks,
-            "message": "Organization is valid - content preserved and headings match outline"
+            "message": "Organization is valid - content preserved and headings match outline",
+            "content_refs": refs,
+            "timings_ms": dict(report["timings_ms"]),
         }
+        if integrity_msg:
+            result["edited"] = integrity_msg
     else:
-        return {
+        result = {
             "status": "error",
             "valid": False,
             "checks": checks,
             "errors": errors,
-            "message": f"Organization validation failed: {'; '.join(errors)}"
+            "message": f"Organization validation failed: {'; '.join(errors)}",
+            "content_refs": refs,
+            "timings_ms": dict(report["timings_ms"]),
         }
+        if diagnose and not integrity_valid:
+            result["diagnostics"] = diagnose_reorganization(draft_ok, outline, organized_content)
+    if not outline_valid:
+        result["warnings"] = [f"Outline structure: {reason}" for reason in outline_reasons]
+    return result
+
+
+def validate_candidates_tool(
+    candidates: list,
+    kind: str = "split",
+    original_content: str = None,
+    draft_ok: str = None,
+    outline: str = None,
+    blog_id: str = None,
+) -> dict:
+    """
+    Validate several candidate splits or organizations at once and rank them.
+
+    Use this tool when you have more than one candidate: one call checks
+    them all against the same original and tells you which is best.
+
+    Args:
+        candidates: For kind "split": [{"split_part1": "...", "split_part2": "..."}, ...];
+            for kind "organization": [{"organized_content": "..."}, ...]
+            (at most BATCH_MAX_CANDIDATES)
+        kind: "split" or "organization"
+        original_content: Original draft for splits (default: the "draft" step of blog_id)
+        draft_ok: In-scope content for organizations (default: the "draft_ok" step)
+        outline: Outline for organizations (default: the "1-outline" step)
+        blog_id: Blog to read omitted texts from
+
+    Returns:
+        {
+            "status": "success",
+            "ranking": [{"candidate": index, "valid": bool, "message": "...",
+                         "lost": int, "added": int,
+                         "duplicated": int (split) | "heading_order": bool (organization)}, ...],
+            "best": index of the best valid candidate, or None,
+            "valid_count": int,
+            "content_refs": references of the best valid candidate's texts,
+                to pass to save_step_tool(content_ref=...)
+        }
+        Ranking is best first: valid candidates, then fewest lost/added/duplicated lines.
+    """
+    try:
+        if not candidates:
+            return {"status": "error", "message": "No candidates given"}
+        if len(candidates) > BATCH_MAX_CANDIDATES:
+            return {
+                "status": "error",
+                "message": f"Too many candidates ({len(candidates)}); at most {BATCH_MAX_CANDIDATES} per call",
+            }
+
+        if kind == "split":
+            fields = ("split_part1", "split_part2")
+            texts, _ = _resolve_texts(blog_id, {"original_content": (original_content, None, "draft")})
+            references = [texts["original_content"]]
+        elif kind == "organization":
+            fields = ("organized_content",)
+            texts, _ = _resolve_texts(blog_id, {
+                "draft_ok": (draft_ok, None, "draft_ok"),
+                "outline": (outline, None, "1-outline"),
+            })
+            references = [texts["draft_ok"], texts["outline"]]
+        else:
+            return {"status": "error", "message": f"Unknown kind '{kind}': use 'split' or 'organization'"}
+
+        values = []
+        for index, candidate in enumerate(candidates):
+            missing = [field for field in fields if not isinstance(candidate.get(field), str)]
+            if missing:
+                return {"status": "error", "message": f"Candidate {index} is missing {', '.join(missing)}"}
+            values.append(tuple(candidate[field] for field in fields))
+
+        ranking = validate_candidates(
+            kind, references, values if kind == "split" else [v[0] for v in values]
+        )
+        valid = [r for r in ranking if r["valid"]]
+        best = valid[0]["candidate"] if valid else None
+        return {
+            "status": "success",
+            "ranking": ranking,
+            "best": best,
+            "valid_count": len(valid),
+            "content_refs": (
+                {field: stage_text(candidates[best][field]) for field in fields}
+                if best is not None else {}
+            ),
+        }
+    except (ValueError, OSError) as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        return {"status": "error", "message": f"Failed to validate candidates: {str(e)}"}
 
 
 # ============================================================================
@@ -616,17 +1435,16 @@ def read_section_tool(blog_id: str, section_heading: str) -> dict:
         Error: {"status": "error", "message": "..."}
     """
     try:
-        organized_path = POSTS_DIR / blog_id / "2-draft_organized.md"
-        if not organized_path.exists():
+        organized_path = _blog_dir(blog_id) / ORGANIZED_FILENAME
+        if not _path_exists(organized_path):
             return {
                 "status": "error",
                 "message": f"Organized draft not found for blog '{blog_id}'. Run Curator (Step 2) first."
             }
 
-        with open(organized_path, "r") as f:
-            content = f.read()
+        sections = _organized_document(organized_path.parent).parsed("sections", _parse_sections)
 
-        headings = extract_headings(content, level=2)
+        headings = sections["headings"]
         if not headings:
             return {
                 "status": "error",
@@ -642,16 +1460,9 @@ def read_section_tool(blog_id: str, section_heading: str) -> dict:
                 "message": f"Section '{section_heading}' not found. Available sections: {', '.join(available)}"
             }
 
-        # Split content by headings
-        positions = [h['line_num'] for h in headings]
-        chunks = split_text_by_headings(content, positions)
-
         # Map heading index to chunk index
-        has_pre_content = positions[0] > 0
-        chunk_offset = 1 if has_pre_content else 0
         match_idx = headings.index(match)
-        
-        section_content = chunks[match_idx + chunk_offset]
+        section_content = sections["chunks"][match_idx + sections["chunk_offset"]]
         
         # Get context (prev/next titles)
         prev_section = headings[match_idx - 1]['title'] if match_idx > 0 else None
@@ -668,31 +1479,52 @@ def read_section_tool(blog_id: str, section_heading: str) -> dict:
         return {"status": "error", "message": f"Failed to read section: {str(e)}"}
 
 
-def save_section_tool(blog_id: str, section_heading: str, polished_content: str) -> dict:
+def save_section_tool(
+    blog_id: str, section_heading: str, polished_content: str, allow_changes: bool = False
+) -> dict:
     """
     Replace a section's content with its polished version in 2-draft_organized.md.
 
+    The new version is appended to the blog's section journal rather than
+    rewriting the whole draft (see section_journal.py); reads see it at once.
+
+    Before saving, the section's code blocks and quotes are compared with
+    the current version (check_section_preservation): a dropped or modified
+    code block or quote rejects the save unless allow_changes is True.
+
+    When the blog has an outline, the saved section is then re-checked
+    against it (see section_check.py): only this section is re-validated,
+    the other sections' verdicts are tracked from earlier saves.
+
     Args:
         blog_id: Unique identifier for the blog
         section_heading: The original heading of the section to replace
         polished_content: The new, polished content for the section (must include heading)
+        allow_changes: Save even if code blocks or quotes were changed (they are flagged)
 
     Returns:
-        Success: {"status": "success", "blog_id": "...", "path": "...", "message": "..."}
-        Error: {"status": "error", "message": "..."}
+        Success: {
+            "status": "success", "blog_id": "...", "path": "...", "message": "...",
+            "preservation": {"ok": bool, "code_blocks": {...}, "quotes": {...}},
+            "revalidation": {"valid": bool, "section": n, "changed": bool, "problems": [...]}
+        }
+        Error: {"status": "error", "message": "...", "preservation": {...}}
+        ("revalidation" is left out when the blog has no 1-outline.md; when
+        2-draft_organized.md was replaced since earlier saves, "discarded_sections":
+        [{"section": n, "heading": "..."}] and a "warning" list the edits it lost)
     """
     try:
-        organized_path = POSTS_DIR / blog_id / "2-draft_organized.md"
-        if not organized_path.exists():
+        organized_path = _blog_dir(blog_id) / ORGANIZED_FILENAME
+        if not _path_exists(organized_path):
             return {
                 "status": "error",
                 "message": f"Organized draft not found for blog '{blog_id}'."
             }
 
-        with open(organized_path, "r") as f:
-            content = f.read()
+        document = _organized_document(organized_path.parent)
+        sections = document.parsed("sections", _parse_sections)
 
-        headings = extract_headings(content, level=2)
+        headings = sections["headings"]
         match = find_best_heading_match(section_heading, headings)
         if not match:
             return {"status": "error", "message": f"Section '{section_heading}' not found."}
@@ -717,29 +1549,50 @@ def save_section_tool(blog_id: str, section_heading: str, polished_content: str)
                 "message": f"Heading in polished content ('{new_headings[0]['title']}') does not match target section ('{match['title']}')."
             }
 
-        # Reconstruct the document
-        positions = [h['line_num'] for h in headings]
-        chunks = split_text_by_headings(content, positions)
-
-        has_pre_content = positions[0] > 0
-        chunk_offset = 1 if has_pre_content else 0
-        match_idx = headings.index(match)
-
-        # Replace the specific chunk
-        chunks[match_idx + chunk_offset] = polished_content.strip()
+        # Code blocks and quotes must survive polishing (checked locally, in milliseconds)
+        index = headings.index(match)
+        original_section = sections["chunks"][index + sections["chunk_offset"]]
+        preservation = check_section_preservation(original_section, polished_content)
+        if not preservation["ok"] and not allow_changes:
+            changed = len(preservation["code_blocks"]["changed"])
+            missing = len(preservation["quotes"]["missing"])
+            return {
+                "status": "error",
+                "message": (
+                    f"Polished section changed {changed} code blocks and lost {missing} quotes "
+                    "(see preservation). Restore them, or pass allow_changes=True if the change is intended."
+                ),
+                "preservation": preservation,
+            }
 
-        # Join chunks back together
-        new_content = '\n'.join(chunks)
+        # Journal the replacement of this section
+        updated = save_section(organized_path.parent, index, match['title'], polished_content)
 
-        with open(organized_path, "w") as f:
-            f.write(new_content)
+        _blog_changed(blog_id)
+        _record_version(blog_id, SECTION_REF_PREFIX + match['title'], polished_content.strip())
 
-        return {
+        result = {
             "status": "success",
             "blog_id": blog_id,
             "path": str(organized_path),
-            "message": f"Section '{match['title']}' updated successfully."
+            "message": f"Section '{match['title']}' updated successfully.",
+            "preservation": preservation,
+            **_discarded_sections(pop_discarded(organized_path.parent)),
         }
+
+        # Re-check only the saved section against the outline
+        outline_path = organized_path.parent / "1-outline.md"
+        if _path_exists(outline_path):
+            result["revalidation"] = revalidate_section(
+                organized_path.parent,
+                _read_text(outline_path),
+                document.text,
+                sections["chunks"][sections["chunk_offset"]:],
+                index,
+                polished_content.strip(),
+                updated,
+            )
+        return result
     except Exception as e:
         return {"status": "error", "message": f"Failed to save section: {str(e)}"}
 
@@ -756,18 +1609,21 @@ def finalize_post_tool(blog_id: str) -> dict:
         Error: {"status": "error", "message": "..."}
     """
     try:
-        source_path = POSTS_DIR / blog_id / "2-draft_organized.md"
-        dest_path = POSTS_DIR / blog_id / "3-final.md"
+        source_path = _blog_dir(blog_id) / ORGANIZED_FILENAME
+        dest_path = _blog_dir(blog_id) / "3-final.md"
 
-        if not source_path.exists():
+        if not _path_exists(source_path):
             return {
                 "status": "error",
                 "message": f"Organized draft not found: {source_path}. Complete Step 2 first."
             }
 
+        # Fold the journaled sections into the organized draft for good
+        compact(source_path.parent)
+        discarded = pop_discarded(source_path.parent)
+
         # Read content to add metadata
-        with open(source_path, "r") as f:
-            content = f.read()
+        content = read_organized(source_path.parent)
 
         # Add metadata footer
         footer = f"\n\n---\n*Generated by AI Blog Partner on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
@@ -775,14 +1631,110 @@ def finalize_post_tool(blog_id: str) -> dict:
         with open(dest_path, "w") as f:
             f.write(content + footer)
 
+        _blog_changed(blog_id)
+
         return {
             "status": "success",
             "final_path": str(dest_path),
-            "message": f"Final post created successfully at {dest_path}"
+            "message": f"Final post created successfully at {dest_path}",
+            **_discarded_sections(discarded),
         }
     except Exception as e:
         return {"status": "error", "message": f"Failed to finalize post: {str(e)}"}
+
+
 # ============================================================================
+# Version History Tools
+# ============================================================================
+#
+# Every save_step_tool / save_section_tool call keeps the saved content as a
+# version in the content-addressed store (see blob_store.py): step versions
+# are named after the step ("1-outline"), section versions "section:<heading>".
+
+def list_versions_tool(blog_id: str, name: str = None) -> dict:
+    """
+    List the saved versions of a blog's steps and sections.
+
+    Args:
+        blog_id: Unique identifier for the blog
+        name: Optional ref name to list only one step or section
+            (e.g., "1-outline", "section:Introduction")
+
+    Returns:
+        Success: {
+            "status": "success",
+            "blog_id": "...",
+            "versions": {"1-outline": [{"version": 1, "size": 1234, "saved_at": "2025-01-15 14:30", "digest": "..."}]}
+        }
+        Error: {"status": "error", "message": "..."}
+    """
+    try:
+        refs = get_blob_store(POSTS_DIR).versions(blog_id)
+        if name is not None:
+            if name not in refs:
+                available = ", ".join(sorted(refs)) or "none"
+                return {
+                    "status": "error",
+                    "message": f"No versions of '{name}' for blog '{blog_id}'. Available: {available}"
+                }
+            refs = {name: refs[name]}
+
+        versions = {
+            ref: [
+                {
+                    "version": number,
+                    "size": v["size"],
+                    "saved_at": datetime.fromtimestamp(v["saved_at"]).strftime("%Y-%m-%d %H:%M"),
+                    "digest": v["digest"][:12],
+                }
+                for number, v in enumerate(history, start=1)
+            ]
+            for ref, history in sorted(refs.items())
+        }
+        return {"status": "success", "blog_id": blog_id, "versions": versions}
+    except Exception as e:
+        return {"status": "error", "message": f"Failed to list versions: {str(e)}"}
+
+
+def read_version_tool(blog_id: str, name: str, version: int = None) -> dict:
+    """
+    Read a saved version of a step or section.
+
+    Args:
+        blog_id: Unique identifier for the blog
+        name: Ref name (e.g., "1-outline", "section:Introduction")
+        version: Version number from list_versions_tool; negative counts back
+            from the latest (-2 = the one before); default: latest
+
+    Returns:
+        Success: {"status": "success", "blog_id": "...", "name": "...", "version": 2, "versions": 3, "content": "..."}
+        Error: {"status": "error", "message": "..."}
+    """
+    try:
+        store = get_blob_store(POSTS_DIR)
+        refs = store.versions(blog_id)
+        if name not in refs:
+            available = ", ".join(sorted(refs)) or "none"
+            return {
+                "status": "error",
+                "message": f"No versions of '{name}' for blog '{blog_id}'. Available: {available}"
+            }
+
+        content, info = store.read(blog_id, name, version)
+        return {
+            "status": "success",
+            "blog_id": blog_id,
+            "name": name,
+            "version": info["version"],
+            "versions": len(refs[name]),
+            "content": content,
+        }
+    except IndexError as e:
+        return {"status": "error", "message": str(e)}
+    except Exception as e:
+        return {"status": "error", "message": f"Failed to read version: {str(e)}"}
+
+
 # ============================================================================
 # Phase 4 Tools: Content Analysis (Light Mode)
 # ============================================================================
@@ -998,6 +1950,83 @@ def count_code_blocks(draft_text: str) -> dict:
     }
 
 
+def _code_block_hashes(text: str) -> list[tuple[str, str, str]]:
+    """
+    (content hash, first code line, language) of each fenced code block
+    (trailing spaces ignored).
+    """
+    doc = ParsedMarkdown(text)
+    blocks = []
+    for start, end in doc.code_fences:
+        code = doc.lines[start + 1:end]
+        first = next((line.strip() for line in code if line.strip()), "")
+        info = doc.normalized[start][3:].split()
+        blocks.append(
+            (content_hash("\n".join(line.rstrip() for line in code)), first, info[0] if info else "")
+        )
+    return blocks
+
+
+def _normalize_quote(text: str) -> str:
+    return " ".join(re.sub(r'[\*_"“”]', '', text).lower().split())
+
+
+def check_section_preservation(original: str, polished: str) -> dict:
+    """
+    Check that polishing kept the section's code blocks and quotes.
+
+    Pure function (NO LLM): fenced code blocks are compared by hash of
+    their content (as a multiset: a duplicated block must stay duplicated),
+    quotes (extract_quotes_with_sources) by normalized text.
+    A quote counts as kept if the polished section still contains its text,
+    quoted or not.
+
+    Args:
+        original: The section before polishing
+        polished: The polished section
+
+    Returns:
+        dict: {
+            "ok": bool,  # No code block or quote was dropped or modified
+            "code_blocks": {"original": n, "polished": n, "languages": [...],
+                            "changed": ["first line of each missing block", ...],
+                            "added": n},
+            "quotes": {"original": n, "missing": ["quote text", ...]}
+        }
+    """
+    original_blocks = _code_block_hashes(original)
+    polished_blocks = _code_block_hashes(polished)
+    unmatched = Counter(key for key, _, _ in polished_blocks)
+    changed = []
+    for key, first, _ in original_blocks:
+        if unmatched[key]:
+            unmatched[key] -= 1
+        else:
+            changed.append(first)
+    added = sum(unmatched.values())
+
+    quotes = extract_quotes_with_sources(original)
+    polished_text = _normalize_quote(polished)
+    missing_quotes = [
+        quote["text"] for quote in quotes if _normalize_quote(quote["text"]) not in polished_text
+    ]
+
+    return {
+        "ok": not changed and not missing_quotes,
+        "code_blocks": {
+            "original": len(original_blocks),
+            "polished": len(polished_blocks),
+            "languages": sorted({language for _, _, language in polished_blocks if language}),
+            "changed": changed,
+            "added": added,
+        },
+        "quotes": {
+            "original": len(quotes),
+            "missing": missing_quotes,
+        },
+    }
+
+
 def extract_main_topics(draft_text: str) -> list[str]:
     """
     Extract potential main topics using keyword frequency.
@@ -1157,12 +2186,14 @@ narrative_flows:"""
         
         full_content = yaml_content + md_content
         
-        output_path = POSTS_DIR / blog_id / "0-analysis.md"
+        output_path = _blog_dir(blog_id) / "0-analysis.md"
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(output_path, "w") as f:
             f.write(full_content)
-            
+
+        _blog_changed(blog_id)
+
         return {
             "status": "success",
             "blog_id": blog_id,
@@ -1172,6 +2203,74 @@ narrative_flows:"""
         return {"status": "error", "message": f"Failed to save analysis: {str(e)}"}
 
 
+def _parse_analysis(content: str) -> dict:
+    """
+    Parse 0-analysis.md: YAML-ish front-matter, summary body and (deep mode) chunks.
+
+    Returns:
+        {"data": {...}, "summary": "...", "chunks": [...]}
+
+    Raises:
+        ValueError: If the front-matter is missing or incomplete
+    """
+    if not content.startswith("---"):
+        raise ValueError("Invalid analysis file format (missing front-matter).")
+        
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        raise ValueError("Invalid analysis file format (incomplete front-matter).")
+        
+    yaml_text = parts[1]
+    body_text = parts[2].strip()
+    
+    # Improved YAML-ish parser
+    data = {}
+    current_key = None
+    for line in yaml_text.strip().split("\n"):
+        line = line.rstrip()
+        if not line: continue
+        
+        if line.startswith("  - "): # List item
+            if current_key and current_key in data and isinstance(data[current_key], list):
+                data[current_key].append(line[4:].strip())
+            continue
+            
+        if ":" in line:
+            key, val = line.split(":", 1)
+            key = key.strip()
+            val = val.strip()
+            
+            if not val: # Start of a list
+                data[key] = []
+                current_key = key
+            else:
+                data[key] = val
+                current_key = key
+    
+    # Extract chunks from the Markdown body if mode is deep
+    chunks = []
+    if data.get('mode') == 'deep':
+        # Look for "## Content Chunks" section
+        if "## Content Chunks" in body_text:
+            chunk_section = body_text.split("## Content Chunks")[1]
+            # Regex to find Chunk #ID [Type] (Score: X/10)
+            # and the following blockquote
+            chunk_matches = re.finditer(
+                r"\*\*Chunk #(\d+)\*\*(?:\s+\[(\w+)\])?\s+\(Score:\s+([\d\.]+)/10\)\n>\s+(.*?)(?=\n\n\*\*Chunk|## Suggested|$)", 
+                chunk_section, 
+                re.DOTALL
+            )
+            for m in chunk_matches:
+                chunks.append({
+                    "id": m.group(1),
+                    "type": m.group(2) or "unknown",
+                    "score": m.group(3),
+                    "text_preview": m.group(4).strip()
+                })
+
+    return {"data": data, "summary": body_text, "chunks": chunks}
+
+
 def read_analysis_tool(blog_id: str) -> dict:
     """
     Read 0-analysis.md and parse its YAML front-matter.
@@ -1186,74 +2285,19 @@ def read_analysis_tool(blog_id: str) -> dict:
         Error: {"status": "error", "message": "..."}
     """
     try:
-        analysis_path = POSTS_DIR / blog_id / "0-analysis.md"
-        if not analysis_path.exists():
+        analysis_path = _blog_dir(blog_id) / "0-analysis.md"
+        if not _path_exists(analysis_path):
             return {"status": "error", "message": f"Analysis file not found for blog '{blog_id}'."}
             
-        with open(analysis_path, "r") as f:
-            content = f.read()
-            
-        if not content.startswith("---"):
-            return {"status": "error", "message": "Invalid analysis file format (missing front-matter)."}
-            
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {"status": "error", "message": "Invalid analysis file format (incomplete front-matter)."}
-            
-        yaml_text = parts[1]
-        body_text = parts[2].strip()
-        
-        # Improved YAML-ish parser
-        data = {}
-        current_key = None
-        for line in yaml_text.strip().split("\n"):
-            line = line.rstrip()
-            if not line: continue
-            
-            if line.startswith("  - "): # List item
-                if current_key and current_key in data and isinstance(data[current_key], list):
-                    data[current_key].append(line[4:].strip())
-                continue
-                
-            if ":" in line:
-                key, val = line.split(":", 1)
-                key = key.strip()
-                val = val.strip()
-                
-                if not val: # Start of a list
-                    data[key] = []
-                    current_key = key
-                else:
-                    data[key] = val
-                    current_key = key
-        
-        # Extract chunks from the Markdown body if mode is deep
-        chunks = []
-        if data.get('mode') == 'deep':
-            # Look for "## Content Chunks" section
-            if "## Content Chunks" in body_text:
-                chunk_section = body_text.split("## Content Chunks")[1]
-                # Regex to find Chunk #ID [Type] (Score: X/10)
-                # and the following blockquote
-                chunk_matches = re.finditer(
-                    r"\*\*Chunk #(\d+)\*\*(?:\s+\[(\w+)\])?\s+\(Score:\s+([\d\.]+)/10\)\n>\s+(.*?)(?=\n\n\*\*Chunk|## Suggested|$)", 
-                    chunk_section, 
-                    re.DOTALL
-                )
-                for m in chunk_matches:
-                    chunks.append({
-                        "id": m.group(1),
-                        "type": m.group(2) or "unknown",
-                        "score": m.group(3),
-                        "text_preview": m.group(4).strip()
-                    })
-
+        analysis = get_document_cache().get(analysis_path).parsed("analysis", _parse_analysis)
         return {
             "status": "success",
-            "data": data,
-            "summary": body_text,
-            "chunks": chunks
+            "data": dict(analysis["data"]),  # Copies: the parsed form is shared
+            "summary": analysis["summary"],
+            "chunks": list(analysis["chunks"])
         }
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
     except Exception as e:
         return {"status": "error", "message": f"Failed to read analysis: {str(e)}"}
 
@@ -0,0 +1,194 @@
+"""
+Content-hash caches for the validation checks.
+
+The Curator validates, fixes and re-validates its split/organization
+several times per session, passing mostly identical multi-kilobyte strings
+each time. Two caches make the repeats cheap:
+
+- line sets: the normalized line set of a document, keyed by the hash of
+  its text. When only the split changed, the original draft is not
+  re-normalized.
+- verdicts: the result of a whole check, keyed by the check name plus the
+  hashes of all its inputs. A check repeated with the same texts returns
+  immediately.
+
+Keys are BLAKE2b digests of the UTF-8 text, so equal texts share entries
+whichever tool or agent passed them. Cached values are shared and must not
+be modified (line sets are frozensets, verdicts tuples).
+
+Texts validated by the tools are also staged under a short content
+reference, so the model can save a document it just validated by passing
+the reference instead of echoing the whole text again (stage_text /
+staged_text).
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Upper bound for the text represented by cached line sets
+LINE_SETS_MAX_BYTES = 32 * 1024 * 1024
+
+# Number of verdicts kept
+VERDICTS_MAX_ENTRIES = 1024
+
+# Upper bound for the staged texts, and length of their references
+STAGED_MAX_BYTES = 16 * 1024 * 1024
+CONTENT_REF_LENGTH = 16
+
+
+def content_hash(text: str) -> str:
+    """Hex BLAKE2b-128 digest of a text (the cache key of a document)."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class HashCache:
+    """Thread-safe LRU bounded by the summed weight of its values."""
+
+    def __init__(self, max_weight: int):
+        self.max_weight = max_weight
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, weight)
+        self._weight = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, compute, weight: int = 1):
+        """
+        Return the cached value for key, computing (and caching) it if needed.
+
+        Args:
+            key: Cache key
+            compute: Function producing the value
+            weight: Cost of the value against max_weight
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = compute()
+        if weight > self.max_weight:
+            return value
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, weight)
+                self._weight += weight
+                while self._weight > self.max_weight:
+                    _, (_, old_weight) = self._entries.popitem(last=False)
+                    self._weight -= old_weight
+        return value
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "weight": self._weight,
+            }
+
+
+_line_sets = HashCache(LINE_SETS_MAX_BYTES)
+_verdicts = HashCache(VERDICTS_MAX_ENTRIES)
+_staged = HashCache(STAGED_MAX_BYTES)
+
+
+def cached_by_content(kind: str, text: str, compute):
+    """
+    A derived form of a document (line set, fingerprints...), cached by content hash.
+
+    Args:
+        kind: Name of the derived form (part of the key)
+        text: Document text
+        compute: Function text -> (immutable) derived value
+
+    Returns:
+        compute(text), from the cache if this text was seen before
+    """
+    key = (kind, content_hash(text))
+    return _line_sets.get_or_compute(key, lambda: compute(text), weight=len(text))
+
+
+def normalized_lines(text: str, normalize) -> frozenset:
+    """
+    Normalized line set of a document, cached by content hash.
+
+    Args:
+        text: Document text
+        normalize: Function text -> set of normalized lines
+
+    Returns:
+        frozenset of normalized lines
+    """
+    kind = getattr(normalize, "__qualname__", repr(normalize))
+    return cached_by_content(kind, text, lambda t: frozenset(normalize(t)))
+
+
+def cached_verdict(check: str, texts: tuple, compute):
+    """
+    Result of a validation check, cached by the hashes of its inputs.
+
+    Args:
+        check: Name of the check (part of the key)
+        texts: The check's text inputs
+        compute: Function producing the (immutable) result
+
+    Returns:
+        The result of compute(), from the cache if these inputs were seen before
+    """
+    key = (check,) + tuple(content_hash(text or "") for text in texts)
+    return _verdicts.get_or_compute(key, compute)
+
+
+def stage_text(text: str) -> str:
+    """
+    Keep a text in memory under a short content reference.
+
+    Returns:
+        The reference (a prefix of the text's content hash)
+    """
+    ref = content_hash(text)[:CONTENT_REF_LENGTH]
+    _staged.get_or_compute(ref, lambda: text, weight=len(text))
+    return ref
+
+
+def staged_text(ref: str) -> str | None:
+    """Text staged under a reference, or None if unknown or evicted."""
+    return _staged.get(ref)
+
+
+def cache_stats() -> dict:
+    """Hit/miss counters of the caches (for monitoring)."""
+    return {
+        "line_sets": _line_sets.stats(),
+        "verdicts": _verdicts.stats(),
+        "staged": _staged.stats(),
+    }
+
+
+def clear_caches() -> None:
+    """Drop every cached line set, verdict and staged text."""
+    _line_sets.clear()
+    _verdicts.clear()
+    _staged.clear()
@@ -0,0 +1,439 @@
+"""
+Optional live model of the posts/ directory for long-running processes.
+
+In `adk web` the coordinator and every sub-agent keep asking for the same
+workflow state and the same step files. A watcher turns that into in-memory
+lookups:
+
+- InotifyWatcher (Linux): kernel change notifications, no polling.
+- PollingWatcher (everywhere else): a background thread comparing directory
+  listings every few seconds.
+
+Both record which blogs changed. The WorkflowIndex then rescans only those
+blogs instead of stat-ing every blog directory, and read_text() serves file
+contents from memory until the watcher sees the file's blog change.
+
+Enable with start_posts_watcher(POSTS_DIR), or set BLOGGER_WATCH_POSTS=1
+(e.g., in blogger/.env) to start it when the app is loaded.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from blogger.utils.layout import get_layout
+from blogger.utils.workflow_index import get_workflow_index
+
+# Upper bound for file contents kept in memory by read_text()
+CONTENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Seconds between two scans of the polling fallback
+DEFAULT_POLL_INTERVAL = 2.0
+
+# inotify constants (from <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+POSTS_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+BLOG_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE
+    | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class PostsWatcher:
+    """
+    Base class: bookkeeping shared by the inotify and polling watchers.
+
+    Subclasses run a daemon thread that calls _mark(blog_id) for every
+    change (or _mark(None) when they lost track and everything may differ).
+    """
+
+    def __init__(self, posts_dir: Path):
+        self.posts_dir = Path(posts_dir)
+        # Resolved once: restart the watcher after resharding posts/
+        self.layout = get_layout(self.posts_dir)
+        self._dirty: set[str] | None = None  # None = full revalidation needed
+        self._contents = OrderedDict()  # path -> (blog_id, text), LRU order
+        self._contents_bytes = 0
+        self._blog_paths: dict[str, set[Path]] = {}  # blog_id -> cached paths
+        self._generations: dict[str, int] = {}  # blog_id -> change counter
+        self._global_generation = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "PostsWatcher":
+        self._thread = threading.Thread(
+            target=self._run, name=f"{type(self).__name__}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        raise NotImplementedError
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _mark(self, blog_id: str | None) -> None:
+        """Record a change to one blog (or to everything if blog_id is None)."""
+        with self._lock:
+            if blog_id is None:
+                self._dirty = None
+                self._contents.clear()
+                self._contents_bytes = 0
+                self._blog_paths.clear()
+                self._global_generation += 1
+                return
+
+            if self._dirty is not None:
+                self._dirty.add(blog_id)
+            self._generations[blog_id] = self._generations.get(blog_id, 0) + 1
+            for path in self._blog_paths.pop(blog_id, ()):
+                _, text = self._contents.pop(path)
+                self._contents_bytes -= len(text)
+
+    def _generation(self, blog_id: str) -> tuple[int, int]:
+        return (self._generations.get(blog_id, 0), self._global_generation)
+
+    def notify_changed(self, blog_id: str) -> None:
+        """
+        Invalidate a blog right away after this process wrote to it.
+
+        Kernel events (and polling even more so) arrive asynchronously, so
+        the save tools call this to make their own writes visible at once.
+        """
+        self._mark(blog_id)
+
+    def drain(self) -> set[str] | None:
+        """
+        Return the blogs changed since the last call, and reset.
+
+        Returns:
+            Set of blog_ids, or None if every blog must be revalidated
+        """
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+            return dirty
+
+    # ------------------------------------------------------------------
+    # In-memory reads
+    # ------------------------------------------------------------------
+
+    def _blog_id_for(self, path: Path) -> str | None:
+        """Blog owning a posts/[<shard>/]<blog_id>/<file> path, or None."""
+        try:
+            relative = path.relative_to(self.posts_dir)
+        except ValueError:
+            return None
+        depth = self.layout.depth
+        if len(relative.parts) != depth + 2 or relative.parts[0].startswith("."):
+            return None
+        return relative.parts[depth]
+
+    def read_text(self, path: Path) -> str:
+        """
+        Read a file, served from memory while its blog is unchanged.
+
+        Args:
+            path: File path (files outside posts/<blog_id>/ are read directly)
+
+        Returns:
+            File content
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = Path(path)
+        blog_id = self._blog_id_for(path) if self.is_alive() else None
+        if blog_id is None:
+            with open(path, "r") as f:
+                return f.read()
+
+        with self._lock:
+            cached = self._contents.get(path)
+            if cached is not None:
+                self._contents.move_to_end(path)
+                return cached[1]
+            generation = self._generation(blog_id)
+
+        with open(path, "r") as f:
+            text = f.read()
+
+        with self._lock:
+            # Only cache if no change to this blog was seen while reading
+            if (self._generation(blog_id) == generation
+                    and path not in self._contents
+                    and len(text) <= CONTENT_CACHE_MAX_BYTES):
+                self._contents[path] = (blog_id, text)
+                self._contents_bytes += len(text)
+                self._blog_paths.setdefault(blog_id, set()).add(path)
+                while self._contents_bytes > CONTENT_CACHE_MAX_BYTES:
+                    old_path, (old_blog_id, old_text) = self._contents.popitem(last=False)
+                    self._contents_bytes -= len(old_text)
+                    self._blog_paths[old_blog_id].discard(old_path)
+        return text
+
+    def exists(self, path: Path) -> bool:
+        """Path.exists(), answered from memory when the content is cached."""
+        with self._lock:
+            if Path(path) in self._contents:
+                return True
+        return Path(path).exists()
+
+
+class PollingWatcher(PostsWatcher):
+    """Portable fallback: rescan directory listings every `interval` seconds."""
+
+    def __init__(self, posts_dir: Path, interval: float = DEFAULT_POLL_INTERVAL):
+        super().__init__(posts_dir)
+        self.interval = interval
+        self._snapshot: dict[str, tuple] = {}
+
+    def _signature(self, blog_path: str) -> tuple:
+        """(dir mtime, files with mtime and size) for one blog directory."""
+        files = []
+        with os.scandir(blog_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    st = entry.stat()
+                    files.append((entry.name, st.st_mtime_ns, st.st_size))
+        return (os.stat(blog_path).st_mtime_ns, tuple(sorted(files)))
+
+    def _scan(self) -> dict[str, tuple]:
+        snapshot = {}
+        for blog_id in self.layout.list_blog_ids(self.posts_dir):
+            path = os.path.join(self.posts_dir, self.layout.relpath(blog_id))
+            try:
+                snapshot[blog_id] = self._signature(path)
+            except FileNotFoundError:
+                continue
+        return snapshot
+
+    def start(self) -> "PostsWatcher":
+        # Baseline taken synchronously so changes right after start() are seen
+        self._snapshot = self._scan()
+        return super().start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                snapshot = self._scan()
+            except OSError:
+                self._mark(None)
+                continue
+            for blog_id in set(snapshot) | set(self._snapshot):
+                if snapshot.get(blog_id) != self._snapshot.get(blog_id):
+                    self._mark(blog_id)
+            self._snapshot = snapshot
+
+
+class InotifyWatcher(PostsWatcher):
+    """Linux watcher built on inotify (via ctypes, no extra dependency)."""
+
+    def __init__(self, posts_dir: Path):
+        super().__init__(posts_dir)
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        # watch descriptor -> ("container", relpath, level) for posts/ and
+        # shard directories, or ("blog", blog_id) for blog directories
+        self._wds: dict[int, tuple] = {}
+
+    def _add_watch(self, path: Path, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {path}: {os.strerror(errno)}")
+        return wd
+
+    def _watch_container(self, relpath: str, level: int) -> None:
+        """Watch posts/ (level 0) or a shard directory, then its children."""
+        path = os.path.join(self.posts_dir, relpath)
+        try:
+            wd = self._add_watch(path, POSTS_MASK)
+            self._wds[wd] = ("container", relpath, level)
+            with os.scandir(path) as entries:
+                names = [e.name for e in entries if e.is_dir() and not e.name.startswith(".")]
+        except FileNotFoundError:
+            return
+        for name in names:
+            self._watch_child(relpath, level, name)
+
+    def _watch_child(self, relpath: str, level: int, name: str) -> None:
+        """Watch a directory found in a container: a shard or a blog."""
+        child = os.path.join(relpath, name)
+        if level < self.layout.depth:
+            if self.layout.is_shard_name(name):
+                self._watch_container(child, level + 1)
+            return
+
+        try:
+            wd = self._add_watch(os.path.join(self.posts_dir, child), BLOG_MASK)
+        except FileNotFoundError:
+            return
+        self._wds[wd] = ("blog", name)
+        # Files created before the watch existed would otherwise be missed
+        self._mark(name)
+
+    def start(self) -> "PostsWatcher":
+        # Watches are registered synchronously so no change after start() is lost
+        self._watch_container("", 0)
+        return super().start()
+
+    def stop(self) -> None:
+        super().stop()
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+    def _handle(self, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            self._mark(None)
+            return
+        if mask & IN_IGNORED:
+            self._wds.pop(wd, None)
+            return
+        if wd not in self._wds:
+            return
+
+        watched = self._wds[wd]
+        if watched[0] == "blog":
+            self._mark(watched[1])
+            return
+
+        # Event in posts/ or a shard directory: a child appeared or went away
+        _, relpath, level = watched
+        if not name or name.startswith("."):
+            return
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            self._watch_child(relpath, level, name)
+        if level == self.layout.depth:
+            self._mark(name)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                readable, _, _ = select.select([self._fd], [], [], 0.5)
+                if not readable:
+                    continue
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError:
+                # fd closed or broken: let the index fall back to stat checks
+                self._mark(None)
+                return
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+                start = offset + _EVENT_HEADER.size
+                name = os.fsdecode(buf[start:start + length].rstrip(b"\0"))
+                offset = start + length
+                self._handle(wd, mask, name)
+
+
+_watchers: dict[Path, PostsWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def start_posts_watcher(
+    posts_dir: Path,
+    backend: str = "auto",
+    interval: float = DEFAULT_POLL_INTERVAL,
+) -> PostsWatcher:
+    """
+    Start (or return the running) watcher for a posts directory.
+
+    The watcher is attached to the shared WorkflowIndex, so status and infer
+    queries only rescan blogs it reported as changed.
+
+    Args:
+        posts_dir: Path to the posts/ directory
+        backend: "auto" (inotify on Linux, polling otherwise), "inotify" or "polling"
+        interval: Seconds between scans for the polling backend
+
+    Returns:
+        The running PostsWatcher
+    """
+    index = get_workflow_index(posts_dir)
+    key = index.posts_dir
+
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is not None and watcher.is_alive():
+            return watcher
+
+        watcher = None
+        if backend in ("auto", "inotify") and sys.platform.startswith("linux"):
+            try:
+                watcher = InotifyWatcher(key).start()
+            except (OSError, AttributeError):
+                # No inotify (or watch limit reached): fall back to polling
+                if backend == "inotify":
+                    raise
+        if watcher is None:
+            watcher = PollingWatcher(key, interval=interval).start()
+
+        _watchers[key] = watcher
+        index.attach_watcher(watcher)
+        return watcher
+
+
+def stop_posts_watcher(posts_dir: Path) -> None:
+    """Stop the watcher for a posts directory (no-op if none is running)."""
+    index = get_workflow_index(posts_dir)
+    with _watchers_lock:
+        watcher = _watchers.pop(index.posts_dir, None)
+    if watcher is not None:
+        index.attach_watcher(None)
+        watcher.stop()
+
+
+def get_posts_watcher(posts_dir: Path) -> PostsWatcher | None:
+    """Return the running watcher for a posts directory, if any."""
+    if not _watchers:
+        return None
+    watcher = _watchers.get(Path(posts_dir).resolve())
+    if watcher is not None and watcher.is_alive():
+        return watcher
+    return None
@@ -0,0 +1,459 @@
+"""
+Persistent workflow index for the posts/ directory.
+
+Caches the per-blog step state (which step files exist, their mtimes and the
+recommended next action) in posts/.blogger/workflow_index.json so status
+queries don't have to stat every file of every blog.
+
+Revalidation is cheap:
+- The posts/ directory mtime (plus shard directory mtimes with a sharded
+  layout, see layout.py) tells us whether blogs were added or removed.
+- Each blog directory mtime tells us whether step files were created,
+  deleted or replaced (atomic saves from editors rename over the file).
+- The save tools call `update_blog()` right after writing, which covers
+  in-place rewrites that don't touch the directory mtime.
+
+So a status query costs one stat per blog and only re-reads the blogs that
+actually changed.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from blogger.utils.layout import blog_dir, container_relpaths, get_layout_state, list_blog_ids
+from blogger.utils.section_journal import JOURNAL_FILENAME
+
+INDEX_DIRNAME = ".blogger"
+INDEX_FILENAME = "workflow_index.json"
+INDEX_VERSION = 2
+
+# Step files tracked per blog (key -> filename)
+STEP_FILES = {
+    "draft": "draft.md",
+    "outline": "1-outline.md",
+    "organized": "2-draft_organized.md",
+    "final": "3-final.md",
+    "analysis": "0-analysis.md",
+}
+
+# Files that count towards "last_modified" (the analysis is a side artifact)
+TIMESTAMP_KEYS = ("draft", "outline", "organized", "final")
+
+# Directory mtimes this close to the scan time are not trusted: on filesystems
+# with coarse timestamps (NFS, FAT) a second change in the same tick would
+# otherwise go unnoticed. Such entries are simply rescanned on the next query.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def scan_blog(blog_dir: Path) -> dict:
+    """
+    Build the index entry for one blog directory.
+
+    Args:
+        blog_dir: Path to posts/<blog_id>/
+
+    Returns:
+        Entry dict with keys: current_step, completed_steps, next_action,
+        last_modified, files, mtimes, dir_mtime_ns, scanned_ns
+
+    Raises:
+        FileNotFoundError: If the blog directory no longer exists
+    """
+    # Stat the directory BEFORE the files so a concurrent change is never
+    # recorded with a newer directory mtime than the state we observed.
+    dir_mtime_ns = blog_dir.stat().st_mtime_ns
+    scanned_ns = time.time_ns()
+
+    mtimes = {}
+    for key, filename in STEP_FILES.items():
+        try:
+            mtimes[key] = (blog_dir / filename).stat().st_mtime
+        except FileNotFoundError:
+            continue
+
+    # Sections saved by the Writer are journaled next to the organized draft
+    if "organized" in mtimes:
+        try:
+            journal_mtime = (blog_dir / JOURNAL_FILENAME).stat().st_mtime
+            mtimes["organized"] = max(mtimes["organized"], journal_mtime)
+        except FileNotFoundError:
+            pass
+
+    files = {key: key in mtimes for key in STEP_FILES}
+
+    # Determine current step based on completed files
+    if files["final"]:
+        current_step = 3
+        next_action = "Complete!"
+    elif files["organized"]:
+        current_step = 3
+        next_action = "Run Writer (Step 3)"
+    elif files["outline"]:
+        current_step = 2
+        next_action = "Run Curator (Step 2)"
+    elif files["draft"]:
+        current_step = 1
+        next_action = "Run Architect (Step 1)"
+    else:
+        current_step = 0
+        next_action = "Create draft.md"
+
+    completed_steps = []
+    if files["outline"]:
+        completed_steps.append(1)
+    if files["organized"]:
+        completed_steps.append(2)
+    if files["final"]:
+        completed_steps.append(3)
+
+    timestamps = [mtimes[key] for key in TIMESTAMP_KEYS if key in mtimes]
+
+    return {
+        "current_step": current_step,
+        "completed_steps": completed_steps,
+        "next_action": next_action,
+        "last_modified": max(timestamps) if timestamps else 0,
+        "files": files,
+        "mtimes": mtimes,
+        "dir_mtime_ns": dir_mtime_ns,
+        "scanned_ns": scanned_ns,
+    }
+
+
+# Values accepted by the "status" filter of get_workflow_status_tool
+WORKFLOW_STATES = ("not_started", "in_progress", "complete")
+
+
+def workflow_state(entry: dict) -> str:
+    """
+    Classify an entry as not_started, in_progress or complete.
+
+    - complete: 3-final.md exists
+    - in_progress: at least the outline (Step 1) is done
+    - not_started: only a draft (or nothing) so far
+
+    Args:
+        entry: Index entry (from scan_blog)
+
+    Returns:
+        One of WORKFLOW_STATES
+    """
+    if entry["files"]["final"]:
+        return "complete"
+    if entry["completed_steps"]:
+        return "in_progress"
+    return "not_started"
+
+
+def format_entry(blog_id: str, entry: dict) -> dict:
+    """
+    Convert an index entry into the dict returned by get_workflow_status_tool.
+
+    Args:
+        blog_id: Blog identifier
+        entry: Index entry (from scan_blog)
+
+    Returns:
+        Public blog status dict (internal revalidation fields removed)
+    """
+    last_modified = entry["last_modified"]
+    return {
+        "blog_id": blog_id,
+        "current_step": entry["current_step"],
+        "completed_steps": list(entry["completed_steps"]),
+        "next_action": entry["next_action"],
+        "last_modified": last_modified,
+        "last_modified_human":
+            datetime.fromtimestamp(last_modified).isoformat()
+            if last_modified else "never",
+        "files": dict(entry["files"]),
+    }
+
+
+def _same_state(a: dict, b: dict) -> bool:
+    """Compare two entries, ignoring the scan timestamp."""
+    return {k: v for k, v in a.items() if k != "scanned_ns"} == \
+        {k: v for k, v in b.items() if k != "scanned_ns"}
+
+
+def _is_racy(mtime_ns: int, scanned_ns: int) -> bool:
+    return mtime_ns >= scanned_ns - RACY_WINDOW_NS
+
+
+class WorkflowIndex:
+    """
+    Persisted per-blog workflow state for one posts/ directory.
+
+    Use get_workflow_index() instead of instantiating directly so every tool
+    in the process shares the same in-memory copy.
+    """
+
+    def __init__(self, posts_dir: Path):
+        self.posts_dir = Path(posts_dir)
+        self.path = self.posts_dir / INDEX_DIRNAME / INDEX_FILENAME
+        self.blogs: dict[str, dict] = {}
+        self._layout_key = None  # Layout the entries were built with
+        self._containers: dict[str, int] = {}  # container relpath -> mtime_ns
+        self._containers_scanned_ns = 0
+        self._stamp = None  # (mtime_ns, size) of the index file we last loaded/wrote
+        self._listeners = []
+        self._watcher = None
+        self._lock = threading.RLock()
+
+    def attach_watcher(self, watcher) -> None:
+        """
+        Use a PostsWatcher (see watcher.py) as the source of changes.
+
+        While the watcher runs, refresh() rescans only the blogs it reported
+        instead of stat-ing every blog directory.
+        """
+        with self._lock:
+            self._watcher = watcher
+
+    def subscribe(self, callback) -> None:
+        """
+        Register a callback notified whenever entries change.
+
+        The callback receives a set of changed blog_ids, or None when the
+        whole index was reloaded and any entry may have changed.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, blog_ids: set[str] | None) -> None:
+        if blog_ids is not None and not blog_ids:
+            return
+        for callback in self._listeners:
+            callback(blog_ids)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _file_stamp(self):
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _reload_if_changed(self) -> None:
+        """Reload the on-disk index if another process rewrote it."""
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return
+
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Corrupt or half-written index: rebuild from the file system
+            data = {}
+
+        if data.get("version") != INDEX_VERSION:
+            data = {}
+
+        self.blogs = data.get("blogs", {})
+        self._layout_key = data.get("layout")
+        self._containers = data.get("containers", {})
+        self._containers_scanned_ns = data.get("containers_scanned_ns", 0)
+        self._stamp = stamp
+        self._notify(None)
+
+    def _save(self) -> None:
+        """Atomically write the index (temp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "layout": self._layout_key,
+            "containers": self._containers,
+            "containers_scanned_ns": self._containers_scanned_ns,
+            "blogs": self.blogs,
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._stamp = self._file_stamp()
+
+    # ------------------------------------------------------------------
+    # Queries and updates
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> dict[str, dict]:
+        """
+        Revalidate the index against the file system and return all entries.
+
+        Returns:
+            Dict mapping blog_id -> entry (see scan_blog). Treat as read-only.
+
+        Raises:
+            FileNotFoundError: If the posts directory does not exist
+        """
+        with self._lock:
+            watcher = self._live_watcher()
+            dirty = watcher.drain() if watcher is not None else None
+
+            changed_ids = set()
+            if dirty is None:
+                self._reload_if_changed()
+                changed = self._revalidate_all(changed_ids)
+            else:
+                # The watcher saw every change: its dirty set is exhaustive
+                changed = False
+                for blog_id in dirty:
+                    self._rescan(blog_id, changed_ids)
+
+            if changed or changed_ids:
+                self._save()
+                self._notify(changed_ids)
+
+            return self.blogs
+
+    def _live_watcher(self):
+        if self._watcher is not None and self._watcher.is_alive():
+            return self._watcher
+        return None
+
+    def _rescan(self, blog_id: str, changed_ids: set[str]) -> None:
+        """Rescan one blog, recording it in changed_ids if its state changed."""
+        try:
+            new_entry = scan_blog(blog_dir(self.posts_dir, blog_id))
+        except (FileNotFoundError, NotADirectoryError):
+            if self.blogs.pop(blog_id, None) is not None:
+                changed_ids.add(blog_id)
+            return
+
+        entry = self.blogs.get(blog_id)
+        if entry is None or not _same_state(entry, new_entry):
+            changed_ids.add(blog_id)
+        self.blogs[blog_id] = new_entry
+
+    def _revalidate_all(self, changed_ids: set[str]) -> bool:
+        """
+        Directory-mtime revalidation of every blog (no watcher available).
+
+        Returns:
+            True if the posts/ directory state changed (even without blog changes)
+        """
+        changed = False
+        state = get_layout_state(self.posts_dir)
+
+        # 0. Entries built under another layout can't be revalidated
+        layout_key = [state.layout.to_dict(), state.previous and state.previous.to_dict()]
+        if layout_key != self._layout_key:
+            for blog_id in self.blogs:
+                changed_ids.add(blog_id)
+            self.blogs = {}
+            self._containers = {}
+            self._layout_key = layout_key
+            changed = True
+
+        # 1. Blogs added or removed? (posts/ and shard directory mtimes)
+        containers = {}
+        for relpath in container_relpaths(self.posts_dir):
+            try:
+                containers[relpath] = os.stat(os.path.join(self.posts_dir, relpath)).st_mtime_ns
+            except FileNotFoundError:
+                continue
+        if (containers != self._containers
+                or any(_is_racy(m, self._containers_scanned_ns) for m in containers.values())):
+            scanned_ns = time.time_ns()
+            blog_ids = list_blog_ids(self.posts_dir)
+            for blog_id in set(self.blogs) - blog_ids:
+                del self.blogs[blog_id]
+                changed_ids.add(blog_id)
+            for blog_id in blog_ids - set(self.blogs):
+                self._rescan(blog_id, changed_ids)
+            if containers != self._containers:
+                changed = True
+            self._containers = containers
+            self._containers_scanned_ns = scanned_ns
+
+        # 2. Blogs whose directory changed since they were scanned
+        # (plain os.stat on strings: this loop runs once per blog)
+        prefix = str(self.posts_dir) + os.sep
+        for blog_id, entry in list(self.blogs.items()):
+            if blog_id in changed_ids:
+                continue  # Just scanned above
+            if state.previous is None:
+                path = prefix + state.layout.relpath(blog_id)
+            else:
+                path = blog_dir(self.posts_dir, blog_id)
+            try:
+                dir_mtime_ns = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                del self.blogs[blog_id]
+                changed_ids.add(blog_id)
+                continue
+
+            if (dir_mtime_ns == entry["dir_mtime_ns"]
+                    and not _is_racy(dir_mtime_ns, entry["scanned_ns"])):
+                continue
+
+            self._rescan(blog_id, changed_ids)
+
+        return changed
+
+    def update_blog(self, blog_id: str) -> dict | None:
+        """
+        Rescan a single blog and persist the index.
+
+        Called by the save tools right after writing a step file, so in-place
+        rewrites (which don't change the directory mtime) are picked up.
+
+        Args:
+            blog_id: Blog identifier
+
+        Returns:
+            The new entry, or None if the blog directory no longer exists
+        """
+        with self._lock:
+            if self._live_watcher() is None:
+                self._reload_if_changed()
+            try:
+                entry = scan_blog(blog_dir(self.posts_dir, blog_id))
+            except FileNotFoundError:
+                entry = None
+
+            if entry is None:
+                self.blogs.pop(blog_id, None)
+            else:
+                self.blogs[blog_id] = entry
+            self._save()
+            self._notify({blog_id})
+            return entry
+
+
+_indexes: dict[Path, WorkflowIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_workflow_index(posts_dir: Path) -> WorkflowIndex:
+    """
+    Return the shared WorkflowIndex for a posts directory.
+
+    Args:
+        posts_dir: Path to the posts/ directory
+
+    Returns:
+        The process-wide WorkflowIndex instance for that directory
+    """
+    key = Path(posts_dir).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = WorkflowIndex(key)
+            _indexes[key] = index
+        return index